@@ -125,13 +125,7 @@ class AnnotationEngine(IAnnotationEngine):
         # 确保压力值在有效范围内
         pressure = max(0.0, min(1.0, pressure))
         
-        point = StrokePoint(
-            x=x,
-            y=y,
-            pressure=pressure,
-            timestamp=time.time()
-        )
-        self._active_strokes[stroke_id].points.append(point)
+        self._active_strokes[stroke_id].points.add(x, y, pressure, time.time())
 
     def end_stroke(self, stroke_id: str) -> Stroke:
         """
@@ -229,8 +223,8 @@ class AnnotationEngine(IAnnotationEngine):
         Returns:
             是否相交
         """
-        for point in stroke.points:
-            distance = math.sqrt((point.x - cx) ** 2 + (point.y - cy) ** 2)
+        for x, y in zip(stroke.points.xs, stroke.points.ys):
+            distance = math.sqrt((x - cx) ** 2 + (y - cy) ** 2)
             if distance <= radius:
                 return True
         return False
@@ -348,9 +342,9 @@ class AnnotationEngine(IAnnotationEngine):
             return None
         
         # 获取笔画的边界框
-        points = stroke.points
-        xs = [p.x for p in points]
-        ys = [p.y for p in points]
+        xs = stroke.points.xs
+        ys = stroke.points.ys
+        points = list(stroke.points)
         
         min_x, max_x = min(xs), max(xs)
         min_y, max_y = min(ys), max(ys)
@@ -571,7 +565,7 @@ class AnnotationEngine(IAnnotationEngine):
         # 生成圆形点
         num_points = 36
         new_points = []
-        avg_pressure = sum(p.pressure for p in original.points) / len(original.points)
+        avg_pressure = sum(original.points.pressures) / len(original.points)
         
         for i in range(num_points + 1):
             angle = 2 * math.pi * i / num_points
@@ -591,7 +585,7 @@ class AnnotationEngine(IAnnotationEngine):
                                   min_x: float, min_y: float,
                                   width: float, height: float) -> Stroke:
         """创建矩形笔画"""
-        avg_pressure = sum(p.pressure for p in original.points) / len(original.points)
+        avg_pressure = sum(original.points.pressures) / len(original.points)
         
         # 四个角点
         corners = [
@@ -622,7 +616,7 @@ class AnnotationEngine(IAnnotationEngine):
         if len(corners) != 3:
             return None
         
-        avg_pressure = sum(p.pressure for p in original.points) / len(original.points)
+        avg_pressure = sum(original.points.pressures) / len(original.points)
         
         # 三个角点加闭合点
         new_points = [
@@ -55,8 +55,11 @@ class AppConfig:
     """应用配置"""
     data_dir: Path = field(default_factory=lambda: Path.home() / ".huawei_pdf_reader")
     db_name: str = "app.db"
+    translation_cache_name: str = "translations.sqlite"
+    annotation_format: str = "json"  # 注释存储格式："json" 或 "binary"
     plugin_dir: str = "plugins"
     backup_dir: str = "backups"
+    thumbnail_dir: str = "thumbnails"
     temp_dir: Optional[Path] = None
     
     def __post_init__(self):
@@ -67,6 +70,10 @@ class AppConfig:
     def db_path(self) -> Path:
         return self.data_dir / self.db_name
     
+    @property
+    def translation_cache_path(self) -> Path:
+        return self.data_dir / self.translation_cache_name
+    
     @property
     def plugins_path(self) -> Path:
         return self.data_dir / self.plugin_dir
@@ -75,11 +82,16 @@ class AppConfig:
     def backups_path(self) -> Path:
         return self.data_dir / self.backup_dir
     
+    @property
+    def thumbnails_path(self) -> Path:
+        return self.data_dir / self.thumbnail_dir
+    
     def ensure_dirs(self) -> None:
         """确保所有必要目录存在"""
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.plugins_path.mkdir(parents=True, exist_ok=True)
         self.backups_path.mkdir(parents=True, exist_ok=True)
+        self.thumbnails_path.mkdir(parents=True, exist_ok=True)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
 
 
@@ -163,7 +175,7 @@ class Application:
     def _create_database(self, container: ServiceContainer):
         """创建数据库实例"""
         from huawei_pdf_reader.database import Database
-        return Database(self.config.db_path)
+        return Database(self.config.db_path, self.config.annotation_format)
     
     def _create_settings(self, container: ServiceContainer):
         """创建设置实例"""
@@ -197,7 +209,7 @@ class Application:
         """创建文件管理器"""
         from huawei_pdf_reader.file_manager import FileManager
         db = container.get('database')
-        return FileManager(db=db)
+        return FileManager(db=db, thumb_cache_dir=self.config.thumbnails_path)
     
     def _create_chinese_converter(self, container: ServiceContainer):
         """创建繁简转换器"""
@@ -227,13 +239,15 @@ class Application:
     def _create_magnifier(self, container: ServiceContainer):
         """创建放大镜"""
         from huawei_pdf_reader.magnifier import Magnifier
+        from huawei_pdf_reader.translation_cache import PersistentTranslationCache
         translation = container.get('translation_service')
         converter = container.get('chinese_converter')
         ocr = container.get('ocr_engine')
         return Magnifier(
             translation_service=translation,
             chinese_converter=converter,
-            ocr_engine=ocr
+            ocr_engine=ocr,
+            translation_cache=PersistentTranslationCache(self.config.translation_cache_path)
         )
     
     def _create_plugin_manager(self, container: ServiceContainer):
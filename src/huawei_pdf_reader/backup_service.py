@@ -450,7 +450,7 @@ class BackupService:
         
         # 导出注释（需要遍历所有文档）
         for doc in docs:
-            annotations = self._database.get_annotations(doc.id)
+            annotations = self._database.get_annotations_eager(doc.id)
             for ann in annotations:
                 ann_data = ann.to_dict()
                 ann_data["document_id"] = doc.id
@@ -5,7 +5,7 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 import unicodedata
 
 try:
@@ -24,6 +24,10 @@ class IChineseConverter(ABC):
         """转换文本"""
         pass
     
+    def convert_batch(self, texts: List[str], direction: ConversionDirection) -> List[str]:
+        """批量转换文本，结果与输入顺序一致（默认逐条转换）"""
+        return [self.convert(text, direction) for text in texts]
+    
     @abstractmethod
     def is_traditional(self, char: str) -> bool:
         """判断是否为繁体字"""
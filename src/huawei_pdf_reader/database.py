@@ -9,7 +9,7 @@ import sqlite3
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Generator, List, Optional
+from typing import Any, Generator, List, Optional
 import uuid
 
 from huawei_pdf_reader.models import (
@@ -20,9 +20,17 @@ from huawei_pdf_reader.models import (
     PluginInfo,
     Settings,
     Tag,
+    _intern,
+    _json_dumps,
+    _json_loads,
 )
 
 
+# 注释存储格式：JSON 文本，或 Annotation.to_binary 的二进制格式（存为 BLOB）
+ANNOTATION_FORMAT_JSON = "json"
+ANNOTATION_FORMAT_BINARY = "binary"
+ANNOTATION_FORMATS = (ANNOTATION_FORMAT_JSON, ANNOTATION_FORMAT_BINARY)
+
 # SQLite数据库Schema
 SCHEMA = """
 -- 文档表
@@ -37,6 +45,7 @@ CREATE TABLE IF NOT EXISTS documents (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     modified_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     is_deleted INTEGER DEFAULT 0,
+    fingerprint TEXT,
     FOREIGN KEY (folder_id) REFERENCES folders(id)
 );
 
@@ -113,17 +122,141 @@ CREATE INDEX IF NOT EXISTS idx_bookmarks_document ON bookmarks(document_id);
 """
 
 
+# ============== SQL语句 ==============
+
+# 文档
+_SQL_ADD_DOC = """
+INSERT INTO documents (id, path, title, file_type, size, folder_id,
+                       thumbnail, created_at, modified_at, is_deleted, fingerprint)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_GET_DOC = "SELECT * FROM documents WHERE id = ?"
+_SQL_GET_DOCS_IN_FOLDER = "SELECT * FROM documents WHERE folder_id = ? AND is_deleted = 0"
+_SQL_GET_DOCS_IN_FOLDER_ALL = "SELECT * FROM documents WHERE folder_id = ?"
+_SQL_GET_DOCS_IN_ROOT = "SELECT * FROM documents WHERE folder_id IS NULL AND is_deleted = 0"
+_SQL_GET_DOCS_IN_ROOT_ALL = "SELECT * FROM documents WHERE folder_id IS NULL"
+_SQL_GET_DELETED_DOCS = "SELECT * FROM documents WHERE is_deleted = 1"
+_SQL_SEARCH_DOCS = """
+SELECT * FROM documents
+WHERE (title LIKE ? OR path LIKE ?) AND is_deleted = 0
+"""
+_SQL_UPDATE_DOC = """
+UPDATE documents
+SET path = ?, title = ?, file_type = ?, size = ?, folder_id = ?,
+    thumbnail = ?, modified_at = ?, is_deleted = ?, fingerprint = ?
+WHERE id = ?
+"""
+_SQL_UPDATE_DOC_THUMBNAIL = "UPDATE documents SET thumbnail = ? WHERE id = ?"
+_SQL_SOFT_DELETE_DOC = "UPDATE documents SET is_deleted = 1, modified_at = ? WHERE id = ?"
+_SQL_DELETE_DOC_TAGS = "DELETE FROM document_tags WHERE document_id = ?"
+_SQL_DELETE_DOC_ANNOTATIONS = "DELETE FROM annotations WHERE document_id = ?"
+_SQL_DELETE_DOC_BOOKMARKS = "DELETE FROM bookmarks WHERE document_id = ?"
+_SQL_DELETE_DOC = "DELETE FROM documents WHERE id = ?"
+_SQL_GET_DOC_TAG_NAMES = """
+SELECT t.name FROM tags t
+JOIN document_tags dt ON t.id = dt.tag_id
+WHERE dt.document_id = ?
+"""
+
+_SQL_DOC_COLUMNS = "PRAGMA table_info(documents)"
+_SQL_ADD_DOC_FINGERPRINT_COLUMN = "ALTER TABLE documents ADD COLUMN fingerprint TEXT"
+
+# 文件夹
+_SQL_ADD_FOLDER = "INSERT INTO folders (id, name, parent_id, created_at) VALUES (?, ?, ?, ?)"
+_SQL_GET_FOLDER = "SELECT * FROM folders WHERE id = ?"
+_SQL_GET_CHILD_FOLDERS = "SELECT * FROM folders WHERE parent_id = ?"
+_SQL_GET_ROOT_FOLDERS = "SELECT * FROM folders WHERE parent_id IS NULL"
+_SQL_UNFILE_FOLDER_DOCS = "UPDATE documents SET folder_id = NULL WHERE folder_id = ?"
+_SQL_UNPARENT_FOLDERS = "UPDATE folders SET parent_id = NULL WHERE parent_id = ?"
+_SQL_DELETE_FOLDER = "DELETE FROM folders WHERE id = ?"
+
+# 标签
+_SQL_ADD_TAG = "INSERT OR IGNORE INTO tags (id, name, color) VALUES (?, ?, ?)"
+_SQL_GET_TAG = "SELECT * FROM tags WHERE id = ?"
+_SQL_GET_TAG_BY_NAME = "SELECT * FROM tags WHERE name = ?"
+_SQL_GET_ALL_TAGS = "SELECT * FROM tags"
+_SQL_ADD_DOC_TAG = "INSERT OR IGNORE INTO document_tags (document_id, tag_id) VALUES (?, ?)"
+_SQL_REMOVE_DOC_TAG = "DELETE FROM document_tags WHERE document_id = ? AND tag_id = ?"
+_SQL_GET_DOCS_BY_TAG = """
+SELECT d.* FROM documents d
+JOIN document_tags dt ON d.id = dt.document_id
+WHERE dt.tag_id = ? AND d.is_deleted = 0
+"""
+
+# 注释
+_SQL_ANNOTATION_EXISTS = "SELECT id FROM annotations WHERE id = ?"
+_SQL_UPDATE_ANNOTATION = """
+UPDATE annotations
+SET page_num = ?, data = ?, modified_at = ?
+WHERE id = ?
+"""
+_SQL_ADD_ANNOTATION = """
+INSERT INTO annotations (id, document_id, page_num, data, created_at, modified_at)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_GET_PAGE_ANNOTATIONS = "SELECT data FROM annotations WHERE document_id = ? AND page_num = ?"
+_SQL_GET_DOC_ANNOTATIONS = "SELECT data FROM annotations WHERE document_id = ?"
+_SQL_DELETE_ANNOTATION = "DELETE FROM annotations WHERE id = ?"
+
+# 书签
+_SQL_ADD_BOOKMARK = """
+INSERT INTO bookmarks (id, document_id, page_num, title, created_at)
+VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_GET_BOOKMARKS = "SELECT * FROM bookmarks WHERE document_id = ? ORDER BY page_num"
+_SQL_DELETE_BOOKMARK = "DELETE FROM bookmarks WHERE id = ?"
+
+# 插件
+_SQL_ADD_PLUGIN = """
+INSERT INTO plugins (id, name, version, author, description,
+                     entry_point, permissions, enabled, installed_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_GET_PLUGIN = "SELECT * FROM plugins WHERE id = ?"
+_SQL_GET_ALL_PLUGINS = "SELECT * FROM plugins"
+_SQL_GET_ENABLED_PLUGINS = "SELECT * FROM plugins WHERE enabled = 1"
+_SQL_UPDATE_PLUGIN_STATUS = "UPDATE plugins SET enabled = ? WHERE id = ?"
+_SQL_DELETE_PLUGIN = "DELETE FROM plugins WHERE id = ?"
+
+# 设置
+_SQL_SAVE_APP_SETTINGS = "INSERT OR REPLACE INTO settings (key, value) VALUES ('app_settings', ?)"
+_SQL_LOAD_APP_SETTINGS = "SELECT value FROM settings WHERE key = 'app_settings'"
+_SQL_SAVE_SETTING = "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)"
+_SQL_GET_SETTING = "SELECT value FROM settings WHERE key = ?"
+
+# 统计
+_SQL_VACUUM = "VACUUM"
+_SQL_COUNT_DOCS = "SELECT COUNT(*) FROM documents WHERE is_deleted = 0"
+_SQL_COUNT_FOLDERS = "SELECT COUNT(*) FROM folders"
+_SQL_COUNT_TAGS = "SELECT COUNT(*) FROM tags"
+_SQL_COUNT_ANNOTATIONS = "SELECT COUNT(*) FROM annotations"
+_SQL_COUNT_BOOKMARKS = "SELECT COUNT(*) FROM bookmarks"
+_SQL_COUNT_PLUGINS = "SELECT COUNT(*) FROM plugins"
+
+
+def _annotation_from_data(data: Any) -> Annotation:
+    """按存储类型解析注释数据：BLOB 为二进制格式，文本为 JSON"""
+    if isinstance(data, bytes):
+        return Annotation.from_binary(data)
+    return Annotation.from_dict(_json_loads(data))
+
+
 class Database:
     """数据库操作类"""
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, annotation_format: str = ANNOTATION_FORMAT_JSON):
         """
         初始化数据库
         
         Args:
             db_path: 数据库文件路径
+            annotation_format: 新保存注释的存储格式（ANNOTATION_FORMATS 之一），
+                读取时两种格式均可识别
         """
+        if annotation_format not in ANNOTATION_FORMATS:
+            raise ValueError(f"Unsupported annotation format: {annotation_format}")
         self.db_path = db_path
+        self.annotation_format = annotation_format
         self._ensure_db_exists()
 
     def _ensure_db_exists(self) -> None:
@@ -131,8 +264,15 @@ class Database:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         with self._get_connection() as conn:
             conn.executescript(SCHEMA)
+            self._migrate(conn)
             conn.commit()
 
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """为旧版本数据库补充新增的列"""
+        columns = {row["name"] for row in conn.execute(_SQL_DOC_COLUMNS)}
+        if "fingerprint" not in columns:
+            conn.execute(_SQL_ADD_DOC_FINGERPRINT_COLUMN)
+
     @contextmanager
     def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
         """获取数据库连接的上下文管理器"""
@@ -150,11 +290,7 @@ class Database:
         """添加文档"""
         with self._get_connection() as conn:
             conn.execute(
-                """
-                INSERT INTO documents (id, path, title, file_type, size, folder_id, 
-                                       thumbnail, created_at, modified_at, is_deleted)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_ADD_DOC,
                 (
                     doc.id,
                     str(doc.path),
@@ -166,6 +302,7 @@ class Database:
                     doc.created_at.isoformat(),
                     doc.modified_at.isoformat(),
                     1 if doc.is_deleted else 0,
+                    doc.fingerprint,
                 ),
             )
             conn.commit()
@@ -174,9 +311,7 @@ class Database:
     def get_document(self, doc_id: str) -> Optional[DocumentEntry]:
         """获取文档"""
         with self._get_connection() as conn:
-            row = conn.execute(
-                "SELECT * FROM documents WHERE id = ?", (doc_id,)
-            ).fetchone()
+            row = conn.execute(_SQL_GET_DOC, (doc_id,)).fetchone()
             if row:
                 return self._row_to_document(row)
         return None
@@ -189,14 +324,11 @@ class Database:
         """获取文档列表"""
         with self._get_connection() as conn:
             if folder_id:
-                query = "SELECT * FROM documents WHERE folder_id = ?"
-                params = [folder_id]
+                query = _SQL_GET_DOCS_IN_FOLDER_ALL if include_deleted else _SQL_GET_DOCS_IN_FOLDER
+                params: tuple = (folder_id,)
             else:
-                query = "SELECT * FROM documents WHERE folder_id IS NULL"
-                params = []
-
-            if not include_deleted:
-                query += " AND is_deleted = 0"
+                query = _SQL_GET_DOCS_IN_ROOT_ALL if include_deleted else _SQL_GET_DOCS_IN_ROOT
+                params = ()
 
             rows = conn.execute(query, params).fetchall()
             docs = [self._row_to_document(row) for row in rows]
@@ -207,14 +339,20 @@ class Database:
 
             return docs
 
+    def get_deleted_documents(self) -> List[DocumentEntry]:
+        """获取回收站中的文档（由数据库按is_deleted索引筛选）"""
+        with self._get_connection() as conn:
+            rows = conn.execute(_SQL_GET_DELETED_DOCS).fetchall()
+            docs = [self._row_to_document(row) for row in rows]
+            for doc in docs:
+                doc.tags = self._get_document_tags(conn, doc.id)
+            return docs
+
     def search_documents(self, keyword: str) -> List[DocumentEntry]:
         """搜索文档"""
         with self._get_connection() as conn:
             rows = conn.execute(
-                """
-                SELECT * FROM documents 
-                WHERE (title LIKE ? OR path LIKE ?) AND is_deleted = 0
-                """,
+                _SQL_SEARCH_DOCS,
                 (f"%{keyword}%", f"%{keyword}%"),
             ).fetchall()
             docs = [self._row_to_document(row) for row in rows]
@@ -228,12 +366,7 @@ class Database:
         """更新文档"""
         with self._get_connection() as conn:
             conn.execute(
-                """
-                UPDATE documents 
-                SET path = ?, title = ?, file_type = ?, size = ?, folder_id = ?,
-                    thumbnail = ?, modified_at = ?, is_deleted = ?
-                WHERE id = ?
-                """,
+                _SQL_UPDATE_DOC,
                 (
                     str(doc.path),
                     doc.title,
@@ -243,24 +376,28 @@ class Database:
                     doc.thumbnail,
                     datetime.now().isoformat(),
                     1 if doc.is_deleted else 0,
+                    doc.fingerprint,
                     doc.id,
                 ),
             )
             conn.commit()
 
+    def update_document_thumbnail(self, doc_id: str, thumbnail: Optional[bytes]) -> None:
+        """仅更新文档缩略图"""
+        with self._get_connection() as conn:
+            conn.execute(_SQL_UPDATE_DOC_THUMBNAIL, (thumbnail, doc_id))
+            conn.commit()
+
     def delete_document(self, doc_id: str, permanent: bool = False) -> None:
         """删除文档"""
         with self._get_connection() as conn:
             if permanent:
-                conn.execute("DELETE FROM document_tags WHERE document_id = ?", (doc_id,))
-                conn.execute("DELETE FROM annotations WHERE document_id = ?", (doc_id,))
-                conn.execute("DELETE FROM bookmarks WHERE document_id = ?", (doc_id,))
-                conn.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+                conn.execute(_SQL_DELETE_DOC_TAGS, (doc_id,))
+                conn.execute(_SQL_DELETE_DOC_ANNOTATIONS, (doc_id,))
+                conn.execute(_SQL_DELETE_DOC_BOOKMARKS, (doc_id,))
+                conn.execute(_SQL_DELETE_DOC, (doc_id,))
             else:
-                conn.execute(
-                    "UPDATE documents SET is_deleted = 1, modified_at = ? WHERE id = ?",
-                    (datetime.now().isoformat(), doc_id),
-                )
+                conn.execute(_SQL_SOFT_DELETE_DOC, (datetime.now().isoformat(), doc_id))
             conn.commit()
 
     def _row_to_document(self, row: sqlite3.Row) -> DocumentEntry:
@@ -269,26 +406,20 @@ class Database:
             id=row["id"],
             path=Path(row["path"]),
             title=row["title"],
-            file_type=row["file_type"],
+            file_type=_intern(row["file_type"]),
             size=row["size"],
-            folder_id=row["folder_id"],
+            folder_id=_intern(row["folder_id"]),
             thumbnail=row["thumbnail"],
             created_at=datetime.fromisoformat(row["created_at"]),
             modified_at=datetime.fromisoformat(row["modified_at"]),
             is_deleted=bool(row["is_deleted"]),
+            fingerprint=row["fingerprint"],
         )
 
     def _get_document_tags(self, conn: sqlite3.Connection, doc_id: str) -> List[str]:
         """获取文档的标签名称列表"""
-        rows = conn.execute(
-            """
-            SELECT t.name FROM tags t
-            JOIN document_tags dt ON t.id = dt.tag_id
-            WHERE dt.document_id = ?
-            """,
-            (doc_id,),
-        ).fetchall()
-        return [row["name"] for row in rows]
+        rows = conn.execute(_SQL_GET_DOC_TAG_NAMES, (doc_id,)).fetchall()
+        return [_intern(row["name"]) for row in rows]
 
 
     # ============== 文件夹操作 ==============
@@ -297,10 +428,7 @@ class Database:
         """添加文件夹"""
         with self._get_connection() as conn:
             conn.execute(
-                """
-                INSERT INTO folders (id, name, parent_id, created_at)
-                VALUES (?, ?, ?, ?)
-                """,
+                _SQL_ADD_FOLDER,
                 (folder.id, folder.name, folder.parent_id, folder.created_at.isoformat()),
             )
             conn.commit()
@@ -309,9 +437,7 @@ class Database:
     def get_folder(self, folder_id: str) -> Optional[Folder]:
         """获取文件夹"""
         with self._get_connection() as conn:
-            row = conn.execute(
-                "SELECT * FROM folders WHERE id = ?", (folder_id,)
-            ).fetchone()
+            row = conn.execute(_SQL_GET_FOLDER, (folder_id,)).fetchone()
             if row:
                 return Folder(
                     id=row["id"],
@@ -325,13 +451,9 @@ class Database:
         """获取文件夹列表"""
         with self._get_connection() as conn:
             if parent_id:
-                rows = conn.execute(
-                    "SELECT * FROM folders WHERE parent_id = ?", (parent_id,)
-                ).fetchall()
+                rows = conn.execute(_SQL_GET_CHILD_FOLDERS, (parent_id,)).fetchall()
             else:
-                rows = conn.execute(
-                    "SELECT * FROM folders WHERE parent_id IS NULL"
-                ).fetchall()
+                rows = conn.execute(_SQL_GET_ROOT_FOLDERS).fetchall()
             return [
                 Folder(
                     id=row["id"],
@@ -346,17 +468,11 @@ class Database:
         """删除文件夹"""
         with self._get_connection() as conn:
             # 将文件夹内的文档移到根目录
-            conn.execute(
-                "UPDATE documents SET folder_id = NULL WHERE folder_id = ?",
-                (folder_id,),
-            )
+            conn.execute(_SQL_UNFILE_FOLDER_DOCS, (folder_id,))
             # 将子文件夹移到根目录
-            conn.execute(
-                "UPDATE folders SET parent_id = NULL WHERE parent_id = ?",
-                (folder_id,),
-            )
+            conn.execute(_SQL_UNPARENT_FOLDERS, (folder_id,))
             # 删除文件夹
-            conn.execute("DELETE FROM folders WHERE id = ?", (folder_id,))
+            conn.execute(_SQL_DELETE_FOLDER, (folder_id,))
             conn.commit()
 
     # ============== 标签操作 ==============
@@ -364,17 +480,14 @@ class Database:
     def add_tag(self, tag: Tag) -> str:
         """添加标签"""
         with self._get_connection() as conn:
-            conn.execute(
-                "INSERT OR IGNORE INTO tags (id, name, color) VALUES (?, ?, ?)",
-                (tag.id, tag.name, tag.color),
-            )
+            conn.execute(_SQL_ADD_TAG, (tag.id, tag.name, tag.color))
             conn.commit()
         return tag.id
 
     def get_tag(self, tag_id: str) -> Optional[Tag]:
         """获取标签"""
         with self._get_connection() as conn:
-            row = conn.execute("SELECT * FROM tags WHERE id = ?", (tag_id,)).fetchone()
+            row = conn.execute(_SQL_GET_TAG, (tag_id,)).fetchone()
             if row:
                 return Tag(id=row["id"], name=row["name"], color=row["color"])
         return None
@@ -382,7 +495,7 @@ class Database:
     def get_tag_by_name(self, name: str) -> Optional[Tag]:
         """根据名称获取标签"""
         with self._get_connection() as conn:
-            row = conn.execute("SELECT * FROM tags WHERE name = ?", (name,)).fetchone()
+            row = conn.execute(_SQL_GET_TAG_BY_NAME, (name,)).fetchone()
             if row:
                 return Tag(id=row["id"], name=row["name"], color=row["color"])
         return None
@@ -390,38 +503,25 @@ class Database:
     def get_all_tags(self) -> List[Tag]:
         """获取所有标签"""
         with self._get_connection() as conn:
-            rows = conn.execute("SELECT * FROM tags").fetchall()
+            rows = conn.execute(_SQL_GET_ALL_TAGS).fetchall()
             return [Tag(id=row["id"], name=row["name"], color=row["color"]) for row in rows]
 
     def add_document_tag(self, doc_id: str, tag_id: str) -> None:
         """为文档添加标签"""
         with self._get_connection() as conn:
-            conn.execute(
-                "INSERT OR IGNORE INTO document_tags (document_id, tag_id) VALUES (?, ?)",
-                (doc_id, tag_id),
-            )
+            conn.execute(_SQL_ADD_DOC_TAG, (doc_id, tag_id))
             conn.commit()
 
     def remove_document_tag(self, doc_id: str, tag_id: str) -> None:
         """移除文档标签"""
         with self._get_connection() as conn:
-            conn.execute(
-                "DELETE FROM document_tags WHERE document_id = ? AND tag_id = ?",
-                (doc_id, tag_id),
-            )
+            conn.execute(_SQL_REMOVE_DOC_TAG, (doc_id, tag_id))
             conn.commit()
 
     def get_documents_by_tag(self, tag_id: str) -> List[DocumentEntry]:
         """获取带有指定标签的文档"""
         with self._get_connection() as conn:
-            rows = conn.execute(
-                """
-                SELECT d.* FROM documents d
-                JOIN document_tags dt ON d.id = dt.document_id
-                WHERE dt.tag_id = ? AND d.is_deleted = 0
-                """,
-                (tag_id,),
-            ).fetchall()
+            rows = conn.execute(_SQL_GET_DOCS_BY_TAG, (tag_id,)).fetchall()
             docs = [self._row_to_document(row) for row in rows]
             for doc in docs:
                 doc.tags = self._get_document_tags(conn, doc.id)
@@ -432,28 +532,22 @@ class Database:
 
     def save_annotation(self, doc_id: str, annotation: Annotation) -> str:
         """保存注释"""
-        data = json.dumps(annotation.to_dict(), ensure_ascii=False)
+        if self.annotation_format == ANNOTATION_FORMAT_BINARY:
+            data = annotation.to_binary()
+        else:
+            data = _json_dumps(annotation.to_dict())
         with self._get_connection() as conn:
             # 检查是否已存在
-            existing = conn.execute(
-                "SELECT id FROM annotations WHERE id = ?", (annotation.id,)
-            ).fetchone()
+            existing = conn.execute(_SQL_ANNOTATION_EXISTS, (annotation.id,)).fetchone()
 
             if existing:
                 conn.execute(
-                    """
-                    UPDATE annotations 
-                    SET data = ?, modified_at = ?
-                    WHERE id = ?
-                    """,
-                    (data, datetime.now().isoformat(), annotation.id),
+                    _SQL_UPDATE_ANNOTATION,
+                    (annotation.page_num, data, datetime.now().isoformat(), annotation.id),
                 )
             else:
                 conn.execute(
-                    """
-                    INSERT INTO annotations (id, document_id, page_num, data, created_at, modified_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
+                    _SQL_ADD_ANNOTATION,
                     (
                         annotation.id,
                         doc_id,
@@ -467,19 +561,34 @@ class Database:
         return annotation.id
 
     def get_annotations(self, doc_id: str, page_num: Optional[int] = None) -> List[Annotation]:
-        """获取注释"""
+        """
+        获取注释
+
+        JSON格式的注释延迟构造笔画对象（见Annotation.from_dict），首次访问strokes时才解析。
+        需要立即取得全部笔画时请使用get_annotations_eager。
+        """
+        return [
+            _annotation_from_data(row["data"])
+            for row in self._fetch_annotation_rows(doc_id, page_num)
+        ]
+
+    def get_annotations_eager(
+        self, doc_id: str, page_num: Optional[int] = None
+    ) -> List[Annotation]:
+        """获取注释（立即反序列化全部笔画）"""
+        annotations = self.get_annotations(doc_id, page_num)
+        for annotation in annotations:
+            annotation.strokes  # 访问即触发反序列化
+        return annotations
+
+    def _fetch_annotation_rows(
+        self, doc_id: str, page_num: Optional[int] = None
+    ) -> List[sqlite3.Row]:
+        """查询注释的原始数据行"""
         with self._get_connection() as conn:
             if page_num is not None:
-                rows = conn.execute(
-                    "SELECT data FROM annotations WHERE document_id = ? AND page_num = ?",
-                    (doc_id, page_num),
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    "SELECT data FROM annotations WHERE document_id = ?",
-                    (doc_id,),
-                ).fetchall()
-            return [Annotation.from_dict(json.loads(row["data"])) for row in rows]
+                return conn.execute(_SQL_GET_PAGE_ANNOTATIONS, (doc_id, page_num)).fetchall()
+            return conn.execute(_SQL_GET_DOC_ANNOTATIONS, (doc_id,)).fetchall()
 
     def load_annotations(self, doc_id: str) -> List[Annotation]:
         """加载文档的所有注释（别名方法，用于注释引擎）"""
@@ -488,7 +597,7 @@ class Database:
     def delete_annotation(self, annotation_id: str) -> None:
         """删除注释"""
         with self._get_connection() as conn:
-            conn.execute("DELETE FROM annotations WHERE id = ?", (annotation_id,))
+            conn.execute(_SQL_DELETE_ANNOTATION, (annotation_id,))
             conn.commit()
 
     # ============== 书签操作 ==============
@@ -497,10 +606,7 @@ class Database:
         """添加书签"""
         with self._get_connection() as conn:
             conn.execute(
-                """
-                INSERT INTO bookmarks (id, document_id, page_num, title, created_at)
-                VALUES (?, ?, ?, ?, ?)
-                """,
+                _SQL_ADD_BOOKMARK,
                 (
                     bookmark.id,
                     bookmark.document_id,
@@ -515,10 +621,7 @@ class Database:
     def get_bookmarks(self, doc_id: str) -> List[Bookmark]:
         """获取文档的书签"""
         with self._get_connection() as conn:
-            rows = conn.execute(
-                "SELECT * FROM bookmarks WHERE document_id = ? ORDER BY page_num",
-                (doc_id,),
-            ).fetchall()
+            rows = conn.execute(_SQL_GET_BOOKMARKS, (doc_id,)).fetchall()
             return [
                 Bookmark(
                     id=row["id"],
@@ -533,7 +636,7 @@ class Database:
     def delete_bookmark(self, bookmark_id: str) -> None:
         """删除书签"""
         with self._get_connection() as conn:
-            conn.execute("DELETE FROM bookmarks WHERE id = ?", (bookmark_id,))
+            conn.execute(_SQL_DELETE_BOOKMARK, (bookmark_id,))
             conn.commit()
 
     # ============== 插件操作 ==============
@@ -542,11 +645,7 @@ class Database:
         """添加插件"""
         with self._get_connection() as conn:
             conn.execute(
-                """
-                INSERT INTO plugins (id, name, version, author, description, 
-                                     entry_point, permissions, enabled, installed_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_ADD_PLUGIN,
                 (
                     plugin.id,
                     plugin.name,
@@ -565,9 +664,7 @@ class Database:
     def get_plugin(self, plugin_id: str) -> Optional[PluginInfo]:
         """获取插件"""
         with self._get_connection() as conn:
-            row = conn.execute(
-                "SELECT * FROM plugins WHERE id = ?", (plugin_id,)
-            ).fetchone()
+            row = conn.execute(_SQL_GET_PLUGIN, (plugin_id,)).fetchone()
             if row:
                 return self._row_to_plugin(row)
         return None
@@ -575,28 +672,25 @@ class Database:
     def get_all_plugins(self) -> List[PluginInfo]:
         """获取所有插件"""
         with self._get_connection() as conn:
-            rows = conn.execute("SELECT * FROM plugins").fetchall()
+            rows = conn.execute(_SQL_GET_ALL_PLUGINS).fetchall()
             return [self._row_to_plugin(row) for row in rows]
 
     def get_enabled_plugins(self) -> List[PluginInfo]:
         """获取已启用的插件"""
         with self._get_connection() as conn:
-            rows = conn.execute("SELECT * FROM plugins WHERE enabled = 1").fetchall()
+            rows = conn.execute(_SQL_GET_ENABLED_PLUGINS).fetchall()
             return [self._row_to_plugin(row) for row in rows]
 
     def update_plugin_status(self, plugin_id: str, enabled: bool) -> None:
         """更新插件状态"""
         with self._get_connection() as conn:
-            conn.execute(
-                "UPDATE plugins SET enabled = ? WHERE id = ?",
-                (1 if enabled else 0, plugin_id),
-            )
+            conn.execute(_SQL_UPDATE_PLUGIN_STATUS, (1 if enabled else 0, plugin_id))
             conn.commit()
 
     def delete_plugin(self, plugin_id: str) -> None:
         """删除插件"""
         with self._get_connection() as conn:
-            conn.execute("DELETE FROM plugins WHERE id = ?", (plugin_id,))
+            conn.execute(_SQL_DELETE_PLUGIN, (plugin_id,))
             conn.commit()
 
     def _row_to_plugin(self, row: sqlite3.Row) -> PluginInfo:
@@ -620,21 +714,13 @@ class Database:
         """保存设置"""
         json_str = settings.to_json()
         with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO settings (key, value)
-                VALUES ('app_settings', ?)
-                """,
-                (json_str,),
-            )
+            conn.execute(_SQL_SAVE_APP_SETTINGS, (json_str,))
             conn.commit()
 
     def load_settings(self) -> Settings:
         """加载设置"""
         with self._get_connection() as conn:
-            row = conn.execute(
-                "SELECT value FROM settings WHERE key = 'app_settings'"
-            ).fetchone()
+            row = conn.execute(_SQL_LOAD_APP_SETTINGS).fetchone()
             if row:
                 return Settings.from_json(row["value"])
         return Settings()
@@ -642,18 +728,13 @@ class Database:
     def save_setting(self, key: str, value: str) -> None:
         """保存单个设置项"""
         with self._get_connection() as conn:
-            conn.execute(
-                "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
-                (key, value),
-            )
+            conn.execute(_SQL_SAVE_SETTING, (key, value))
             conn.commit()
 
     def get_setting(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """获取单个设置项"""
         with self._get_connection() as conn:
-            row = conn.execute(
-                "SELECT value FROM settings WHERE key = ?", (key,)
-            ).fetchone()
+            row = conn.execute(_SQL_GET_SETTING, (key,)).fetchone()
             if row:
                 return row["value"]
         return default
@@ -667,19 +748,17 @@ class Database:
     def vacuum(self) -> None:
         """压缩数据库"""
         with self._get_connection() as conn:
-            conn.execute("VACUUM")
+            conn.execute(_SQL_VACUUM)
 
     def get_stats(self) -> dict:
         """获取数据库统计信息"""
         with self._get_connection() as conn:
-            doc_count = conn.execute(
-                "SELECT COUNT(*) FROM documents WHERE is_deleted = 0"
-            ).fetchone()[0]
-            folder_count = conn.execute("SELECT COUNT(*) FROM folders").fetchone()[0]
-            tag_count = conn.execute("SELECT COUNT(*) FROM tags").fetchone()[0]
-            annotation_count = conn.execute("SELECT COUNT(*) FROM annotations").fetchone()[0]
-            bookmark_count = conn.execute("SELECT COUNT(*) FROM bookmarks").fetchone()[0]
-            plugin_count = conn.execute("SELECT COUNT(*) FROM plugins").fetchone()[0]
+            doc_count = conn.execute(_SQL_COUNT_DOCS).fetchone()[0]
+            folder_count = conn.execute(_SQL_COUNT_FOLDERS).fetchone()[0]
+            tag_count = conn.execute(_SQL_COUNT_TAGS).fetchone()[0]
+            annotation_count = conn.execute(_SQL_COUNT_ANNOTATIONS).fetchone()[0]
+            bookmark_count = conn.execute(_SQL_COUNT_BOOKMARKS).fetchone()[0]
+            plugin_count = conn.execute(_SQL_COUNT_PLUGINS).fetchone()[0]
 
             return {
                 "documents": doc_count,
@@ -5,16 +5,89 @@
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 import tempfile
 import os
+import zipfile
+import zlib
 
 import fitz  # PyMuPDF
 
 from huawei_pdf_reader.models import DocumentInfo, PageInfo
 
 
+# 支持的文件扩展名（小写）
+_PDF_EXTS = frozenset({'.pdf'})
+_WORD_EXTS = frozenset({'.docx', '.doc'})
+
+# Word正文在docx压缩包中的位置及WordprocessingML命名空间
+_DOCX_BODY_PART = 'word/document.xml'
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+
+@lru_cache(maxsize=1)
+def _helv_font() -> "fitz.Font":
+    """Word转换使用的Helvetica字体（首次使用时创建，之后复用）"""
+    return fitz.Font("helv")
+
+
+def _validate_docx(path: Path) -> None:
+    """
+    检查docx压缩包结构（只读取目录，不解析XML）
+    
+    Raises:
+        CorruptedFileError: 不是zip文件或缺少正文部件
+    """
+    try:
+        with zipfile.ZipFile(path) as z:
+            z.getinfo(_DOCX_BODY_PART)
+    except (zipfile.BadZipFile, KeyError, OSError):
+        raise CorruptedFileError(f"文件已损坏，无法打开: {path}")
+
+
+def _iter_docx_paragraphs(path: Path) -> Iterator[str]:
+    """
+    流式读取docx正文段落文本
+    
+    逐个解析<w:p>元素并在产出后释放，内存占用与文档大小无关。
+    
+    Args:
+        path: docx文件路径
+        
+    Yields:
+        段落文本（可能为空字符串）
+    """
+    from lxml import etree
+    
+    text_tag = _W_NS + 't'
+    tab_tag = _W_NS + 'tab'
+    with zipfile.ZipFile(path) as z, z.open(_DOCX_BODY_PART) as body:
+        # 与python-docx一致不解析实体，并禁止网络访问：外部实体不会把本地文件内容带入正文
+        paragraphs = etree.iterparse(
+            body, events=('end',), tag=_W_NS + 'p',
+            resolve_entities=False, no_network=True,
+        )
+        for _, elem in paragraphs:
+            parts = []
+            for node in elem.iter(text_tag, tab_tag, _W_NS + 'br', _W_NS + 'cr'):
+                if node.tag == text_tag:
+                    parts.append(node.text or "")
+                elif node.tag == tab_tag:
+                    parts.append("\t")
+                else:
+                    parts.append("\n")
+            yield "".join(parts)
+            # 释放已处理的元素（嵌套段落清空后不会被外层重复计入）
+            elem.clear()
+            parent = elem.getparent()
+            while parent is not None and elem.getprevious() is not None:
+                del parent[0]
+
+
 class DocumentError(Exception):
     """文档处理错误基类"""
     pass
@@ -49,10 +122,21 @@ class IDocumentRenderer(ABC):
         pass
     
     @abstractmethod
-    def render_page(self, page_num: int, scale: float = 1.0) -> bytes:
+    def render_page(self, page_num: int, scale: float = 1.0, image_format: str = "png") -> bytes:
         """渲染指定页面，返回图像数据"""
         pass
     
+    def render_page_raw(self, page_num: int, scale: float = 1.0) -> Tuple[bytes, int, int, int]:
+        """
+        渲染指定页面，返回未编码的RGB像素 (数据, 宽, 高, 行字节数)
+        
+        默认解码render_page的PNG结果；能直接取得像素的渲染器可覆盖此方法省去编解码。
+        """
+        pix = fitz.Pixmap(self.render_page(page_num, scale))
+        if pix.alpha:
+            pix = fitz.Pixmap(pix, 0)
+        return pix.samples, pix.width, pix.height, pix.stride
+    
     @abstractmethod
     def get_page_info(self, page_num: int) -> PageInfo:
         """获取页面信息"""
@@ -94,17 +178,34 @@ class IDocumentRenderer(ABC):
 class PDFRenderer(IDocumentRenderer):
     """PDF渲染器实现"""
     
+    # 页面图像缓存容量（A4页面150DPI约100-300KB/页）
+    PAGE_CACHE_SIZE = 64
+    
+    # 页面显示列表缓存容量
+    DISPLAY_LIST_CACHE_SIZE = 8
+    
+    # 支持的渲染输出格式：png为压缩格式；ppm/pam为无压缩格式，编码快，适合屏幕显示
+    RENDER_FORMATS = ("png", "ppm", "pam")
+    
+    # 写入页面图像缓存的格式。无压缩格式每页可达数MB（A4页面2倍缩放约6MB），
+    # 且用完即弃，不缓存，避免按条目数限制的缓存占用数百MB内存
+    CACHED_RENDER_FORMATS = ("png",)
+    
     def __init__(self):
         self._doc = None
         self._path: Optional[Path] = None
         self._document_info: Optional[DocumentInfo] = None
+        # 页面图像LRU缓存 {(page_num, scale, image_format): image_bytes}
+        self._page_cache: "OrderedDict[Tuple[int, float, str], bytes]" = OrderedDict()
+        # 页面显示列表LRU缓存 {page_num: fitz.DisplayList}
+        self._display_lists: "OrderedDict[int, fitz.DisplayList]" = OrderedDict()
     
     def open(self, path: Path) -> DocumentInfo:
         """打开PDF文档"""
         if not path.exists():
             raise FileNotFoundError(f"文件不存在: {path}")
         
-        if path.suffix.lower() != '.pdf':
+        if path.suffix.lower() not in _PDF_EXTS:
             raise UnsupportedFormatError(f"不支持的文件格式: {path.suffix}")
         
         try:
@@ -112,6 +213,9 @@ class PDFRenderer(IDocumentRenderer):
         except Exception as e:
             raise CorruptedFileError(f"文件已损坏，无法打开: {e}")
         
+        self._page_cache.clear()
+        self._display_lists.clear()
+        
         if self._doc.page_count == 0:
             self._doc.close()
             self._doc = None
@@ -134,19 +238,117 @@ class PDFRenderer(IDocumentRenderer):
             self._doc = None
         self._path = None
         self._document_info = None
+        self._page_cache.clear()
+        self._display_lists.clear()
+    
+    def render_page(self, page_num: int, scale: float = 1.0, image_format: str = "png") -> bytes:
+        """
+        渲染指定页面
+        
+        Args:
+            page_num: 页码（从1开始）
+            scale: 缩放比例
+            image_format: 输出格式，png（默认）或无压缩的ppm/pam。
+                屏幕显示的图像用完即弃，无压缩格式可省去PNG的zlib压缩开销；
+                无压缩格式的结果不进入页面图像缓存
+        
+        Returns:
+            图像数据
+        """
+        if not self._doc:
+            raise DocumentError("文档未打开")
+        
+        if page_num < 1 or page_num > self._doc.page_count:
+            raise DocumentError(f"页码超出范围: {page_num}")
+        
+        if image_format not in self.RENDER_FORMATS:
+            raise DocumentError(f"不支持的图像格式: {image_format}")
+        
+        cacheable = image_format in self.CACHED_RENDER_FORMATS
+        key = (page_num, scale, image_format)
+        if cacheable:
+            cached = self._page_cache.get(key)
+            if cached is not None:
+                self._page_cache.move_to_end(key)
+                return cached
+        
+        mat = fitz.Matrix(scale, scale)
+        pix = self._get_display_list(page_num).get_pixmap(matrix=mat)
+        image_data = pix.tobytes(image_format)
+        if not cacheable:
+            return image_data
+        
+        self._page_cache[key] = image_data
+        if len(self._page_cache) > self.PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+        return image_data
     
-    def render_page(self, page_num: int, scale: float = 1.0) -> bytes:
-        """渲染指定页面，返回PNG图像数据"""
+    def render_page_raw(self, page_num: int, scale: float = 1.0) -> Tuple[bytes, int, int, int]:
+        """
+        渲染指定页面为未编码的RGB像素
+        
+        界面可直接将像素上传为纹理，省去图像编码与解码。
+        
+        Args:
+            page_num: 页码（从1开始）
+            scale: 缩放比例
+        
+        Returns:
+            (像素数据, 宽度, 高度, 每行字节数)，每像素3字节，自上而下逐行排列
+        """
         if not self._doc:
             raise DocumentError("文档未打开")
         
         if page_num < 1 or page_num > self._doc.page_count:
             raise DocumentError(f"页码超出范围: {page_num}")
         
-        page = self._doc[page_num - 1]  # PyMuPDF使用0索引
         mat = fitz.Matrix(scale, scale)
-        pix = page.get_pixmap(matrix=mat)
-        return pix.tobytes("png")
+        pix = self._get_display_list(page_num).get_pixmap(matrix=mat, alpha=False)
+        return pix.samples, pix.width, pix.height, pix.stride
+    
+    def _get_display_list(self, page_num: int) -> "fitz.DisplayList":
+        """
+        获取页面的显示列表
+        
+        显示列表保存解析后的页面绘制指令，同一页面以不同缩放比例重新渲染时
+        无需再次解析页面内容流。
+        """
+        display_list = self._display_lists.get(page_num)
+        if display_list is not None:
+            self._display_lists.move_to_end(page_num)
+            return display_list
+        
+        display_list = self._doc[page_num - 1].get_displaylist()  # PyMuPDF使用0索引
+        self._display_lists[page_num] = display_list
+        if len(self._display_lists) > self.DISPLAY_LIST_CACHE_SIZE:
+            self._display_lists.popitem(last=False)
+        return display_list
+    
+    def _invalidate_page_cache(self, page_num: int, deleted: bool = False) -> None:
+        """
+        使页面图像缓存失效
+        
+        Args:
+            page_num: 发生变化的页码
+            deleted: 页面是否被删除，删除时后续页面的缓存页码前移
+        """
+        remaining = OrderedDict()
+        for (cached_page, scale, image_format), image_data in self._page_cache.items():
+            if cached_page == page_num:
+                continue
+            if deleted and cached_page > page_num:
+                cached_page -= 1
+            remaining[(cached_page, scale, image_format)] = image_data
+        self._page_cache = remaining
+        
+        display_lists = OrderedDict()
+        for cached_page, display_list in self._display_lists.items():
+            if cached_page == page_num:
+                continue
+            if deleted and cached_page > page_num:
+                cached_page -= 1
+            display_lists[cached_page] = display_list
+        self._display_lists = display_lists
     
     def get_page_info(self, page_num: int) -> PageInfo:
         """获取页面信息"""
@@ -197,6 +399,7 @@ class PDFRenderer(IDocumentRenderer):
         current_rotation = page.rotation
         new_rotation = (current_rotation + angle) % 360
         page.set_rotation(new_rotation)
+        self._invalidate_page_cache(page_num)
     
     def delete_page(self, page_num: int) -> None:
         """删除页面"""
@@ -210,6 +413,7 @@ class PDFRenderer(IDocumentRenderer):
             raise DocumentError("无法删除最后一页")
         
         self._doc.delete_page(page_num - 1)
+        self._invalidate_page_cache(page_num, deleted=True)
         
         # 更新文档信息
         if self._document_info:
@@ -273,23 +477,17 @@ class WordRenderer(IDocumentRenderer):
     
     def open(self, path: Path) -> DocumentInfo:
         """打开Word文档（转换为PDF后渲染）"""
-        from docx import Document as DocxDocument
-        from docx.opc.exceptions import PackageNotFoundError
+        from lxml import etree
         
         if not path.exists():
             raise FileNotFoundError(f"文件不存在: {path}")
         
         suffix = path.suffix.lower()
-        if suffix not in ('.docx', '.doc'):
+        if suffix not in _WORD_EXTS:
             raise UnsupportedFormatError(f"不支持的文件格式: {suffix}")
         
-        # 尝试打开Word文档验证其有效性
-        try:
-            docx_doc = DocxDocument(str(path))
-        except PackageNotFoundError:
-            raise CorruptedFileError(f"文件已损坏，无法打开: {path}")
-        except Exception as e:
-            raise CorruptedFileError(f"文件已损坏，无法打开: {e}")
+        # 先检查压缩包结构，损坏文件无需解析XML
+        _validate_docx(path)
         
         self._original_path = path
         
@@ -297,8 +495,14 @@ class WordRenderer(IDocumentRenderer):
         temp_dir = tempfile.gettempdir()
         self._temp_pdf_path = Path(temp_dir) / f"{path.stem}_temp.pdf"
         
-        # 将Word转换为PDF
-        self._convert_docx_to_pdf(docx_doc, self._temp_pdf_path)
+        # 将Word转换为PDF（正文XML在转换时流式解析，压缩数据损坏时
+        # 读取正文会抛出zlib.error/EOFError等）
+        try:
+            self._convert_docx_to_pdf(path, self._temp_pdf_path)
+        except (
+            etree.XMLSyntaxError, zipfile.BadZipFile, zlib.error, EOFError, OSError, KeyError
+        ) as e:
+            raise CorruptedFileError(f"文件已损坏，无法打开: {e}")
         
         # 使用PDF渲染器打开转换后的PDF
         pdf_info = self._pdf_renderer.open(self._temp_pdf_path)
@@ -313,60 +517,75 @@ class WordRenderer(IDocumentRenderer):
         
         return self._document_info
     
-    def _convert_docx_to_pdf(self, docx_doc, output_path: Path) -> None:
+    def _convert_docx_to_pdf(self, docx_path: Path, output_path: Path) -> None:
         """将Word文档转换为PDF"""
         # 创建新的PDF文档
         pdf_doc = fitz.open()
         
-        # 提取Word文档内容并创建PDF页面
-        full_text = []
-        for para in docx_doc.paragraphs:
-            if para.text.strip():
-                full_text.append(para.text)
+        # 流式提取段落并折行，段落间插入空行；整篇文本不在内存中展开
+        lines = chain.from_iterable(
+            self._wrap_text(text) + [""]
+            for text in _iter_docx_paragraphs(docx_path)
+            if text.strip()
+        )
         
-        # 如果没有内容，添加一个空白页
-        if not full_text:
+        # 将文本分页（简单实现：每页约40行），逐页从行迭代器中取出
+        lines_per_page = 40
+        font = _helv_font()
+        while True:
+            page_lines = list(islice(lines, lines_per_page))
+            if not page_lines:
+                break
             page = pdf_doc.new_page(width=595, height=842)  # A4尺寸
-        else:
-            # 将文本分页（简单实现：每页约40行）
-            lines_per_page = 40
-            all_lines = []
-            for text in full_text:
-                # 简单的换行处理
-                words = text.split()
-                current_line = ""
-                for word in words:
-                    if len(current_line) + len(word) + 1 <= 80:  # 每行约80字符
-                        current_line = current_line + " " + word if current_line else word
-                    else:
-                        if current_line:
-                            all_lines.append(current_line)
-                        current_line = word
-                if current_line:
-                    all_lines.append(current_line)
-                all_lines.append("")  # 段落间空行
             
-            # 创建页面
-            for i in range(0, max(1, len(all_lines)), lines_per_page):
-                page = pdf_doc.new_page(width=595, height=842)  # A4尺寸
-                page_lines = all_lines[i:i + lines_per_page]
-                
-                # 在页面上插入文本
-                y_pos = 50
-                for line in page_lines:
-                    if line:
-                        page.insert_text(
-                            (50, y_pos),
-                            line,
-                            fontsize=11,
-                            fontname="helv"
-                        )
-                    y_pos += 18
+            # 整页文本通过TextWriter一次写入内容流
+            writer = fitz.TextWriter(page.rect)
+            y_pos = 50
+            for line in page_lines:
+                if line:
+                    writer.append((50, y_pos), line, font=font, fontsize=11)
+                y_pos += 18
+            writer.write_text(page)
+        
+        # 如果没有内容，添加一个空白页
+        if pdf_doc.page_count == 0:
+            pdf_doc.new_page(width=595, height=842)  # A4尺寸
         
         # 保存PDF
         pdf_doc.save(str(output_path))
         pdf_doc.close()
     
+    @staticmethod
+    def _wrap_text(text: str, width: int = 80) -> List[str]:
+        """
+        按单词将段落折行（每行约80字符）
+        
+        连续空白合并为一个空格；超过行宽的单词单独成行，不拆分。
+        """
+        words = text.split()
+        # 单词长度一次性在C层计算，折行循环只做整数比较
+        lengths = list(map(len, words))
+        
+        # 整段不超过行宽时无需逐词处理
+        if sum(lengths) + len(words) - 1 <= width:
+            return [" ".join(words)] if words else []
+        
+        # 只记录每行起始单词的下标，换行时按切片拼接
+        lines = []
+        line_start = 0
+        line_len = -1  # 空行，首个单词前不计空格
+        for i, word_len in enumerate(lengths):
+            if line_len + word_len + 1 <= width:
+                line_len += word_len + 1
+            else:
+                if i > line_start:
+                    lines.append(" ".join(words[line_start:i]))
+                line_start = i
+                line_len = word_len
+        if line_start < len(words):
+            lines.append(" ".join(words[line_start:]))
+        return lines
+    
     def close(self) -> None:
         """关闭文档"""
         self._pdf_renderer.close()
@@ -382,9 +601,13 @@ class WordRenderer(IDocumentRenderer):
         self._original_path = None
         self._document_info = None
     
-    def render_page(self, page_num: int, scale: float = 1.0) -> bytes:
+    def render_page(self, page_num: int, scale: float = 1.0, image_format: str = "png") -> bytes:
         """渲染指定页面"""
-        return self._pdf_renderer.render_page(page_num, scale)
+        return self._pdf_renderer.render_page(page_num, scale, image_format)
+    
+    def render_page_raw(self, page_num: int, scale: float = 1.0) -> Tuple[bytes, int, int, int]:
+        """渲染指定页面为未编码的RGB像素"""
+        return self._pdf_renderer.render_page_raw(page_num, scale)
     
     def get_page_info(self, page_num: int) -> PageInfo:
         """获取页面信息"""
@@ -426,13 +649,17 @@ class WordRenderer(IDocumentRenderer):
         return self._document_info
 
 
+# 扩展名到渲染器类的映射
+_RENDERER_BY_EXT = {
+    **{ext: PDFRenderer for ext in _PDF_EXTS},
+    **{ext: WordRenderer for ext in _WORD_EXTS},
+}
+
+
 def create_renderer(path: Path) -> IDocumentRenderer:
     """根据文件类型创建合适的渲染器"""
     suffix = path.suffix.lower()
-    
-    if suffix == '.pdf':
-        return PDFRenderer()
-    elif suffix in ('.docx', '.doc'):
-        return WordRenderer()
-    else:
+    renderer_cls = _RENDERER_BY_EXT.get(suffix)
+    if renderer_cls is None:
         raise UnsupportedFormatError(f"不支持的文件格式: {suffix}")
+    return renderer_cls()
@@ -5,15 +5,25 @@
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+import hashlib
+import threading
 import uuid
 import os
 
 import fitz  # PyMuPDF
 
 from huawei_pdf_reader.database import Database
+from huawei_pdf_reader.document_processor import (
+    _helv_font,
+    _iter_docx_paragraphs,
+    _validate_docx,
+)
 from huawei_pdf_reader.models import (
     Bookmark,
     DocumentEntry,
@@ -42,6 +52,131 @@ class TagNotFoundError(FileManagerError):
     pass
 
 
+# 支持导入的文件扩展名（小写）
+_PDF_EXTS = frozenset({'.pdf'})
+_SUPPORTED_EXTS = frozenset({'.pdf', '.docx', '.doc'})
+
+# 批量导入时生成缩略图的最大进程数
+MAX_THUMBNAIL_WORKERS = 4
+
+# 计算文件指纹时读取的首尾字节数
+FINGERPRINT_CHUNK_SIZE = 64 * 1024
+
+
+def _compute_fingerprint(file_path: Path) -> str:
+    """
+    计算文件内容指纹
+    
+    只读取文件大小及首尾各64KB，耗时与文件大小无关。
+    PDF的增量保存总会改写文件尾部的xref，因此内容变化会反映在指纹中。
+    """
+    size = file_path.stat().st_size
+    digest = hashlib.blake2b(str(size).encode("ascii"), digest_size=16)
+    with open(file_path, "rb") as f:
+        digest.update(f.read(FINGERPRINT_CHUNK_SIZE))
+        if size > FINGERPRINT_CHUNK_SIZE:
+            f.seek(max(FINGERPRINT_CHUNK_SIZE, size - FINGERPRINT_CHUNK_SIZE))
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _render_pdf_thumbnail(
+    source: Union[Path, "fitz.Document"], width: int, height: int
+) -> bytes:
+    """
+    从PDF第一页生成缩略图（模块级函数，可在子进程中运行）
+    
+    Args:
+        source: PDF文件路径，或已打开的fitz文档（不会被关闭）
+        width: 缩略图最大宽度
+        height: 缩略图最大高度
+    """
+    if isinstance(source, fitz.Document):
+        return _render_first_page(source, width, height)
+    
+    try:
+        doc = fitz.open(str(source))
+        try:
+            return _render_first_page(doc, width, height)
+        finally:
+            doc.close()
+    except FileManagerError:
+        raise
+    except fitz.FileDataError as e:
+        raise FileManagerError(f"无法打开PDF文件: {e}")
+    except Exception as e:
+        raise FileManagerError(f"生成缩略图失败: {e}")
+
+
+def _render_first_page(doc: "fitz.Document", width: int, height: int) -> bytes:
+    """将已打开文档的第一页渲染为PNG缩略图"""
+    if doc.page_count == 0:
+        raise FileManagerError("PDF文档没有页面")
+    
+    page = doc[0]  # 第一页
+    
+    # 计算缩放比例以适应缩略图尺寸
+    rect = page.rect
+    scale_x = width / rect.width
+    scale_y = height / rect.height
+    scale = min(scale_x, scale_y)
+    
+    mat = fitz.Matrix(scale, scale)
+    pix = page.get_pixmap(matrix=mat)
+    return pix.tobytes("png")
+
+
+def _render_word_thumbnail(word_path: Path, width: int, height: int) -> bytes:
+    """从Word文档生成缩略图（模块级函数，可在子进程中运行）"""
+    try:
+        _validate_docx(word_path)
+        
+        # 在内存中排版第一页（简化版本）
+        pdf_doc = fitz.open()
+        
+        # 流式提取前20个非空段落，读够即停止解析
+        full_text = []
+        for text in _iter_docx_paragraphs(word_path):
+            if text.strip():
+                full_text.append(text)
+                if len(full_text) >= 20:
+                    break
+        
+        # 创建第一页
+        page = pdf_doc.new_page(width=595, height=842)
+        
+        if full_text:
+            font = _helv_font()
+            writer = fitz.TextWriter(page.rect)
+            y_pos = 50
+            for text in full_text:
+                if y_pos > 750:
+                    break
+                # 截断长文本
+                display_text = text[:80] + "..." if len(text) > 80 else text
+                writer.append((50, y_pos), display_text, font=font, fontsize=11)
+                y_pos += 18
+            writer.write_text(page)
+        
+        # 直接从内存中的文档渲染，无需保存临时PDF再重新打开
+        try:
+            return _render_pdf_thumbnail(pdf_doc, width, height)
+        finally:
+            pdf_doc.close()
+    except Exception as e:
+        raise FileManagerError(f"生成Word缩略图失败: {e}")
+
+
+def _render_thumbnail_or_none(doc_path: Path, width: int, height: int) -> Optional[bytes]:
+    """生成缩略图，失败时返回None（供批量导入的工作进程使用）"""
+    try:
+        if doc_path.suffix.lower() in _PDF_EXTS:
+            return _render_pdf_thumbnail(doc_path, width, height)
+        return _render_word_thumbnail(doc_path, width, height)
+    except Exception:
+        return None
+
+
 class IFileManager(ABC):
     """文件管理器接口"""
     
@@ -107,14 +242,49 @@ class FileManager(IFileManager):
     THUMBNAIL_WIDTH = 150
     THUMBNAIL_HEIGHT = 200
     
-    def __init__(self, db: Database):
+    # 内存中共享的缩略图字节数（按文档数）
+    THUMBNAIL_MEMORY_SIZE = 256
+    
+    def __init__(self, db: Database, thumb_cache_dir: Optional[Path] = None):
         """
         初始化文件管理器
         
         Args:
             db: 数据库实例
+            thumb_cache_dir: 缩略图缓存目录，为None时不缓存
         """
         self._db = db
+        self._thumb_cache_dir = thumb_cache_dir
+        # 后台缩略图生成（延迟导入时使用，首次使用时创建）
+        self._thumbnail_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_thumbnails: List[Future] = []
+        # 当前打开的PDF句柄 {(线程ID, 路径): [文档, 引用计数]}
+        self._open_docs: Dict[Tuple[int, Path], list] = {}
+        # 标签名到标签的缓存（只缓存已存在的标签）
+        self._tag_cache: Dict[str, Tag] = {}
+        # 最近列出的缩略图 {文档ID: 缩略图字节}，重复列出时共享同一对象
+        self._thumb_mem: "OrderedDict[str, bytes]" = OrderedDict()
+    
+    def _get_tag_cached(self, name: str) -> Optional[Tag]:
+        """
+        按名称查找标签，命中缓存时不访问数据库
+        
+        Args:
+            name: 标签名称
+            
+        Returns:
+            标签，不存在时返回None
+        """
+        tag = self._tag_cache.get(name)
+        if tag is None:
+            tag = self._db.get_tag_by_name(name)
+            if tag is not None:
+                self._tag_cache[name] = tag
+        return tag
+    
+    def clear_tag_cache(self) -> None:
+        """清空标签缓存（标签在外部被删除或重命名后调用）"""
+        self._tag_cache.clear()
     
     def get_documents(
         self, 
@@ -133,16 +303,36 @@ class FileManager(IFileManager):
         """
         if tag:
             # 按标签筛选
-            tag_obj = self._db.get_tag_by_name(tag)
+            tag_obj = self._get_tag_cached(tag)
             if not tag_obj:
                 return []
             docs = self._db.get_documents_by_tag(tag_obj.id)
             # 如果同时指定了folder_id，进一步筛选
             if folder_id is not None:
                 docs = [d for d in docs if d.folder_id == folder_id]
-            return docs
         else:
-            return self._db.get_documents(folder_id=folder_id, include_deleted=False)
+            docs = self._db.get_documents(folder_id=folder_id, include_deleted=False)
+        self._share_thumbnails(docs)
+        return docs
+    
+    def _share_thumbnails(self, docs: List[DocumentEntry]) -> None:
+        """
+        用已缓存的缩略图对象替换内容相同的新读取字节
+        
+        重复列出同一批文档时，界面持有的缩略图保持为同一对象，
+        新读取的副本随即释放。
+        """
+        for doc in docs:
+            if doc.thumbnail is None:
+                continue
+            cached = self._thumb_mem.get(doc.id)
+            if cached is not None and cached == doc.thumbnail:
+                doc.thumbnail = cached
+                self._thumb_mem.move_to_end(doc.id)
+            else:
+                self._thumb_mem[doc.id] = doc.thumbnail
+                if len(self._thumb_mem) > self.THUMBNAIL_MEMORY_SIZE:
+                    self._thumb_mem.popitem(last=False)
     
     def search_documents(self, keyword: str) -> List[DocumentEntry]:
         """
@@ -223,7 +413,7 @@ class FileManager(IFileManager):
             raise DocumentNotFoundError(f"文档不存在: {doc_id}")
         
         # 查找或创建标签
-        tag = self._db.get_tag_by_name(tag_name)
+        tag = self._get_tag_cached(tag_name)
         if not tag:
             tag = Tag(
                 id=str(uuid.uuid4()),
@@ -231,6 +421,7 @@ class FileManager(IFileManager):
                 color="#808080"
             )
             self._db.add_tag(tag)
+            self._tag_cache[tag_name] = tag
         
         # 添加文档标签关联
         self._db.add_document_tag(doc_id, tag.id)
@@ -251,7 +442,7 @@ class FileManager(IFileManager):
         if not doc:
             raise DocumentNotFoundError(f"文档不存在: {doc_id}")
         
-        tag = self._db.get_tag_by_name(tag_name)
+        tag = self._get_tag_cached(tag_name)
         if not tag:
             raise TagNotFoundError(f"标签不存在: {tag_name}")
         
@@ -274,94 +465,109 @@ class FileManager(IFileManager):
         """
         suffix = doc_path.suffix.lower()
         
-        if suffix == '.pdf':
-            return self._generate_pdf_thumbnail(doc_path)
-        elif suffix in ('.docx', '.doc'):
-            return self._generate_word_thumbnail(doc_path)
-        else:
+        if suffix not in _SUPPORTED_EXTS:
             raise FileManagerError(f"不支持的文件格式: {suffix}")
+        
+        fingerprint = _compute_fingerprint(doc_path) if self._thumb_cache_dir else None
+        return self._generate_thumbnail(doc_path, fingerprint)
     
-    def _generate_pdf_thumbnail(self, pdf_path: Path) -> bytes:
-        """生成PDF缩略图"""
-        try:
-            doc = fitz.open(str(pdf_path))
-            if doc.page_count == 0:
-                doc.close()
-                raise FileManagerError("PDF文档没有页面")
-            
-            page = doc[0]  # 第一页
-            
-            # 计算缩放比例以适应缩略图尺寸
-            rect = page.rect
-            scale_x = self.THUMBNAIL_WIDTH / rect.width
-            scale_y = self.THUMBNAIL_HEIGHT / rect.height
-            scale = min(scale_x, scale_y)
-            
-            mat = fitz.Matrix(scale, scale)
-            pix = page.get_pixmap(matrix=mat)
-            thumbnail_data = pix.tobytes("png")
-            
-            doc.close()
-            return thumbnail_data
-        except fitz.FileDataError as e:
-            raise FileManagerError(f"无法打开PDF文件: {e}")
-        except Exception as e:
-            raise FileManagerError(f"生成缩略图失败: {e}")
+    def _generate_thumbnail(self, doc_path: Path, fingerprint: Optional[str]) -> bytes:
+        """生成缩略图，提供文件指纹时优先读写缓存"""
+        cached = self._read_cached_thumbnail(fingerprint)
+        if cached is not None:
+            return cached
+        
+        if doc_path.suffix.lower() in _PDF_EXTS:
+            thumbnail = self._generate_pdf_thumbnail(doc_path)
+        else:
+            thumbnail = self._generate_word_thumbnail(doc_path)
+        
+        self._write_cached_thumbnail(fingerprint, thumbnail)
+        return thumbnail
     
-    def _generate_word_thumbnail(self, word_path: Path) -> bytes:
-        """生成Word文档缩略图"""
-        from docx import Document as DocxDocument
-        import tempfile
+    def _thumbnail_cache_path(self, fingerprint: Optional[str]) -> Optional[Path]:
+        """
+        获取缩略图缓存文件路径
         
+        缓存键由文件内容指纹和缩略图尺寸组成，文件内容变化后自动失效，
+        相同内容的文件共享同一缓存。
+        """
+        if self._thumb_cache_dir is None or fingerprint is None:
+            return None
+        return self._thumb_cache_dir / (
+            f"{fingerprint}_{self.THUMBNAIL_WIDTH}x{self.THUMBNAIL_HEIGHT}.png"
+        )
+    
+    def _read_cached_thumbnail(self, fingerprint: Optional[str]) -> Optional[bytes]:
+        """读取缓存的缩略图，未命中时返回None"""
+        cache_path = self._thumbnail_cache_path(fingerprint)
+        if cache_path is None:
+            return None
         try:
-            # 打开Word文档
-            docx_doc = DocxDocument(str(word_path))
-            
-            # 创建临时PDF
-            temp_pdf = Path(tempfile.gettempdir()) / f"{word_path.stem}_thumb.pdf"
-            
-            # 转换为PDF（简化版本）
-            pdf_doc = fitz.open()
-            
-            # 提取文本
-            full_text = []
-            for para in docx_doc.paragraphs:
-                if para.text.strip():
-                    full_text.append(para.text)
-            
-            # 创建第一页
-            page = pdf_doc.new_page(width=595, height=842)
-            
-            if full_text:
-                y_pos = 50
-                for i, text in enumerate(full_text[:20]):  # 只取前20段
-                    if y_pos > 750:
-                        break
-                    # 截断长文本
-                    display_text = text[:80] + "..." if len(text) > 80 else text
-                    page.insert_text(
-                        (50, y_pos),
-                        display_text,
-                        fontsize=11,
-                        fontname="helv"
-                    )
-                    y_pos += 18
-            
-            pdf_doc.save(str(temp_pdf))
-            pdf_doc.close()
-            
-            # 从临时PDF生成缩略图
-            thumbnail_data = self._generate_pdf_thumbnail(temp_pdf)
-            
-            # 删除临时文件
+            return cache_path.read_bytes()
+        except OSError:
+            return None
+    
+    def _write_cached_thumbnail(self, fingerprint: Optional[str], thumbnail: bytes) -> None:
+        """写入缩略图缓存，写入失败时忽略"""
+        cache_path = self._thumbnail_cache_path(fingerprint)
+        if cache_path is None:
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+            temp_path.write_bytes(thumbnail)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            pass
+    
+    @contextmanager
+    def _doc_ctx(self, pdf_path: Path) -> Iterator["fitz.Document"]:
+        """
+        获取PDF文档句柄的上下文管理器
+        
+        嵌套使用时复用外层已打开的句柄，最外层退出时关闭，
+        使元数据读取、缩略图生成等连续操作只解析一次xref。
+        句柄按线程隔离，后台缩略图线程不会与调用方共享文档对象。
+        
+        Raises:
+            FileManagerError: 无法打开PDF文件
+        """
+        key = (threading.get_ident(), pdf_path)
+        entry = self._open_docs.get(key)
+        if entry is not None:
+            entry[1] += 1
             try:
-                os.remove(temp_pdf)
-            except:
-                pass
-            
-            return thumbnail_data
+                yield entry[0]
+            finally:
+                entry[1] -= 1
+            return
+        
+        try:
+            doc = fitz.open(str(pdf_path), filetype="pdf")
         except Exception as e:
-            raise FileManagerError(f"生成Word缩略图失败: {e}")
+            raise FileManagerError(f"无法打开PDF文件: {e}")
+        
+        self._open_docs[key] = [doc, 1]
+        try:
+            yield doc
+        finally:
+            del self._open_docs[key]
+            doc.close()
+    
+    def _generate_pdf_thumbnail(self, pdf_path: Path) -> bytes:
+        """生成PDF缩略图"""
+        with self._doc_ctx(pdf_path) as doc:
+            try:
+                return _render_pdf_thumbnail(doc, self.THUMBNAIL_WIDTH, self.THUMBNAIL_HEIGHT)
+            except FileManagerError:
+                raise
+            except Exception as e:
+                raise FileManagerError(f"生成缩略图失败: {e}")
+    
+    def _generate_word_thumbnail(self, word_path: Path) -> bytes:
+        """生成Word文档缩略图"""
+        return _render_word_thumbnail(word_path, self.THUMBNAIL_WIDTH, self.THUMBNAIL_HEIGHT)
     
     def add_bookmark(self, doc_id: str, page_num: int, title: str) -> Bookmark:
         """
@@ -415,13 +621,20 @@ class FileManager(IFileManager):
     
     # ============== 辅助方法 ==============
     
-    def import_document(self, file_path: Path, folder_id: Optional[str] = None) -> DocumentEntry:
+    def import_document(
+        self,
+        file_path: Path,
+        folder_id: Optional[str] = None,
+        defer_thumbnail: bool = False,
+    ) -> DocumentEntry:
         """
         导入文档到文档库
         
         Args:
             file_path: 文档文件路径
             folder_id: 目标文件夹ID
+            defer_thumbnail: 是否在后台生成缩略图。为True时立即返回
+                thumbnail为None的条目，缩略图生成后写回数据库和该条目
             
         Returns:
             创建的文档条目
@@ -429,24 +642,176 @@ class FileManager(IFileManager):
         Raises:
             FileManagerError: 导入失败
         """
-        if not file_path.exists():
-            raise FileManagerError(f"文件不存在: {file_path}")
+        self._check_importable(file_path)
+        fingerprint = _compute_fingerprint(file_path)
         
-        suffix = file_path.suffix.lower()
-        if suffix not in ('.pdf', '.docx', '.doc'):
-            raise FileManagerError(f"不支持的文件格式: {suffix}")
+        if defer_thumbnail:
+            doc = self._create_document_entry(file_path, folder_id, None, fingerprint)
+            self._db.add_document(doc)
+            self._schedule_thumbnail(doc)
+            return doc
         
         # 生成缩略图
         try:
-            thumbnail = self.generate_thumbnail(file_path)
+            thumbnail = self._generate_thumbnail(file_path, fingerprint)
         except:
             thumbnail = None
         
+        doc = self._create_document_entry(file_path, folder_id, thumbnail, fingerprint)
+        self._db.add_document(doc)
+        return doc
+    
+    def _schedule_thumbnail(self, doc: DocumentEntry) -> None:
+        """在后台线程中生成缩略图并写回"""
+        if self._thumbnail_executor is None:
+            self._thumbnail_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="thumbnail"
+            )
+        
+        def task() -> None:
+            try:
+                thumbnail = self._generate_thumbnail(doc.path, doc.fingerprint)
+            except FileManagerError:
+                return
+            doc.thumbnail = thumbnail
+            self._db.update_document_thumbnail(doc.id, thumbnail)
+        
+        self._pending_thumbnails.append(self._thumbnail_executor.submit(task))
+    
+    def wait_for_thumbnails(self, timeout: Optional[float] = None) -> None:
+        """
+        等待后台缩略图生成完成
+        
+        Args:
+            timeout: 最长等待秒数，为None时一直等待
+        """
+        pending = self._pending_thumbnails
+        self._pending_thumbnails = []
+        _, not_done = wait(pending, timeout=timeout)
+        self._pending_thumbnails.extend(not_done)
+    
+    def get_document_metadata(self, doc_path: Path) -> dict:
+        """
+        读取文档元数据
+        
+        只读取PDF的文档信息和页数，不加载页面内容，适合导入和列表等
+        不需要缩略图的场景。
+        
+        Args:
+            doc_path: 文档路径
+            
+        Returns:
+            {"title": str, "page_count": Optional[int], "size": int, "metadata": dict}
+            Word文档的page_count为None
+            
+        Raises:
+            FileManagerError: 文件不存在、格式不支持或无法打开
+        """
+        self._check_importable(doc_path)
+        
+        result = {
+            "title": doc_path.stem,
+            "page_count": None,
+            "size": doc_path.stat().st_size,
+            "metadata": {},
+        }
+        if doc_path.suffix.lower() not in _PDF_EXTS:
+            return result
+        
+        with self._doc_ctx(doc_path) as doc:
+            metadata = dict(doc.metadata or {})
+            result["page_count"] = doc.page_count
+        
+        result["title"] = metadata.get("title") or doc_path.stem
+        result["metadata"] = metadata
+        return result
+    
+    def import_documents(
+        self, file_paths: List[Path], folder_id: Optional[str] = None
+    ) -> List[DocumentEntry]:
+        """
+        批量导入文档到文档库
+        
+        缩略图在进程池中并行生成，全部完成后再写入数据库。
+        单个文档时直接串行处理，避免创建进程的开销。
+        
+        Args:
+            file_paths: 文档文件路径列表
+            folder_id: 目标文件夹ID
+            
+        Returns:
+            创建的文档条目列表，顺序与file_paths一致
+            
+        Raises:
+            FileManagerError: 任一文件不存在或格式不支持
+        """
+        for file_path in file_paths:
+            self._check_importable(file_path)
+        
+        if len(file_paths) <= 1:
+            return [self.import_document(file_path, folder_id) for file_path in file_paths]
+        
+        fingerprints = [_compute_fingerprint(file_path) for file_path in file_paths]
+        thumbnails = self._generate_thumbnails_parallel(file_paths, fingerprints)
+        
+        docs = []
+        for file_path, thumbnail, fingerprint in zip(file_paths, thumbnails, fingerprints):
+            doc = self._create_document_entry(file_path, folder_id, thumbnail, fingerprint)
+            self._db.add_document(doc)
+            docs.append(doc)
+        return docs
+    
+    def _generate_thumbnails_parallel(
+        self, file_paths: List[Path], fingerprints: List[str]
+    ) -> List[Optional[bytes]]:
+        """在进程池中生成缩略图，进程池不可用时（如Android）退回串行生成"""
+        thumbnails = [self._read_cached_thumbnail(f) for f in fingerprints]
+        missing = [p for p, thumbnail in zip(file_paths, thumbnails) if thumbnail is None]
+        if not missing:
+            return thumbnails
+        
+        width, height = self.THUMBNAIL_WIDTH, self.THUMBNAIL_HEIGHT
+        max_workers = min(os.cpu_count() or 1, MAX_THUMBNAIL_WORKERS, len(missing))
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                rendered = list(executor.map(
+                    _render_thumbnail_or_none,
+                    missing,
+                    [width] * len(missing),
+                    [height] * len(missing),
+                ))
+        except (OSError, NotImplementedError, ImportError):
+            rendered = [_render_thumbnail_or_none(p, width, height) for p in missing]
+        
+        rendered_iter = iter(rendered)
+        for i, fingerprint in enumerate(fingerprints):
+            if thumbnails[i] is None:
+                thumbnails[i] = next(rendered_iter)
+                if thumbnails[i] is not None:
+                    self._write_cached_thumbnail(fingerprint, thumbnails[i])
+        return thumbnails
+    
+    def _check_importable(self, file_path: Path) -> None:
+        """检查文件是否可以导入"""
+        if not file_path.exists():
+            raise FileManagerError(f"文件不存在: {file_path}")
+        
+        suffix = file_path.suffix.lower()
+        if suffix not in _SUPPORTED_EXTS:
+            raise FileManagerError(f"不支持的文件格式: {suffix}")
+    
+    def _create_document_entry(
+        self,
+        file_path: Path,
+        folder_id: Optional[str],
+        thumbnail: Optional[bytes],
+        fingerprint: Optional[str] = None,
+    ) -> DocumentEntry:
+        """创建文档条目"""
         # 确定文件类型
-        file_type = "pdf" if suffix == ".pdf" else "docx"
+        file_type = "pdf" if file_path.suffix.lower() in _PDF_EXTS else "docx"
         
-        # 创建文档条目
-        doc = DocumentEntry(
+        return DocumentEntry(
             id=str(uuid.uuid4()),
             path=file_path,
             title=file_path.stem,
@@ -457,11 +822,9 @@ class FileManager(IFileManager):
             created_at=datetime.now(),
             modified_at=datetime.now(),
             is_deleted=False,
-            tags=[]
+            tags=[],
+            fingerprint=fingerprint,
         )
-        
-        self._db.add_document(doc)
-        return doc
     
     def get_folders(self, parent_id: Optional[str] = None) -> List[Folder]:
         """
@@ -542,9 +905,7 @@ class FileManager(IFileManager):
         Returns:
             已删除的文档列表
         """
-        # 使用数据库的include_deleted参数获取所有文档，然后筛选已删除的
-        all_docs = self._db.get_documents(folder_id=None, include_deleted=True)
-        return [d for d in all_docs if d.is_deleted]
+        return self._db.get_deleted_documents()
     
     def restore_document(self, doc_id: str) -> None:
         """
@@ -6,7 +6,22 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+from io import BytesIO
+from typing import Callable, Dict, List, Optional, Tuple
+import asyncio
+import os
+import sys
+import threading
+import time
+import unicodedata
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
 
 from .models import (
     ConversionDirection,
@@ -17,6 +32,40 @@ from .models import (
 )
 from .chinese_converter import IChineseConverter, ChineseConverter
 from .translation_service import ITranslationService, MockTranslationService
+from .translation_cache import PersistentTranslationCache
+
+
+def _default_ocr_concurrency() -> int:
+    """OCR 并发数：环境变量 OCR_CONCURRENCY，未设置时为 CPU 核数"""
+    try:
+        value = int(os.environ.get("OCR_CONCURRENCY", "0"))
+    except ValueError:
+        value = 0
+    return value if value > 0 else (os.cpu_count() or 1)
+
+
+# 未激活（无配置）时批量 OCR 的最大并发数
+OCR_CONCURRENCY = _default_ocr_concurrency()
+
+# 操作类型对应的翻译/转换方向
+_TRANSLATION_DIRECTIONS = {
+    MagnifierAction.TRANSLATE_EN_ZH: TranslationDirection.EN_TO_ZH,
+    MagnifierAction.TRANSLATE_ZH_EN: TranslationDirection.ZH_TO_EN,
+}
+_CONVERSION_DIRECTIONS = {
+    MagnifierAction.CONVERT_T2S: ConversionDirection.TRADITIONAL_TO_SIMPLIFIED,
+    MagnifierAction.CONVERT_S2T: ConversionDirection.SIMPLIFIED_TO_TRADITIONAL,
+}
+
+
+def _normalize_for_cache(text: str) -> str:
+    """
+    生成结果缓存的键：折叠空白并做 NFC 规范化
+
+    同一句话因选区略有不同，OCR 结果常只差首尾/中间空白或 Unicode 组合形式，
+    规范化后可命中同一缓存条目。键经 sys.intern 驻留以加快字典比较。
+    """
+    return sys.intern(unicodedata.normalize("NFC", " ".join(text.split())))
 
 
 class IOCREngine(ABC):
@@ -36,6 +85,19 @@ class IOCREngine(ABC):
         """
         pass
     
+    async def extract_text_async(
+        self,
+        image_data: bytes,
+        region: Optional[Tuple[float, float, float, float]] = None
+    ) -> str:
+        """
+        异步提取文字
+        
+        默认在线程池中执行 extract_text；OCR 引擎通常调用外部进程或
+        原生库，执行期间释放 GIL，多个区域可以并行识别。
+        """
+        return await asyncio.to_thread(self.extract_text, image_data, region)
+    
     @abstractmethod
     def is_available(self) -> bool:
         """检查 OCR 引擎是否可用"""
@@ -133,11 +195,22 @@ class Magnifier(IMagnifier):
     - 执行翻译或繁简转换操作
     """
     
+    # 翻译/转换结果缓存容量（条）
+    RESULT_CACHE_SIZE = 4096
+    
+    # 翻译服务可用性检查结果的有效期（秒）
+    AVAILABILITY_TTL = 30.0
+    
+    # 批量流水线：已识别文字累积到该条数或等待满该时间（秒）即提交一批
+    PIPELINE_BATCH_MIN = 10
+    PIPELINE_FLUSH_INTERVAL = 0.05
+    
     def __init__(
         self,
         translation_service: Optional[ITranslationService] = None,
         chinese_converter: Optional[IChineseConverter] = None,
-        ocr_engine: Optional[IOCREngine] = None
+        ocr_engine: Optional[IOCREngine] = None,
+        translation_cache: Optional[PersistentTranslationCache] = None
     ):
         """
         初始化放大镜
@@ -146,10 +219,12 @@ class Magnifier(IMagnifier):
             translation_service: 翻译服务实例
             chinese_converter: 繁简转换器实例
             ocr_engine: OCR 引擎实例
+            translation_cache: 持久化翻译缓存，为 None 时只使用内存缓存
         """
         self._translation = translation_service or MockTranslationService()
         self._converter = chinese_converter or ChineseConverter()
         self._ocr = ocr_engine or MockOCREngine()
+        self._translation_cache = translation_cache
         
         self._config: Optional[MagnifierConfig] = None
         self._current_position: Tuple[float, float] = (0.0, 0.0)
@@ -158,6 +233,30 @@ class Magnifier(IMagnifier):
         
         # 用于存储当前页面的图像数据（由外部设置）
         self._page_image_data: Optional[bytes] = None
+        # 解码后的页面图像，首次使用时解码，用于在 OCR 前裁剪区域
+        self._page_image = None
+        self._page_image_decoded: bool = False
+        
+        # 翻译/转换结果 LRU 缓存 {(操作, 规范化文本): 结果文本}，只缓存成功的结果
+        self._already_translated: "OrderedDict[Tuple[MagnifierAction, str], str]" = OrderedDict()
+        
+        # 操作分派表 {操作: 处理函数}，处理函数返回 (结果文本, 是否成功, 错误信息)
+        self._dispatch: Dict[MagnifierAction, Callable[[str], Tuple[str, bool, Optional[str]]]] = {
+            MagnifierAction.MAGNIFY: self._do_magnify,
+        }
+        for action, direction in _TRANSLATION_DIRECTIONS.items():
+            self._dispatch[action] = partial(self._do_translate, direction=direction)
+        for action, direction in _CONVERSION_DIRECTIONS.items():
+            self._dispatch[action] = partial(self._do_convert, direction=direction)
+        
+        # 可用操作列表缓存，翻译服务可用性变化或过期时重建
+        self._actions_cache: Optional[List[MagnifierAction]] = None
+        self._actions_cache_avail: Optional[bool] = None
+        self._actions_checked_at: float = 0.0
+        
+        # 批量 OCR 线程池，按配置的并发上限在激活时创建
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_workers: int = 0
     
     @property
     def is_active(self) -> bool:
@@ -182,6 +281,27 @@ class Magnifier(IMagnifier):
             image_data: 页面图像数据
         """
         self._page_image_data = image_data
+        # 只在需要像素时解码（见 page_image），翻页时不做额外工作
+        self._page_image = None
+        self._page_image_decoded = False
+    
+    @property
+    def page_image(self):
+        """
+        解码后的当前页面图像（PIL.Image）
+        
+        每页只解码一次；未安装 Pillow 或图像无法解码时为 None。
+        """
+        if not self._page_image_decoded:
+            self._page_image_decoded = True
+            if Image is not None and self._page_image_data:
+                try:
+                    image = Image.open(BytesIO(self._page_image_data))
+                    image.load()
+                    self._page_image = image
+                except Exception:
+                    self._page_image = None
+        return self._page_image
     
     def activate(self, config: MagnifierConfig) -> None:
         """
@@ -195,6 +315,17 @@ class Magnifier(IMagnifier):
         self._config = config
         self._is_active = True
         self._current_region = None
+        self._get_executor()
+        
+        # 后台预热翻译服务，首次翻译无需等待连接建立，也不阻塞界面
+        threading.Thread(target=self.prewarm, daemon=True).start()
+    
+    def prewarm(self) -> None:
+        """预热翻译服务（建立网络连接等）"""
+        try:
+            self._translation.prewarm()
+        except Exception:
+            pass
     
     def deactivate(self) -> None:
         """
@@ -204,6 +335,36 @@ class Magnifier(IMagnifier):
         """
         self._is_active = False
         self._current_region = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        
+        # 后台清理过期的持久化翻译缓存
+        if self._translation_cache is not None:
+            threading.Thread(target=self._prune_translation_cache, daemon=True).start()
+    
+    def _prune_translation_cache(self) -> None:
+        """清理过期的持久化翻译缓存"""
+        try:
+            self._translation_cache.prune()
+        except Exception:
+            pass
+    
+    def _concurrency_limit(self) -> int:
+        """当前的 OCR/翻译并发上限"""
+        if self._config is not None and self._config.concurrency_limit > 0:
+            return self._config.concurrency_limit
+        return OCR_CONCURRENCY
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """获取批量 OCR 线程池，并发上限变化时重建"""
+        limit = self._concurrency_limit()
+        if self._executor is None or self._executor_workers != limit:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(max_workers=limit, thread_name_prefix="magnifier-ocr")
+            self._executor_workers = limit
+        return self._executor
     
     def move_to(self, x: float, y: float) -> None:
         """
@@ -247,13 +408,13 @@ class Magnifier(IMagnifier):
         
         Requirements: 5.3
         """
-        # 规范化坐标（确保 min < max）
-        min_x = min(x1, x2)
-        min_y = min(y1, y2)
-        max_x = max(x1, x2)
-        max_y = max(y1, y2)
+        # 规范化坐标（确保 min < max），拖动时每帧调用，用比较交换代替 min/max
+        if x1 > x2:
+            x1, x2 = x2, x1
+        if y1 > y2:
+            y1, y2 = y2, y1
         
-        self._current_region = (min_x, min_y, max_x, max_y)
+        self._current_region = (x1, y1, x2, y2)
         return self._current_region
     
     def extract_text_from_region(self, region: Tuple[float, float, float, float]) -> str:
@@ -271,7 +432,46 @@ class Magnifier(IMagnifier):
         if not self._ocr.is_available():
             return ""
         
-        return self._ocr.extract_text(self._page_image_data or b"", region)
+        return self._ocr.extract_text(*self._ocr_input(region))
+    
+    async def extract_text_from_region_async(self, region: Tuple[float, float, float, float]) -> str:
+        """
+        异步从选中区域提取文字（OCR）
+        
+        Args:
+            region: 区域坐标 (x1, y1, x2, y2)
+        
+        Returns:
+            提取的文字
+        """
+        if not self._ocr.is_available():
+            return ""
+        
+        return await self._ocr.extract_text_async(*self._ocr_input(region))
+    
+    def _ocr_input(
+        self,
+        region: Optional[Tuple[float, float, float, float]]
+    ) -> Tuple[bytes, Optional[Tuple[float, float, float, float]]]:
+        """
+        准备交给 OCR 引擎的图像和区域
+        
+        页面图像已解码时只把区域内的像素编码为 PNG 交给引擎，
+        避免引擎每次重新解码并扫描整页；否则传入整页图像和区域坐标。
+        
+        Returns:
+            (图像数据, 区域坐标)，已裁剪时区域为 None
+        """
+        page_image = self.page_image if region is not None else None
+        if page_image is not None:
+            width, height = page_image.size
+            x1, y1, x2, y2 = (int(round(v)) for v in region)
+            box = (max(0, x1), max(0, y1), min(width, x2), min(height, y2))
+            if box[0] < box[2] and box[1] < box[3]:
+                buffer = BytesIO()
+                page_image.crop(box).save(buffer, "PNG")
+                return buffer.getvalue(), None
+        return self._page_image_data or b"", region
     
     def perform_action(self, action: MagnifierAction, region: Tuple[float, float, float, float]) -> MagnifierResult:
         """
@@ -284,6 +484,10 @@ class Magnifier(IMagnifier):
         Returns:
             操作结果
         
+        Note:
+            MAGNIFY 的结果就是识别出的文字（界面显示为"识别结果"），因此同样
+            需要 OCR；单纯的放大浏览走 get_magnified_region，不经过 OCR。
+        
         Requirements: 5.6, 5.7
         """
         # 1. OCR 提取文字
@@ -300,44 +504,10 @@ class Magnifier(IMagnifier):
             )
         
         # 2. 根据操作类型处理
-        result_text = ""
-        error_msg = None
-        success = True
-        
         try:
-            if action == MagnifierAction.TRANSLATE_EN_ZH:
-                # 英译汉
-                result = self._translation.translate(text, TranslationDirection.EN_TO_ZH)
-                result_text = result.translated
-                success = result.success
-                error_msg = result.error_message
-                
-            elif action == MagnifierAction.TRANSLATE_ZH_EN:
-                # 汉译英
-                result = self._translation.translate(text, TranslationDirection.ZH_TO_EN)
-                result_text = result.translated
-                success = result.success
-                error_msg = result.error_message
-                
-            elif action == MagnifierAction.CONVERT_T2S:
-                # 繁转简
-                result_text = self._converter.convert(text, ConversionDirection.TRADITIONAL_TO_SIMPLIFIED)
-                
-            elif action == MagnifierAction.CONVERT_S2T:
-                # 简转繁
-                result_text = self._converter.convert(text, ConversionDirection.SIMPLIFIED_TO_TRADITIONAL)
-                
-            elif action == MagnifierAction.MAGNIFY:
-                # 仅放大，返回原文
-                result_text = text
-                
-            else:
-                success = False
-                error_msg = f"不支持的操作类型: {action}"
-                
+            result_text, success, error_msg = self._resolve(action, text)
         except Exception as e:
-            success = False
-            error_msg = str(e)
+            result_text, success, error_msg = "", False, str(e)
         
         return MagnifierResult(
             action=action,
@@ -348,25 +518,335 @@ class Magnifier(IMagnifier):
             region=region
         )
     
+    def perform_actions_batch(
+        self,
+        action: MagnifierAction,
+        regions: List[Tuple[float, float, float, float]]
+    ) -> List[MagnifierResult]:
+        """
+        对多个区域执行同一操作
+        
+        区域的 OCR 在线程池中并发执行（并发数不超过配置的 concurrency_limit），
+        识别与翻译流水线化：已识别的文字每累积 PIPELINE_BATCH_MIN 条或等待满
+        PIPELINE_FLUSH_INTERVAL 秒即提交一次 translate_batch/convert_batch，
+        其余区域的 OCR 同时继续进行。相同的文字只处理一次。
+        
+        Args:
+            action: 操作类型
+            regions: 区域坐标列表
+        
+        Returns:
+            与区域顺序一致的操作结果列表
+        """
+        executor = self._get_executor()
+        futures = {
+            executor.submit(self.extract_text_from_region, region): index
+            for index, region in enumerate(regions)
+        }
+        texts = [""] * len(regions)
+        outcomes: Dict[str, Tuple[str, bool, Optional[str]]] = {}
+        pending: List[str] = []
+        pending_since = 0.0
+        remaining = set(futures)
+        
+        while remaining:
+            timeout = self.PIPELINE_FLUSH_INTERVAL
+            if pending:
+                timeout = max(0.0, pending_since + timeout - time.monotonic())
+            done, remaining = wait(remaining, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                text = future.result()
+                texts[futures[future]] = text
+                if text:
+                    if not pending:
+                        pending_since = time.monotonic()
+                    pending.append(text)
+            if pending and (
+                not remaining
+                or len(pending) >= self.PIPELINE_BATCH_MIN
+                or time.monotonic() - pending_since >= self.PIPELINE_FLUSH_INTERVAL
+            ):
+                self._process_pending(action, pending, outcomes)
+                pending = []
+        
+        return self._build_batch_results(action, regions, texts, outcomes)
+    
+    async def perform_actions_batch_async(
+        self,
+        action: MagnifierAction,
+        regions: List[Tuple[float, float, float, float]]
+    ) -> List[MagnifierResult]:
+        """
+        对多个区域执行同一操作（异步版本）
+        
+        生产者并发执行各区域的 OCR（并发数不超过配置的 concurrency_limit），
+        把 (序号, 文字) 放入队列；消费者每累积 PIPELINE_BATCH_MIN 条或等待满
+        PIPELINE_FLUSH_INTERVAL 秒即在线程中提交一批翻译/转换，与 OCR 重叠执行。
+        
+        Args:
+            action: 操作类型
+            regions: 区域坐标列表
+        
+        Returns:
+            与区域顺序一致的操作结果列表
+        """
+        semaphore = asyncio.Semaphore(self._concurrency_limit())
+        queue: "asyncio.Queue[Tuple[int, str]]" = asyncio.Queue()
+        
+        async def produce(index: int, region: Tuple[float, float, float, float]) -> None:
+            async with semaphore:
+                text = await self.extract_text_from_region_async(region)
+            await queue.put((index, text))
+        
+        producers = [asyncio.ensure_future(produce(i, region)) for i, region in enumerate(regions)]
+        texts = [""] * len(regions)
+        outcomes: Dict[str, Tuple[str, bool, Optional[str]]] = {}
+        pending: List[str] = []
+        pending_since = 0.0
+        received = 0
+        
+        try:
+            while received < len(regions):
+                timeout = self.PIPELINE_FLUSH_INTERVAL
+                if pending:
+                    timeout = max(0.0, pending_since + timeout - time.monotonic())
+                try:
+                    index, text = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    # OCR 出错时生产者不会入队，及时抛出异常
+                    for producer in producers:
+                        if producer.done() and producer.exception() is not None:
+                            raise producer.exception()
+                else:
+                    received += 1
+                    texts[index] = text
+                    if text:
+                        if not pending:
+                            pending_since = time.monotonic()
+                        pending.append(text)
+                if pending and (
+                    received == len(regions)
+                    or len(pending) >= self.PIPELINE_BATCH_MIN
+                    or time.monotonic() - pending_since >= self.PIPELINE_FLUSH_INTERVAL
+                ):
+                    await asyncio.to_thread(self._process_pending, action, pending, outcomes)
+                    pending = []
+        finally:
+            for producer in producers:
+                producer.cancel()
+        
+        return self._build_batch_results(action, regions, texts, outcomes)
+    
+    def _process_pending(
+        self,
+        action: MagnifierAction,
+        texts: List[str],
+        outcomes: Dict[str, Tuple[str, bool, Optional[str]]]
+    ) -> None:
+        """处理一批已识别的文字，跳过已有结果的文字，结果写入 outcomes"""
+        new_texts = [text for text in dict.fromkeys(texts) if text and text not in outcomes]
+        if not new_texts:
+            return
+        try:
+            outcomes.update(self._process_texts_batch(action, new_texts))
+        except Exception as e:
+            outcomes.update({text: ("", False, str(e)) for text in new_texts})
+    
+    def _build_batch_results(
+        self,
+        action: MagnifierAction,
+        regions: List[Tuple[float, float, float, float]],
+        texts: List[str],
+        outcomes: Optional[Dict[str, Tuple[str, bool, Optional[str]]]] = None
+    ) -> List[MagnifierResult]:
+        """根据各区域识别出的文字（及已处理的结果）组装结果，缺失的结果在此补齐"""
+        if outcomes is None:
+            outcomes = {}
+        self._process_pending(action, texts, outcomes)
+        
+        results = []
+        for region, text in zip(regions, texts):
+            if not text:
+                results.append(MagnifierResult(
+                    action=action,
+                    original_text="",
+                    result_text="",
+                    success=False,
+                    error_message="无法识别文字",
+                    region=region
+                ))
+                continue
+            result_text, success, error_msg = outcomes[text]
+            results.append(MagnifierResult(
+                action=action,
+                original_text=text,
+                result_text=result_text,
+                success=success,
+                error_message=error_msg,
+                region=region
+            ))
+        return results
+    
+    def _process_texts_batch(
+        self,
+        action: MagnifierAction,
+        texts: List[str]
+    ) -> Dict[str, Tuple[str, bool, Optional[str]]]:
+        """
+        批量处理互不相同的文本
+        
+        Returns:
+            {原文: (结果文本, 是否成功, 错误信息)}
+        """
+        if action == MagnifierAction.MAGNIFY:
+            return {text: (text, True, None) for text in texts}
+        
+        if action not in _TRANSLATION_DIRECTIONS and action not in _CONVERSION_DIRECTIONS:
+            return {text: ("", False, f"不支持的操作类型: {action}") for text in texts}
+        
+        outcomes = {}
+        # 规范化键 -> 原文列表；每个键只把第一个原文交给服务
+        misses: Dict[str, List[str]] = {}
+        for text in texts:
+            key = _normalize_for_cache(text)
+            cached = self._cached_result((action, key))
+            if cached is not None:
+                outcomes[text] = (cached, True, None)
+            else:
+                misses.setdefault(key, []).append(text)
+        if not misses:
+            return outcomes
+        
+        originals = [group[0] for group in misses.values()]
+        
+        if action in _TRANSLATION_DIRECTIONS:
+            results = self._translation.translate_batch(originals, _TRANSLATION_DIRECTIONS[action])
+            fresh = [(r.translated, r.success, r.error_message) for r in results]
+        else:
+            # 纯 ASCII 文本没有可转换的汉字，只把其余文本交给转换器
+            pending = [text for text in originals if not text.isascii()]
+            converted = dict(zip(pending, self._converter.convert_batch(pending, _CONVERSION_DIRECTIONS[action])))
+            fresh = [(converted.get(text, text), True, None) for text in originals]
+        
+        for (key, group), outcome in zip(misses.items(), fresh):
+            if outcome[1]:
+                self._remember_result((action, key), outcome[0])
+            for text in group:
+                outcomes[text] = outcome
+        return outcomes
+    
+    def _resolve(self, action: MagnifierAction, text: str) -> Tuple[str, bool, Optional[str]]:
+        """
+        对文本执行操作，重复的 (操作, 规范化文本) 直接返回缓存结果
+        
+        未命中时把原文（而非规范化文本）交给服务，以保留其格式。
+        
+        Args:
+            action: 操作类型
+            text: 非空文本
+        
+        Returns:
+            (结果文本, 是否成功, 错误信息)
+        """
+        handler = self._dispatch.get(action)
+        if handler is None:
+            return "", False, f"不支持的操作类型: {action}"
+        
+        if action == MagnifierAction.MAGNIFY:
+            return handler(text)
+        
+        key = (action, _normalize_for_cache(text))
+        cached = self._cached_result(key)
+        if cached is not None:
+            return cached, True, None
+        
+        outcome = handler(text)
+        # 失败结果（如网络错误）不缓存，下次重新请求
+        if outcome[1]:
+            self._remember_result(key, outcome[0])
+        return outcome
+    
+    def _do_magnify(self, text: str) -> Tuple[str, bool, Optional[str]]:
+        """仅放大，返回原文"""
+        return text, True, None
+    
+    def _do_translate(self, text: str, direction: TranslationDirection) -> Tuple[str, bool, Optional[str]]:
+        """调用翻译服务"""
+        result = self._translation.translate(text, direction)
+        return result.translated, result.success, result.error_message
+    
+    def _do_convert(self, text: str, direction: ConversionDirection) -> Tuple[str, bool, Optional[str]]:
+        """调用繁简转换器，纯 ASCII 文本没有汉字，直接返回原文"""
+        if text.isascii():
+            return text, True, None
+        return self._converter.convert(text, direction), True, None
+    
+    def _cached_result(self, key: Tuple[MagnifierAction, str]) -> Optional[str]:
+        """查询缓存的操作结果，内存未命中时再查持久化翻译缓存"""
+        cached = self._already_translated.get(key)
+        if cached is not None:
+            self._already_translated.move_to_end(key)
+            return cached
+        
+        if self._translation_cache is not None and key[0] in _TRANSLATION_DIRECTIONS:
+            try:
+                cached = self._translation_cache.get(key[0].value, key[1])
+            except Exception:
+                cached = None
+            if cached is not None:
+                self._remember_in_memory(key, cached)
+        return cached
+    
+    def _remember_result(self, key: Tuple[MagnifierAction, str], result_text: str) -> None:
+        """缓存成功的操作结果，翻译结果同时写入持久化缓存"""
+        self._remember_in_memory(key, result_text)
+        if self._translation_cache is not None and key[0] in _TRANSLATION_DIRECTIONS:
+            try:
+                self._translation_cache.put(key[0].value, key[1], result_text)
+            except Exception:
+                pass
+    
+    def _remember_in_memory(self, key: Tuple[MagnifierAction, str], result_text: str) -> None:
+        """写入内存 LRU 缓存，超出容量时淘汰最久未用的条目"""
+        self._already_translated[key] = result_text
+        if len(self._already_translated) > self.RESULT_CACHE_SIZE:
+            self._already_translated.popitem(last=False)
+    
     def get_available_actions(self) -> List[MagnifierAction]:
         """
         获取当前可用的操作列表
         
         Returns:
             可用操作列表
-        """
-        actions = [MagnifierAction.MAGNIFY]
         
-        # 检查翻译服务是否可用
-        if self._translation.is_available():
-            actions.append(MagnifierAction.TRANSLATE_EN_ZH)
-            actions.append(MagnifierAction.TRANSLATE_ZH_EN)
-        
-        # 繁简转换始终可用（离线功能）
-        actions.append(MagnifierAction.CONVERT_T2S)
-        actions.append(MagnifierAction.CONVERT_S2T)
+        Note:
+            翻译服务的可用性检查可能访问网络，检查结果在 AVAILABILITY_TTL
+            秒内复用；配置变化后可调用 invalidate_actions_cache 立即刷新。
+        """
+        now = time.monotonic()
+        if self._actions_cache is None or now - self._actions_checked_at >= self.AVAILABILITY_TTL:
+            # 检查翻译服务是否可用
+            available = self._translation.is_available()
+            self._actions_checked_at = now
+            if self._actions_cache is None or available != self._actions_cache_avail:
+                actions = [MagnifierAction.MAGNIFY]
+                if available:
+                    actions.append(MagnifierAction.TRANSLATE_EN_ZH)
+                    actions.append(MagnifierAction.TRANSLATE_ZH_EN)
+                
+                # 繁简转换始终可用（离线功能）
+                actions.append(MagnifierAction.CONVERT_T2S)
+                actions.append(MagnifierAction.CONVERT_S2T)
+                
+                self._actions_cache = actions
+                self._actions_cache_avail = available
         
-        return actions
+        return list(self._actions_cache)
+    
+    def invalidate_actions_cache(self) -> None:
+        """清除可用操作缓存（翻译服务配置变化后调用）"""
+        self._actions_cache = None
+        self._actions_cache_avail = None
     
     def perform_action_on_text(self, action: MagnifierAction, text: str) -> MagnifierResult:
         """
@@ -392,39 +872,10 @@ class Magnifier(IMagnifier):
                 region=None
             )
         
-        result_text = ""
-        error_msg = None
-        success = True
-        
         try:
-            if action == MagnifierAction.TRANSLATE_EN_ZH:
-                result = self._translation.translate(text, TranslationDirection.EN_TO_ZH)
-                result_text = result.translated
-                success = result.success
-                error_msg = result.error_message
-                
-            elif action == MagnifierAction.TRANSLATE_ZH_EN:
-                result = self._translation.translate(text, TranslationDirection.ZH_TO_EN)
-                result_text = result.translated
-                success = result.success
-                error_msg = result.error_message
-                
-            elif action == MagnifierAction.CONVERT_T2S:
-                result_text = self._converter.convert(text, ConversionDirection.TRADITIONAL_TO_SIMPLIFIED)
-                
-            elif action == MagnifierAction.CONVERT_S2T:
-                result_text = self._converter.convert(text, ConversionDirection.SIMPLIFIED_TO_TRADITIONAL)
-                
-            elif action == MagnifierAction.MAGNIFY:
-                result_text = text
-                
-            else:
-                success = False
-                error_msg = f"不支持的操作类型: {action}"
-                
+            result_text, success, error_msg = self._resolve(action, text)
         except Exception as e:
-            success = False
-            error_msg = str(e)
+            result_text, success, error_msg = "", False, str(e)
         
         return MagnifierResult(
             action=action,
@@ -4,12 +4,35 @@
 定义所有数据类和枚举类型。
 """
 
+from array import array
+from base64 import b64decode, b64encode
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
 import json
+import struct
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj, indent: bool = False) -> str:
+    """序列化为 JSON 字符串（保留非 ASCII 字符），安装了 orjson 时使用 orjson"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+
+def _json_loads(data):
+    """解析 JSON 字符串或字节，安装了 orjson 时使用 orjson"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 # ============== 枚举类型 ==============
@@ -31,8 +54,13 @@ class TouchType(Enum):
     UNKNOWN = "unknown"
 
 
-class MagnifierAction(Enum):
-    """放大镜操作类型"""
+class MagnifierAction(str, Enum):
+    """
+    放大镜操作类型
+
+    混入 str 后哈希与比较走 str 的 C 实现，作为分派表键查找更快；
+    取值仍为字符串，序列化格式与持久化缓存中的键保持不变。
+    """
     MAGNIFY = "magnify"                  # 仅放大
     TRANSLATE_EN_ZH = "translate_en_zh"  # 英译汉
     TRANSLATE_ZH_EN = "translate_zh_en"  # 汉译英
@@ -59,9 +87,59 @@ class BackupProvider(Enum):
     ONEDRIVE = "onedrive"
 
 
+# 值 -> 枚举成员，反序列化时直接查字典，避免每次走 Enum.__call__
+_PEN_TYPE_BY_VALUE = {member.value: member for member in PenType}
+_TOUCH_TYPE_BY_VALUE = {member.value: member for member in TouchType}
+_MAGNIFIER_ACTION_BY_VALUE = {member.value: member for member in MagnifierAction}
+_TRANSLATION_DIRECTION_BY_VALUE = {member.value: member for member in TranslationDirection}
+_BACKUP_PROVIDER_BY_VALUE = {member.value: member for member in BackupProvider}
+
+
+def _enum_from_value(by_value: dict, enum_cls, value):
+    """按值查找枚举成员，未命中时交给枚举构造（非法值仍抛出 ValueError）"""
+    member = by_value.get(value)
+    return member if member is not None else enum_cls(value)
+
+
+def _datetime_to_wire(value: datetime) -> float:
+    """
+    序列化时间为 epoch 秒，比 isoformat 少一次字符串构造
+
+    无时区的时间按 UTC 换算，不经过本地时区：结果与运行设备的时区和
+    夏令时无关，在另一时区读取时得到相同的墙上时间。
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _datetime_from_wire(value) -> datetime:
+    """反序列化时间（无时区），兼容 epoch 秒与旧版的 ISO 字符串"""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, timezone.utc).replace(tzinfo=None)
+    return datetime.fromisoformat(value)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """
+    驻留取值种类很少、但在大量记录中重复出现的字符串（文件类型、文件夹ID、标签、颜色等），
+    使所有记录共享同一个字符串对象。各记录唯一的值（如ID）不应驻留。
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _thumbnail_from_dict(data: dict) -> Optional[bytes]:
+    """读取缩略图：新格式为 base64（thumbnail_b64），旧格式为十六进制（thumbnail）"""
+    if data.get("thumbnail_b64"):
+        return b64decode(data["thumbnail_b64"])
+    if data.get("thumbnail"):
+        return bytes.fromhex(data["thumbnail"])
+    return None
+
+
 # ============== 文档相关数据类 ==============
 
-@dataclass
+@dataclass(slots=True)
 class PageInfo:
     """页面信息"""
     page_number: int
@@ -87,7 +165,7 @@ class PageInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentInfo:
     """文档信息"""
     path: Path
@@ -113,7 +191,7 @@ class DocumentInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentEntry:
     """文档条目"""
     id: str
@@ -127,6 +205,7 @@ class DocumentEntry:
     modified_at: datetime = field(default_factory=datetime.now)
     is_deleted: bool = False
     tags: List[str] = field(default_factory=list)
+    fingerprint: Optional[str] = None  # 文件内容指纹（大小+首尾64KB的BLAKE2b）
 
     def to_dict(self) -> dict:
         return {
@@ -136,11 +215,12 @@ class DocumentEntry:
             "file_type": self.file_type,
             "size": self.size,
             "folder_id": self.folder_id,
-            "thumbnail": self.thumbnail.hex() if self.thumbnail else None,
-            "created_at": self.created_at.isoformat(),
-            "modified_at": self.modified_at.isoformat(),
+            "thumbnail_b64": b64encode(self.thumbnail).decode("ascii") if self.thumbnail else None,
+            "created_at": _datetime_to_wire(self.created_at),
+            "modified_at": _datetime_to_wire(self.modified_at),
             "is_deleted": self.is_deleted,
             "tags": self.tags,
+            "fingerprint": self.fingerprint,
         }
 
     @classmethod
@@ -149,18 +229,19 @@ class DocumentEntry:
             id=data["id"],
             path=Path(data["path"]),
             title=data["title"],
-            file_type=data["file_type"],
+            file_type=_intern(data["file_type"]),
             size=data["size"],
-            folder_id=data.get("folder_id"),
-            thumbnail=bytes.fromhex(data["thumbnail"]) if data.get("thumbnail") else None,
-            created_at=datetime.fromisoformat(data["created_at"]),
-            modified_at=datetime.fromisoformat(data["modified_at"]),
+            folder_id=_intern(data.get("folder_id")),
+            thumbnail=_thumbnail_from_dict(data),
+            created_at=_datetime_from_wire(data["created_at"]),
+            modified_at=_datetime_from_wire(data["modified_at"]),
             is_deleted=data.get("is_deleted", False),
-            tags=data.get("tags", []),
+            tags=[_intern(tag) for tag in data.get("tags", [])],
+            fingerprint=data.get("fingerprint"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Folder:
     """文件夹"""
     id: str
@@ -173,7 +254,7 @@ class Folder:
             "id": self.id,
             "name": self.name,
             "parent_id": self.parent_id,
-            "created_at": self.created_at.isoformat(),
+            "created_at": _datetime_to_wire(self.created_at),
         }
 
     @classmethod
@@ -182,11 +263,11 @@ class Folder:
             id=data["id"],
             name=data["name"],
             parent_id=data.get("parent_id"),
-            created_at=datetime.fromisoformat(data["created_at"]),
+            created_at=_datetime_from_wire(data["created_at"]),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Tag:
     """标签"""
     id: str
@@ -209,7 +290,7 @@ class Tag:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Bookmark:
     """书签"""
     id: str
@@ -224,7 +305,7 @@ class Bookmark:
             "document_id": self.document_id,
             "page_num": self.page_num,
             "title": self.title,
-            "created_at": self.created_at.isoformat(),
+            "created_at": _datetime_to_wire(self.created_at),
         }
 
     @classmethod
@@ -234,13 +315,13 @@ class Bookmark:
             document_id=data["document_id"],
             page_num=data["page_num"],
             title=data["title"],
-            created_at=datetime.fromisoformat(data["created_at"]),
+            created_at=_datetime_from_wire(data["created_at"]),
         )
 
 
 # ============== 注释相关数据类 ==============
 
-@dataclass
+@dataclass(slots=True)
 class StrokePoint:
     """笔画点"""
     x: float
@@ -258,22 +339,167 @@ class StrokePoint:
 
     @classmethod
     def from_dict(cls, data: dict) -> "StrokePoint":
-        return cls(
-            x=data["x"],
-            y=data["y"],
-            pressure=data["pressure"],
-            timestamp=data["timestamp"],
+        # 高频构造，使用位置参数（字段顺序：x, y, pressure, timestamp）
+        return cls(data["x"], data["y"], data["pressure"], data["timestamp"])
+
+
+# 列式序列化的列名与 StrokePoints 属性的对应关系
+_POINT_COLUMNS = (
+    ("x", "xs"),
+    ("y", "ys"),
+    ("pressure", "pressures"),
+    ("timestamp", "timestamps"),
+)
+
+
+def _column_to_bytes(column: array) -> bytes:
+    """把 array('d') 转为小端 float64 字节"""
+    if sys.byteorder != "little":
+        column = array("d", column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _column_from_bytes(data) -> array:
+    """把小端 float64 字节（bytes 或 memoryview）转为 array('d')"""
+    column = array("d")
+    column.frombytes(data)
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column
+
+
+def _encode_column(column: array) -> str:
+    """把 array('d') 编码为小端字节的 base64 字符串"""
+    return b64encode(_column_to_bytes(column)).decode("ascii")
+
+
+def _decode_column(encoded: str) -> array:
+    """把 _encode_column 的结果解码为 array('d')"""
+    return _column_from_bytes(b64decode(encoded))
+
+
+class StrokePoints:
+    """
+    笔画点序列（列式存储）
+
+    x、y、压力和时间戳分别保存在四个 array('d') 列中，每个点只占 32 字节，
+    不再为每个点创建 Python 对象。按下标或迭代访问时才临时构造 StrokePoint，
+    批量处理（命中检测、绘制、序列化）应直接使用 xs/ys/pressures/timestamps 列。
+    """
+
+    __slots__ = ("xs", "ys", "pressures", "timestamps")
+
+    def __init__(self, points: Iterable[StrokePoint] = ()):
+        self.xs = array("d")
+        self.ys = array("d")
+        self.pressures = array("d")
+        self.timestamps = array("d")
+        for point in points:
+            self.append(point)
+
+    def add(self, x: float, y: float, pressure: float, timestamp: float) -> None:
+        """追加一个点（无需构造 StrokePoint）"""
+        self.xs.append(x)
+        self.ys.append(y)
+        self.pressures.append(pressure)
+        self.timestamps.append(timestamp)
+
+    def append(self, point: StrokePoint) -> None:
+        """追加一个点"""
+        self.add(point.x, point.y, point.pressure, point.timestamp)
+
+    def xy_flat(self) -> List[float]:
+        """交错排列的坐标 [x0, y0, x1, y1, ...]，可直接用于绘制折线"""
+        flat = [0.0] * (2 * len(self.xs))
+        flat[0::2] = self.xs
+        flat[1::2] = self.ys
+        return flat
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[StrokePoint, List[StrokePoint]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.xs)))]
+        return StrokePoint(self.xs[index], self.ys[index], self.pressures[index], self.timestamps[index])
+
+    def __iter__(self) -> Iterator[StrokePoint]:
+        for x, y, pressure, timestamp in zip(self.xs, self.ys, self.pressures, self.timestamps):
+            yield StrokePoint(x, y, pressure, timestamp)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, list):
+            other = StrokePoints(other)
+        if not isinstance(other, StrokePoints):
+            return NotImplemented
+        return (
+            self.xs == other.xs
+            and self.ys == other.ys
+            and self.pressures == other.pressures
+            and self.timestamps == other.timestamps
         )
 
+    def __repr__(self) -> str:
+        return f"StrokePoints(n={len(self.xs)})"
 
-@dataclass
+    def to_list(self) -> List[dict]:
+        """序列化为点字典列表"""
+        return [
+            {"x": x, "y": y, "pressure": pressure, "timestamp": timestamp}
+            for x, y, pressure, timestamp in zip(self.xs, self.ys, self.pressures, self.timestamps)
+        ]
+
+    @classmethod
+    def from_list(cls, data: List[dict]) -> "StrokePoints":
+        """从点字典列表构建，直接写入各列"""
+        points = cls()
+        points.xs.extend(p["x"] for p in data)
+        points.ys.extend(p["y"] for p in data)
+        points.pressures.extend(p["pressure"] for p in data)
+        points.timestamps.extend(p["timestamp"] for p in data)
+        return points
+
+    def to_columns(self) -> dict:
+        """
+        序列化为列式格式：每列是小端 float64 字节的 base64 编码
+
+        每列一次内存拷贝，不为每个点构造字典。
+        """
+        return {
+            "n": len(self.xs),
+            **{key: _encode_column(getattr(self, attr)) for key, attr in _POINT_COLUMNS},
+        }
+
+    @classmethod
+    def from_columns(cls, data: dict) -> "StrokePoints":
+        """从 to_columns 的结果构建"""
+        points = cls()
+        for key, attr in _POINT_COLUMNS:
+            column = _decode_column(data[key])
+            if len(column) != data["n"]:
+                raise ValueError(f"Point column {key!r} has {len(column)} values, expected {data['n']}")
+            setattr(points, attr, column)
+        return points
+
+
+# 笔画序列化格式版本：1 为逐点字典列表，2 为列式（StrokePoints.to_columns）
+STROKE_FORMAT_VERSION = 2
+
+
+@dataclass(slots=True)
 class Stroke:
     """笔画"""
     id: str
     pen_type: PenType
     color: str  # hex color
     width: float
-    points: List[StrokePoint] = field(default_factory=list)
+    points: StrokePoints = field(default_factory=StrokePoints)
+
+    def __post_init__(self) -> None:
+        # 兼容传入 StrokePoint 列表
+        if not isinstance(self.points, StrokePoints):
+            self.points = StrokePoints(self.points)
 
     def to_dict(self) -> dict:
         return {
@@ -281,52 +507,197 @@ class Stroke:
             "pen_type": self.pen_type.value,
             "color": self.color,
             "width": self.width,
-            "points": [p.to_dict() for p in self.points],
+            "v": STROKE_FORMAT_VERSION,
+            "points": self.points.to_columns(),
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Stroke":
+        # 未标注版本的数据来自旧版（逐点字典列表）
+        version = data.get("v", 1)
+        if version == 2:
+            points = StrokePoints.from_columns(data["points"])
+        elif version == 1:
+            points = StrokePoints.from_list(data.get("points", []))
+        else:
+            raise ValueError(f"Unsupported stroke format version: {version}")
         return cls(
             id=data["id"],
-            pen_type=PenType(data["pen_type"]),
-            color=data["color"],
+            pen_type=_enum_from_value(_PEN_TYPE_BY_VALUE, PenType, data["pen_type"]),
+            color=_intern(data["color"]),
             width=data["width"],
-            points=[StrokePoint.from_dict(p) for p in data.get("points", [])],
+            points=points,
         )
 
 
+# 注释二进制格式：定长头（魔数、版本、JSON 元数据长度），随后是 JSON 元数据，
+# 最后按笔画顺序依次存放每个笔画的 x、y、pressure、timestamp 列（小端 float64）
+ANNOTATION_BINARY_MAGIC = b"HPAN"
+ANNOTATION_BINARY_VERSION = 1
+_ANNOTATION_BINARY_HEADER = struct.Struct("<4sBI")
+_FLOAT64_SIZE = 8
+
+
 @dataclass
 class Annotation:
-    """注释"""
+    """
+    注释
+
+    from_dict 只保存原始笔画字典，首次访问 strokes 时才构造 Stroke 对象；
+    仅需 id、page_num 或笔画数量的调用方不会为每个点分配对象。
+    未反序列化时实例字典中没有 strokes，访问时经 __getattr__ 构造。
+    """
     id: str
     page_num: int
     strokes: List[Stroke] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.now)
     modified_at: datetime = field(default_factory=datetime.now)
 
+    # 尚未反序列化的笔画字典（不是数据类字段，不出现在 fields()/asdict() 中）
+    _raw_strokes = None
+
+    def __getattr__(self, name: str) -> Any:
+        # 仅在实例字典中没有 strokes 时调用：由原始字典构造笔画
+        if name == "strokes":
+            raw = self.__dict__.get("_raw_strokes")
+            if raw is not None:
+                strokes = [Stroke.from_dict(s) for s in raw]
+                self.strokes = strokes
+                self._raw_strokes = None
+                return strokes
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    @property
+    def stroke_count(self) -> int:
+        """笔画数量（不触发反序列化）"""
+        if self.is_loaded:
+            return len(self.strokes)
+        return len(self._raw_strokes)
+
+    @property
+    def is_loaded(self) -> bool:
+        """笔画是否已反序列化"""
+        return "strokes" in self.__dict__
+
     def to_dict(self) -> dict:
+        # 未反序列化时直接写回原始笔画字典
+        if self.is_loaded:
+            strokes = [s.to_dict() for s in self.strokes]
+        else:
+            strokes = self._raw_strokes
         return {
             "id": self.id,
             "page_num": self.page_num,
-            "strokes": [s.to_dict() for s in self.strokes],
-            "created_at": self.created_at.isoformat(),
-            "modified_at": self.modified_at.isoformat(),
+            "strokes": strokes,
+            "created_at": _datetime_to_wire(self.created_at),
+            "modified_at": _datetime_to_wire(self.modified_at),
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Annotation":
-        return cls(
+        annotation = cls(
             id=data["id"],
             page_num=data["page_num"],
-            strokes=[Stroke.from_dict(s) for s in data.get("strokes", [])],
-            created_at=datetime.fromisoformat(data["created_at"]),
-            modified_at=datetime.fromisoformat(data["modified_at"]),
+            created_at=_datetime_from_wire(data["created_at"]),
+            modified_at=_datetime_from_wire(data["modified_at"]),
+        )
+        del annotation.strokes
+        annotation._raw_strokes = list(data.get("strokes", []))
+        return annotation
+
+    def to_binary(self) -> bytes:
+        """
+        序列化为二进制格式
+
+        点数据以原始 float64 字节存放，不经过文本编码，体积约为 JSON 列式格式的 3/4，
+        读写均为整列内存拷贝。
+
+        Returns:
+            二进制数据
+        """
+        strokes = self.strokes
+        meta = _json_dumps({
+            "id": self.id,
+            "page_num": self.page_num,
+            "created_at": _datetime_to_wire(self.created_at),
+            "modified_at": _datetime_to_wire(self.modified_at),
+            "strokes": [
+                {
+                    "id": s.id,
+                    "pen_type": s.pen_type.value,
+                    "color": s.color,
+                    "width": s.width,
+                    "n": len(s.points),
+                }
+                for s in strokes
+            ],
+        }).encode("utf-8")
+        parts = [
+            _ANNOTATION_BINARY_HEADER.pack(ANNOTATION_BINARY_MAGIC, ANNOTATION_BINARY_VERSION, len(meta)),
+            meta,
+        ]
+        for stroke in strokes:
+            for _, attr in _POINT_COLUMNS:
+                parts.append(_column_to_bytes(getattr(stroke.points, attr)))
+        return b"".join(parts)
+
+    @classmethod
+    def from_binary(cls, data: bytes) -> "Annotation":
+        """
+        从 to_binary 的结果反序列化
+
+        Args:
+            data: 二进制数据
+
+        Returns:
+            注释对象
+
+        Raises:
+            ValueError: 数据不是注释二进制格式、版本不受支持或数据被截断
+        """
+        view = memoryview(data)
+        if len(view) < _ANNOTATION_BINARY_HEADER.size:
+            raise ValueError("Annotation binary data is truncated")
+        magic, version, meta_len = _ANNOTATION_BINARY_HEADER.unpack_from(view)
+        if magic != ANNOTATION_BINARY_MAGIC:
+            raise ValueError("Not an annotation binary blob")
+        if version != ANNOTATION_BINARY_VERSION:
+            raise ValueError(f"Unsupported annotation binary version: {version}")
+
+        offset = _ANNOTATION_BINARY_HEADER.size
+        meta = _json_loads(bytes(view[offset:offset + meta_len]))
+        offset += meta_len
+
+        strokes = []
+        for stroke_meta in meta["strokes"]:
+            size = stroke_meta["n"] * _FLOAT64_SIZE
+            points = StrokePoints()
+            for _, attr in _POINT_COLUMNS:
+                chunk = view[offset:offset + size]
+                if len(chunk) != size:
+                    raise ValueError("Annotation binary data is truncated")
+                setattr(points, attr, _column_from_bytes(chunk))
+                offset += size
+            strokes.append(Stroke(
+                stroke_meta["id"],
+                _enum_from_value(_PEN_TYPE_BY_VALUE, PenType, stroke_meta["pen_type"]),
+                _intern(stroke_meta["color"]),
+                stroke_meta["width"],
+                points,
+            ))
+
+        return cls(
+            id=meta["id"],
+            page_num=meta["page_num"],
+            strokes=strokes,
+            created_at=_datetime_from_wire(meta["created_at"]),
+            modified_at=_datetime_from_wire(meta["modified_at"]),
         )
 
 
 # ============== 触摸事件数据类 ==============
 
-@dataclass
+@dataclass(slots=True)
 class TouchEvent:
     """触摸事件"""
     id: int
@@ -350,31 +721,34 @@ class TouchEvent:
 
     @classmethod
     def from_dict(cls, data: dict) -> "TouchEvent":
+        # 高频构造，使用位置参数（字段顺序：id, x, y, pressure, size, touch_type, timestamp）
         return cls(
-            id=data["id"],
-            x=data["x"],
-            y=data["y"],
-            pressure=data["pressure"],
-            size=data["size"],
-            touch_type=TouchType(data["touch_type"]),
-            timestamp=data["timestamp"],
+            data["id"],
+            data["x"],
+            data["y"],
+            data["pressure"],
+            data["size"],
+            _enum_from_value(_TOUCH_TYPE_BY_VALUE, TouchType, data["touch_type"]),
+            data["timestamp"],
         )
 
 
 # ============== 放大镜相关数据类 ==============
 
-@dataclass
+@dataclass(slots=True)
 class MagnifierConfig:
     """放大镜配置"""
     size: Tuple[int, int] = (200, 200)  # 放大镜尺寸
     zoom_level: float = 2.0              # 放大倍数
     shape: str = "circle"                # 形状: circle/rectangle
+    concurrency_limit: int = 4           # OCR/翻译最大并发数
 
     def to_dict(self) -> dict:
         return {
             "size": list(self.size),
             "zoom_level": self.zoom_level,
             "shape": self.shape,
+            "concurrency_limit": self.concurrency_limit,
         }
 
     @classmethod
@@ -383,12 +757,13 @@ class MagnifierConfig:
             size=tuple(data.get("size", [200, 200])),
             zoom_level=data.get("zoom_level", 2.0),
             shape=data.get("shape", "circle"),
+            concurrency_limit=data.get("concurrency_limit", 4),
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MagnifierResult:
-    """放大镜操作结果"""
+    """放大镜操作结果（不可变，无实例 __dict__）"""
     action: MagnifierAction
     original_text: str
     result_text: str
@@ -409,7 +784,7 @@ class MagnifierResult:
     @classmethod
     def from_dict(cls, data: dict) -> "MagnifierResult":
         return cls(
-            action=MagnifierAction(data["action"]),
+            action=_enum_from_value(_MAGNIFIER_ACTION_BY_VALUE, MagnifierAction, data["action"]),
             original_text=data["original_text"],
             result_text=data["result_text"],
             success=data["success"],
@@ -420,7 +795,7 @@ class MagnifierResult:
 
 # ============== 翻译相关数据类 ==============
 
-@dataclass
+@dataclass(slots=True)
 class TranslationResult:
     """翻译结果"""
     original: str
@@ -443,7 +818,9 @@ class TranslationResult:
         return cls(
             original=data["original"],
             translated=data["translated"],
-            direction=TranslationDirection(data["direction"]),
+            direction=_enum_from_value(
+                _TRANSLATION_DIRECTION_BY_VALUE, TranslationDirection, data["direction"]
+            ),
             success=data["success"],
             error_message=data.get("error_message"),
         )
@@ -451,7 +828,7 @@ class TranslationResult:
 
 # ============== 插件相关数据类 ==============
 
-@dataclass
+@dataclass(slots=True)
 class PluginInfo:
     """插件信息"""
     id: str
@@ -474,7 +851,7 @@ class PluginInfo:
             "entry_point": self.entry_point,
             "permissions": self.permissions,
             "enabled": self.enabled,
-            "installed_at": self.installed_at.isoformat(),
+            "installed_at": _datetime_to_wire(self.installed_at),
         }
 
     @classmethod
@@ -488,13 +865,13 @@ class PluginInfo:
             entry_point=data["entry_point"],
             permissions=data.get("permissions", []),
             enabled=data.get("enabled", False),
-            installed_at=datetime.fromisoformat(data["installed_at"]) if data.get("installed_at") else datetime.now(),
+            installed_at=_datetime_from_wire(data["installed_at"]) if data.get("installed_at") else datetime.now(),
         )
 
 
 # ============== 配置相关数据类 ==============
 
-@dataclass
+@dataclass(slots=True)
 class ReadingConfig:
     """阅读设置"""
     page_direction: str = "vertical"  # vertical/horizontal
@@ -526,7 +903,7 @@ class ReadingConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StylusConfig:
     """手写笔设置"""
     double_tap: str = "eraser"
@@ -564,7 +941,7 @@ class StylusConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolsConfig:
     """工具设置"""
     shape_recognition: bool = True
@@ -593,7 +970,7 @@ class ToolsConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupConfig:
     """备份配置"""
     provider: BackupProvider = BackupProvider.LOCAL
@@ -612,14 +989,16 @@ class BackupConfig:
     @classmethod
     def from_dict(cls, data: dict) -> "BackupConfig":
         return cls(
-            provider=BackupProvider(data.get("provider", "local")),
+            provider=_enum_from_value(
+                _BACKUP_PROVIDER_BY_VALUE, BackupProvider, data.get("provider", "local")
+            ),
             auto_backup=data.get("auto_backup", False),
             wifi_only=data.get("wifi_only", True),
             backup_path=data.get("backup_path"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationConfig:
     """翻译设置"""
     default_direction: str = "en_to_zh"
@@ -639,7 +1018,7 @@ class TranslationConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """应用设置"""
     theme: str = "dark_green"
@@ -675,10 +1054,10 @@ class Settings:
 
     def to_json(self) -> str:
         """序列化为JSON字符串"""
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        return _json_dumps(self.to_dict(), indent=True)
 
     @classmethod
     def from_json(cls, json_str: str) -> "Settings":
         """从JSON字符串反序列化"""
-        data = json.loads(json_str)
+        data = _json_loads(json_str)
         return cls.from_dict(data)
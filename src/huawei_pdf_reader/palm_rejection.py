@@ -5,11 +5,60 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from .models import TouchEvent, TouchType
 
 
+# 批量分类结果使用的整数编码
+FINGER_CODE = 0
+PALM_CODE = 1
+STYLUS_CODE = 2
+
+# 编码 -> 触摸类型
+TOUCH_TYPE_BY_CODE = (TouchType.FINGER, TouchType.PALM, TouchType.STYLUS)
+
+# 预先绑定的枚举成员：通过枚举类访问成员需要走描述符，逐事件分类时开销明显
+_STYLUS = TouchType.STYLUS
+_FINGER = TouchType.FINGER
+_PALM = TouchType.PALM
+
+# 手掌判定的压力上限（低于此值）
+PALM_PRESSURE_LIMIT = 0.3
+
+# 向量化分类的查找表，下标为 (硬件手写笔标记 << 2) | (手掌掩码 << 1) | 手写笔掩码，
+# 优先级与 classify_touch 相同：硬件标记 > 手掌 > 手写笔 > 手指
+_CODE_LUT = (
+    FINGER_CODE, STYLUS_CODE, PALM_CODE, PALM_CODE,
+    STYLUS_CODE, STYLUS_CODE, STYLUS_CODE, STYLUS_CODE,
+)
+_CODE_LUT_ARRAY = np.array(_CODE_LUT, dtype=np.int8) if np is not None else None
+
+
+def _thresholds_for(sensitivity: int) -> Tuple[float, float, float]:
+    """
+    计算灵敏度对应的阈值 (手掌面积, 手写笔面积, 手写笔压力)
+
+    灵敏度越高，手掌检测阈值越低（更容易将触摸判定为手掌）。
+    灵敏度为1时，手掌面积阈值为 0.7 (不太敏感)；为10时为 0.25 (非常敏感)。
+    """
+    sensitivity_factor = (sensitivity - 1) / 9.0  # 0.0 to 1.0
+    return (
+        0.7 - (sensitivity_factor * 0.45),
+        0.15 - (sensitivity_factor * 0.05),
+        0.4 - (sensitivity_factor * 0.15),
+    )
+
+
+# 灵敏度 1-10 对应的阈值表，下标为灵敏度减一
+_THRESHOLDS_BY_SENSITIVITY = tuple(_thresholds_for(level) for level in range(1, 11))
+
+
 class IPalmRejectionSystem(ABC):
     """防误触系统接口"""
     
@@ -68,16 +117,13 @@ class PalmRejectionSystem(IPalmRejectionSystem):
         return max(1, min(10, level))
     
     def _update_thresholds(self) -> None:
-        """根据灵敏度更新阈值"""
-        # 灵敏度越高，手掌检测阈值越低（更容易将触摸判定为手掌）
-        # 灵敏度范围: 1-10
-        # 灵敏度为1时，palm_size_threshold = 0.7 (不太敏感)
-        # 灵敏度为10时，palm_size_threshold = 0.25 (非常敏感)
-        sensitivity_factor = (self._sensitivity - 1) / 9.0  # 0.0 to 1.0
-        
-        self._palm_size_threshold = 0.7 - (sensitivity_factor * 0.45)
-        self._stylus_size_threshold = 0.15 - (sensitivity_factor * 0.05)
-        self._stylus_pressure_threshold = 0.4 - (sensitivity_factor * 0.15)
+        """根据灵敏度更新阈值（查预先计算的阈值表）"""
+        self._thresholds = _THRESHOLDS_BY_SENSITIVITY[self._sensitivity - 1]
+        (
+            self._palm_size_threshold,
+            self._stylus_size_threshold,
+            self._stylus_pressure_threshold,
+        ) = self._thresholds
     
     @property
     def sensitivity(self) -> int:
@@ -110,22 +156,85 @@ class PalmRejectionSystem(IPalmRejectionSystem):
             TouchType: 分类后的触摸类型
         """
         # 如果事件已经有明确的类型（如来自硬件的手写笔事件），直接返回
-        if event.touch_type == TouchType.STYLUS:
-            return TouchType.STYLUS
+        if event.touch_type is _STYLUS:
+            return _STYLUS
         
         size = event.size
         pressure = event.pressure
         
         # 大面积低压力 -> 手掌
-        if size >= self._palm_size_threshold and pressure < 0.3:
-            return TouchType.PALM
+        if size >= self._palm_size_threshold and pressure < PALM_PRESSURE_LIMIT:
+            return _PALM
         
         # 小面积高压力 -> 手写笔
         if size <= self._stylus_size_threshold and pressure >= self._stylus_pressure_threshold:
-            return TouchType.STYLUS
+            return _STYLUS
         
         # 中等情况 -> 手指
-        return TouchType.FINGER
+        return _FINGER
+    
+    def classify_batch(
+        self,
+        sizes: Sequence[float],
+        pressures: Sequence[float],
+        stylus_hints: Sequence[bool]
+    ) -> Sequence[int]:
+        """
+        批量分类触摸（列式输入）
+        
+        与逐个调用 classify_touch 的结果一致。安装了 NumPy 时整批向量化计算，
+        各掩码组合成查找表下标后一次取值，不含逐元素分支；否则在一次循环中
+        完成，阈值只读取一次。
+        
+        Args:
+            sizes: 各触摸的面积
+            pressures: 各触摸的压力
+            stylus_hints: 各触摸是否已被硬件标记为手写笔
+            
+        Returns:
+            各触摸的类型编码（FINGER_CODE/PALM_CODE/STYLUS_CODE），
+            可用 TOUCH_TYPE_BY_CODE 映射回 TouchType
+        """
+        palm_size, stylus_size, stylus_pressure = self._thresholds
+        
+        if np is not None:
+            sizes = np.asarray(sizes, dtype=np.float64)
+            pressures = np.asarray(pressures, dtype=np.float64)
+            hints = np.asarray(stylus_hints, dtype=np.uint8)
+            palm_mask = ((sizes >= palm_size) & (pressures < PALM_PRESSURE_LIMIT)).view(np.uint8)
+            stylus_mask = ((sizes <= stylus_size) & (pressures >= stylus_pressure)).view(np.uint8)
+            # 无分支：组合掩码后一次查表
+            return _CODE_LUT_ARRAY[(hints << 2) | (palm_mask << 1) | stylus_mask]
+        
+        codes = []
+        append = codes.append
+        for size, pressure, hint in zip(sizes, pressures, stylus_hints):
+            if hint:
+                append(STYLUS_CODE)
+            elif size >= palm_size and pressure < PALM_PRESSURE_LIMIT:
+                append(PALM_CODE)
+            elif size <= stylus_size and pressure >= stylus_pressure:
+                append(STYLUS_CODE)
+            else:
+                append(FINGER_CODE)
+        return codes
+    
+    def classify_events(self, events: Sequence[TouchEvent]) -> List[TouchType]:
+        """
+        批量分类触摸事件
+        
+        Args:
+            events: 触摸事件列表
+            
+        Returns:
+            与事件顺序一致的触摸类型列表
+        """
+        codes = self.classify_batch(
+            [event.size for event in events],
+            [event.pressure for event in events],
+            [event.touch_type is _STYLUS for event in events],
+        )
+        return [TOUCH_TYPE_BY_CODE[code] for code in codes]
     
     def should_reject(self, event: TouchEvent) -> bool:
         """
@@ -147,15 +256,52 @@ class PalmRejectionSystem(IPalmRejectionSystem):
         touch_type = self.classify_touch(event)
         
         # 手掌触摸总是被拒绝
-        if touch_type == TouchType.PALM:
+        if touch_type is _PALM:
             return True
         
         # 手写笔悬停时，拒绝非手写笔触摸
-        if self._stylus_hovering and touch_type != TouchType.STYLUS:
+        if self._stylus_hovering and touch_type is not _STYLUS:
             return True
         
         return False
     
+    def reject_batch(
+        self,
+        sizes: Sequence[float],
+        pressures: Sequence[float],
+        stylus_hints: Sequence[bool]
+    ) -> Sequence[bool]:
+        """
+        批量判断是否拒绝触摸（列式输入，如同一帧内收到的所有触摸）
+        
+        与逐个调用 should_reject 的结果一致。防误触开关和悬停状态对整批相同，
+        只需在分类结果上做一次判断。
+        
+        Args:
+            sizes: 各触摸的面积
+            pressures: 各触摸的压力
+            stylus_hints: 各触摸是否已被硬件标记为手写笔
+            
+        Returns:
+            各触摸是否应被拒绝
+        """
+        if not self._palm_rejection_enabled:
+            if np is not None:
+                return np.zeros(len(sizes), dtype=bool)
+            return [False] * len(sizes)
+        
+        codes = self.classify_batch(sizes, pressures, stylus_hints)
+        
+        if np is not None:
+            # 悬停时拒绝所有非手写笔触摸（包括手掌），否则只拒绝手掌
+            if self._stylus_hovering:
+                return codes != STYLUS_CODE
+            return codes == PALM_CODE
+        
+        if self._stylus_hovering:
+            return [code != STYLUS_CODE for code in codes]
+        return [code == PALM_CODE for code in codes]
+    
     def set_sensitivity(self, level: int) -> None:
         """
         设置防误触灵敏度
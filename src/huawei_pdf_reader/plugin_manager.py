@@ -7,19 +7,25 @@
 
 import importlib.util
 import json
+import logging
 import os
 import shutil
 import sys
+import time
 import traceback
 import zipfile
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from pathlib import Path, PurePosixPath
+from types import MappingProxyType
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Tuple, Union
 import uuid
+import zlib
 
-from huawei_pdf_reader.models import PluginInfo
+from huawei_pdf_reader.models import PluginInfo, _json_loads
 from huawei_pdf_reader.database import Database
 
 
@@ -47,6 +53,20 @@ class PluginExecutionError(PluginError):
 
 # ============== 插件API接口 ==============
 
+# 插件日志同时转发到标准logging，输出级别由该logger的配置决定
+_logger = logging.getLogger("huawei_pdf_reader.plugin")
+
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+# 每个插件保留的日志条数上限，超出后丢弃最旧的条目
+MAX_LOG_ENTRIES = 1000
+
+
 class PluginAPI:
     """
     插件API接口
@@ -66,27 +86,46 @@ class PluginAPI:
     - storage: 本地存储
     """
     
-    def __init__(self, plugin_id: str, permissions: List[str]):
+    __slots__ = (
+        "_plugin_id",
+        "_permissions",
+        "_has_events",
+        "_has_storage",
+        "_callbacks",
+        "_storage",
+        "_logs",
+        "_log_enabled",
+    )
+    
+    def __init__(
+        self,
+        plugin_id: str,
+        permissions: List[str],
+        max_logs: Optional[int] = MAX_LOG_ENTRIES,
+    ):
         """
         初始化插件API
         
         Args:
             plugin_id: 插件ID
             permissions: 插件拥有的权限列表
+            max_logs: 保留的日志条数上限，None表示不限制
         """
         self._plugin_id = plugin_id
-        self._permissions = set(permissions)
-        self._callbacks: Dict[str, List[Callable]] = {}
+        self._permissions = frozenset(permissions)
+        # 权限在插件生命周期内不变，高频接口使用的权限预先计算
+        self._has_events = "events" in self._permissions
+        self._has_storage = "storage" in self._permissions
+        # 每个事件的回调保存为元组，注册/取消时整体替换（写时复制），读取无需拷贝
+        self._callbacks: Dict[str, Tuple[Callable, ...]] = {}
         self._storage: Dict[str, Any] = {}
-        self._logs: List[Dict[str, Any]] = []
-    
-    def _check_permission(self, permission: str) -> bool:
-        """检查是否有指定权限"""
-        return permission in self._permissions
+        # 日志以 (级别, 消息, 时间戳) 记录，读取时才格式化时间
+        self._logs: Deque[Tuple[str, str, float]] = deque(maxlen=max_logs)
+        self._log_enabled = True
     
     def _require_permission(self, permission: str) -> None:
         """要求指定权限，无权限则抛出异常"""
-        if not self._check_permission(permission):
+        if permission not in self._permissions:
             raise PermissionDeniedError(
                 f"插件 {self._plugin_id} 没有 {permission} 权限"
             )
@@ -104,11 +143,9 @@ class PluginAPI:
         Returns:
             是否注册成功
         """
-        if not self._check_permission("events"):
+        if not self._has_events:
             return False
-        if event not in self._callbacks:
-            self._callbacks[event] = []
-        self._callbacks[event].append(callback)
+        self._callbacks[event] = self._callbacks.get(event, ()) + (callback,)
         return True
     
     def unregister_callback(self, event: str, callback: Callable) -> bool:
@@ -122,14 +159,16 @@ class PluginAPI:
         Returns:
             是否取消成功
         """
-        if event in self._callbacks and callback in self._callbacks[event]:
-            self._callbacks[event].remove(callback)
-            return True
-        return False
+        callbacks = self._callbacks.get(event, ())
+        if callback not in callbacks:
+            return False
+        index = callbacks.index(callback)
+        self._callbacks[event] = callbacks[:index] + callbacks[index + 1:]
+        return True
     
-    def get_callbacks(self, event: str) -> List[Callable]:
-        """获取指定事件的所有回调"""
-        return self._callbacks.get(event, []).copy()
+    def get_callbacks(self, event: str) -> Tuple[Callable, ...]:
+        """获取指定事件的所有回调（不可变快照）"""
+        return self._callbacks.get(event, ())
     
     def clear_callbacks(self) -> None:
         """清除所有回调"""
@@ -145,18 +184,34 @@ class PluginAPI:
             message: 日志消息
             level: 日志级别 (debug, info, warning, error)
         """
-        log_entry = {
-            "plugin_id": self._plugin_id,
-            "level": level.upper(),
-            "message": message,
-            "timestamp": datetime.now().isoformat(),
-        }
-        self._logs.append(log_entry)
-        print(f"[Plugin:{self._plugin_id}][{level.upper()}] {message}")
+        if not self._log_enabled:
+            return
+        level = level.upper()
+        self._logs.append((level, message, time.time()))
+        # 参数单独传入，logger未启用该级别时不做格式化
+        _logger.log(LOG_LEVELS.get(level, logging.INFO), "[Plugin:%s] %s", self._plugin_id, message)
+    
+    def set_log_enabled(self, enabled: bool) -> None:
+        """
+        启用或停用日志记录
+        
+        Args:
+            enabled: 是否记录日志，停用后log()直接返回
+        """
+        self._log_enabled = enabled
     
     def get_logs(self) -> List[Dict[str, Any]]:
         """获取日志记录"""
-        return self._logs.copy()
+        plugin_id = self._plugin_id
+        return [
+            {
+                "plugin_id": plugin_id,
+                "level": level,
+                "message": message,
+                "timestamp": datetime.fromtimestamp(ts).isoformat(),
+            }
+            for level, message, ts in self._logs
+        ]
     
     def clear_logs(self) -> None:
         """清除日志"""
@@ -175,7 +230,7 @@ class PluginAPI:
         Returns:
             是否存储成功
         """
-        if not self._check_permission("storage"):
+        if not self._has_storage:
             return False
         self._storage[key] = value
         return True
@@ -191,7 +246,7 @@ class PluginAPI:
         Returns:
             存储的数据或默认值
         """
-        if not self._check_permission("storage"):
+        if not self._has_storage:
             return default
         return self._storage.get(key, default)
     
@@ -205,18 +260,18 @@ class PluginAPI:
         Returns:
             是否删除成功
         """
-        if not self._check_permission("storage"):
+        if not self._has_storage:
             return False
         if key in self._storage:
             del self._storage[key]
             return True
         return False
     
-    def get_all_data(self) -> Dict[str, Any]:
-        """获取所有存储的数据"""
-        if not self._check_permission("storage"):
-            return {}
-        return self._storage.copy()
+    def get_all_data(self) -> Mapping[str, Any]:
+        """获取所有存储的数据（只读视图，随后续存储操作更新）"""
+        if not self._has_storage:
+            return MappingProxyType({})
+        return MappingProxyType(self._storage)
     
     # ============== 信息查询 ==============
     
@@ -230,7 +285,7 @@ class PluginAPI:
     
     def has_permission(self, permission: str) -> bool:
         """检查是否有指定权限"""
-        return self._check_permission(permission)
+        return permission in self._permissions
     
     # ============== 清理 ==============
     
@@ -270,13 +325,16 @@ class IPlugin(ABC):
 
 # ============== 插件沙箱 ==============
 
-@dataclass
+@dataclass(slots=True)
 class PluginSandbox:
     """
     插件沙箱
     
     用于隔离插件执行环境，捕获插件错误。
     提供错误计数和自动禁用机制。
+
+    捕获异常时只记录简短的错误信息并保留异常对象，
+    完整堆栈在读取 formatted_traceback 时才格式化（调试模式下立即记录）。
     """
     plugin_id: str
     plugin_instance: Optional[IPlugin] = None
@@ -285,6 +343,8 @@ class PluginSandbox:
     last_error: Optional[str] = None
     error_count: int = 0
     max_errors: int = 5  # 最大错误次数，超过后自动禁用
+    debug: bool = False  # 调试模式：last_error 中直接包含完整堆栈
+    _last_exc: Optional[BaseException] = field(default=None, init=False, repr=False, compare=False)
     
     def execute_safely(self, func: Callable, *args, **kwargs) -> Tuple[bool, Any, Optional[str]]:
         """
@@ -305,8 +365,19 @@ class PluginSandbox:
             return True, result, None
         except Exception as e:
             self.error_count += 1
-            self.last_error = f"{type(e).__name__}: {str(e)}\n{traceback.format_exc()}"
+            self._last_exc = e
+            self.last_error = f"{type(e).__name__}: {e}"
+            if self.debug:
+                self.last_error = f"{self.last_error}\n{self.formatted_traceback}"
             return False, None, self.last_error
+
+    @property
+    def formatted_traceback(self) -> Optional[str]:
+        """最后一次异常的完整堆栈（按需格式化），无异常时返回None"""
+        exc = self._last_exc
+        if exc is None:
+            return None
+        return "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
     
     def should_disable(self) -> bool:
         """
@@ -323,6 +394,7 @@ class PluginSandbox:
         """重置错误计数"""
         self.error_count = 0
         self.last_error = None
+        self._last_exc = None
     
     def get_error_summary(self) -> Dict[str, Any]:
         """
@@ -337,6 +409,7 @@ class PluginSandbox:
             "error_count": self.error_count,
             "max_errors": self.max_errors,
             "last_error": self.last_error,
+            "traceback": self.formatted_traceback,
             "should_disable": self.should_disable(),
         }
 
@@ -352,16 +425,23 @@ class PluginManager:
     - 安装和卸载插件
     - 启用和禁用插件
     - 错误隔离和恢复
+    
+    插件信息查询结果缓存在实例中，并在本管理器修改插件表时失效；
+    插件表应只通过同一个管理器修改，否则缓存可能过期。
     """
     
     # 插件清单文件名
     MANIFEST_FILE = "plugin.json"
     
-    # 必需的清单字段
-    REQUIRED_MANIFEST_FIELDS = ["id", "name", "version", "entry_point"]
+    # 插件入口模块可用此属性直接声明插件类，省去扫描
+    PLUGIN_CLASS_ATTR = "PLUGIN_CLASS"
+    
+    # 必需的清单字段（有序元组用于按顺序报告错误，集合用于成员检查）
+    REQUIRED_MANIFEST_FIELDS_LIST = ("id", "name", "version", "entry_point")
+    REQUIRED_MANIFEST_FIELDS = frozenset(REQUIRED_MANIFEST_FIELDS_LIST)
     
-    # 允许的权限列表
-    ALLOWED_PERMISSIONS = [
+    # 允许的权限（有序元组用于界面展示，集合用于成员检查）
+    ALLOWED_PERMISSIONS_LIST = (
         "events",           # 事件监听
         "document_read",    # 读取文档
         "document_write",   # 修改文档
@@ -371,20 +451,29 @@ class PluginManager:
         "settings_write",   # 修改设置
         "network",          # 网络访问
         "storage",          # 本地存储
-    ]
+    )
+    ALLOWED_PERMISSIONS = frozenset(ALLOWED_PERMISSIONS_LIST)
     
-    def __init__(self, db: Database, plugins_dir: Path):
+    # 启动时并行导入插件模块的最大线程数
+    PRELOAD_WORKERS = 8
+    
+    def __init__(self, db: Database, plugins_dir: Path, link_install: bool = False):
         """
         初始化插件管理器
         
         Args:
             db: 数据库实例
             plugins_dir: 插件安装目录
+            link_install: 目录插件与安装目录位于同一文件系统时以硬链接安装，
+                不复制文件内容（安装后的文件与源文件共享数据，修改源文件会影响已安装插件）
         """
         self._db = db
         self._plugins_dir = plugins_dir
+        self._link_install = link_install
         self._sandboxes: Dict[str, PluginSandbox] = {}
-        self._loaded_modules: Dict[str, Any] = {}
+        self._plugin_class_cache: Dict[str, Tuple[Any, type]] = {}
+        self._plugin_cache: Dict[str, PluginInfo] = {}
+        self._enabled_cache: Optional[List[PluginInfo]] = None
         
         # 确保插件目录存在
         self._plugins_dir.mkdir(parents=True, exist_ok=True)
@@ -421,27 +510,56 @@ class PluginManager:
         """验证zip格式的插件"""
         try:
             with zipfile.ZipFile(zip_path, 'r') as zf:
-                # 检查是否包含清单文件
-                names = zf.namelist()
-                manifest_path = None
-                
-                for name in names:
-                    if name.endswith(self.MANIFEST_FILE):
-                        manifest_path = name
-                        break
-                
-                if not manifest_path:
-                    return False, f"插件缺少清单文件: {self.MANIFEST_FILE}"
-                
-                # 读取并验证清单
-                manifest_data = zf.read(manifest_path).decode('utf-8')
-                return self._validate_manifest(manifest_data)
+                self._validate_open_zip(zf)
+            return True, ""
                 
         except zipfile.BadZipFile:
             return False, "无效的zip文件"
+        except ValueError as e:
+            return False, str(e)
         except Exception as e:
             return False, f"读取zip文件失败: {str(e)}"
     
+    def _validate_open_zip(self, zf: zipfile.ZipFile) -> dict:
+        """
+        验证已打开的zip插件并返回清单
+        
+        Args:
+            zf: 已打开的zip文件
+            
+        Returns:
+            解析后的清单
+            
+        Raises:
+            ValueError: 缺少清单或清单无效
+        """
+        manifest_path = self._find_manifest_in_zip(zf)
+        if not manifest_path:
+            raise ValueError(f"插件缺少清单文件: {self.MANIFEST_FILE}")
+        return self._check_manifest(zf.read(manifest_path))
+    
+    def _find_manifest_in_zip(self, zf: zipfile.ZipFile) -> Optional[str]:
+        """
+        查找zip中的清单文件
+        
+        根目录下的清单直接按名称查找，否则查找第一个文件名为清单名的条目（如打包时带顶层目录）。
+        
+        Args:
+            zf: 已打开的zip文件
+            
+        Returns:
+            清单在zip中的路径，未找到则返回None
+        """
+        try:
+            return zf.getinfo(self.MANIFEST_FILE).filename
+        except KeyError:
+            pass
+        suffix = "/" + self.MANIFEST_FILE
+        for name in zf.namelist():
+            if name.endswith(suffix):
+                return name
+        return None
+    
     def _validate_dir_plugin(self, dir_path: Path) -> Tuple[bool, str]:
         """验证目录格式的插件"""
         manifest_path = dir_path / self.MANIFEST_FILE
@@ -450,40 +568,67 @@ class PluginManager:
             return False, f"插件缺少清单文件: {self.MANIFEST_FILE}"
         
         try:
-            manifest_data = manifest_path.read_text(encoding='utf-8')
+            manifest_data = manifest_path.read_bytes()
             return self._validate_manifest(manifest_data)
         except Exception as e:
             return False, f"读取清单文件失败: {str(e)}"
     
-    def _validate_manifest(self, manifest_data: str) -> Tuple[bool, str]:
+    def _validate_manifest(self, manifest_data: Union[str, bytes]) -> Tuple[bool, str]:
         """验证清单内容"""
         try:
-            manifest = json.loads(manifest_data)
-        except json.JSONDecodeError as e:
-            return False, f"清单文件JSON格式错误: {str(e)}"
+            self._check_manifest(manifest_data)
+        except ValueError as e:
+            return False, str(e)
+        return True, ""
+    
+    def _check_manifest(self, manifest_data: Union[str, bytes]) -> dict:
+        """
+        解析并验证清单内容
         
-        # 检查必需字段
-        for field in self.REQUIRED_MANIFEST_FIELDS:
-            if field not in manifest:
-                return False, f"清单缺少必需字段: {field}"
-            if not manifest[field]:
-                return False, f"清单字段不能为空: {field}"
+        Args:
+            manifest_data: 清单JSON文本或UTF-8字节
+            
+        Returns:
+            解析后的清单
+            
+        Raises:
+            ValueError: 清单无效
+        """
+        try:
+            manifest = _json_loads(manifest_data)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"清单文件JSON格式错误: {str(e)}")
+        
+        # 检查必需字段（集合运算一次完成，出错时再按声明顺序定位字段）
+        required = self.REQUIRED_MANIFEST_FIELDS_LIST
+        missing = self.REQUIRED_MANIFEST_FIELDS.difference(manifest)
+        if missing:
+            field = next(f for f in required if f in missing)
+            raise ValueError(f"清单缺少必需字段: {field}")
+        if not all(manifest[f] for f in required):
+            field = next(f for f in required if not manifest[f])
+            raise ValueError(f"清单字段不能为空: {field}")
         
         # 验证权限
         permissions = manifest.get("permissions", [])
         if not isinstance(permissions, list):
-            return False, "permissions字段必须是数组"
+            raise ValueError("permissions字段必须是数组")
         
-        for perm in permissions:
-            if perm not in self.ALLOWED_PERMISSIONS:
-                return False, f"未知的权限: {perm}"
+        allowed = self.ALLOWED_PERMISSIONS
+        try:
+            permissions_ok = allowed.issuperset(permissions)
+        except TypeError:  # 含不可哈希的元素
+            permissions_ok = False
+        if not permissions_ok:
+            perm = next(p for p in permissions if not isinstance(p, str) or p not in allowed)
+            raise ValueError(f"未知的权限: {perm}")
         
         # 验证入口点格式
         entry_point = manifest["entry_point"]
         if not entry_point.endswith(".py"):
-            return False, "入口点必须是.py文件"
+            raise ValueError("入口点必须是.py文件")
         
-        return True, ""
+        return manifest
     
     def install_plugin(self, plugin_path: Path) -> PluginInfo:
         """
@@ -499,24 +644,22 @@ class PluginManager:
             ValueError: 插件验证失败
             FileExistsError: 插件已存在
         """
-        # 先验证插件
-        is_valid, error = self.validate_plugin(plugin_path)
-        if not is_valid:
-            raise ValueError(f"插件验证失败: {error}")
-        
-        # 读取清单获取插件信息
-        manifest = self._read_manifest(plugin_path)
+        if plugin_path.suffix == ".zip" and plugin_path.is_file():
+            manifest = self._install_zip_plugin(plugin_path)
+        else:
+            # 先验证插件
+            is_valid, error = self.validate_plugin(plugin_path)
+            if not is_valid:
+                raise ValueError(f"插件验证失败: {error}")
+            
+            # 读取清单获取插件信息
+            manifest = self._read_manifest(plugin_path)
+            install_dir = self._get_install_dir(manifest["id"])
+            
+            # 安装插件文件
+            self._install_plugin_files(plugin_path, install_dir)
         plugin_id = manifest["id"]
         
-        # 检查是否已安装
-        existing = self._db.get_plugin(plugin_id)
-        if existing:
-            raise FileExistsError(f"插件已安装: {plugin_id}")
-        
-        # 安装插件文件
-        install_dir = self._plugins_dir / plugin_id
-        self._install_plugin_files(plugin_path, install_dir)
-        
         # 创建插件信息
         plugin_info = PluginInfo(
             id=plugin_id,
@@ -532,19 +675,96 @@ class PluginManager:
         
         # 保存到数据库
         self._db.add_plugin(plugin_info)
+        self._invalidate_plugin(plugin_id)
         
         return plugin_info
     
+    def _install_zip_plugin(self, zip_path: Path) -> dict:
+        """
+        验证并解压zip插件
+        
+        验证、读取清单和解压共用同一个ZipFile，中央目录只解析一次。
+        
+        Args:
+            zip_path: zip插件路径
+            
+        Returns:
+            插件清单
+            
+        Raises:
+            ValueError: 插件验证失败
+            FileExistsError: 插件已存在
+        """
+        try:
+            zf = zipfile.ZipFile(zip_path, 'r')
+        except zipfile.BadZipFile:
+            raise ValueError("插件验证失败: 无效的zip文件")
+        
+        with zf:
+            try:
+                manifest = self._validate_open_zip(zf)
+            except Exception as e:
+                raise ValueError(f"插件验证失败: {str(e)}")
+            
+            install_dir = self._get_install_dir(manifest["id"])
+            if install_dir.is_dir():
+                self._sync_zip_to_dir(zf, install_dir)
+            else:
+                zf.extractall(install_dir)
+        return manifest
+    
+    @staticmethod
+    def _sync_zip_to_dir(zf: zipfile.ZipFile, dest: Path) -> None:
+        """
+        将zip内容增量同步到已存在的目录
+        
+        大小和CRC32（zip中央目录已记录）与磁盘文件一致的条目跳过，其余条目重新解压，
+        zip中不存在的旧文件删除。
+        
+        Args:
+            zf: 已打开的zip文件
+            dest: 目标目录
+        """
+        expected: Dict[Path, zipfile.ZipInfo] = {}
+        for info in zf.infolist():
+            name = PurePosixPath(info.filename)
+            # 只比较普通的相对路径，其余条目交给extract处理（它会清理路径）
+            if info.is_dir() or name.is_absolute() or ".." in name.parts:
+                continue
+            expected[dest.joinpath(*name.parts)] = info
+        
+        for path in list(dest.rglob("*")):
+            if path.is_file() and path not in expected:
+                path.unlink()
+        
+        for info in zf.infolist():
+            path = dest.joinpath(*PurePosixPath(info.filename).parts)
+            if expected.get(path) is info and path.is_file():
+                if path.stat().st_size == info.file_size and zlib.crc32(path.read_bytes()) == info.CRC:
+                    continue
+            zf.extract(info, dest)
+    
+    def _get_install_dir(self, plugin_id: str) -> Path:
+        """
+        获取插件安装目录，插件已安装时抛出异常
+        
+        Raises:
+            FileExistsError: 插件已存在
+        """
+        if self.get_plugin(plugin_id):
+            raise FileExistsError(f"插件已安装: {plugin_id}")
+        return self._plugins_dir / plugin_id
+    
     def _read_manifest(self, plugin_path: Path) -> dict:
         """读取插件清单"""
         if plugin_path.suffix == ".zip":
             with zipfile.ZipFile(plugin_path, 'r') as zf:
-                for name in zf.namelist():
-                    if name.endswith(self.MANIFEST_FILE):
-                        return json.loads(zf.read(name).decode('utf-8'))
+                manifest_path = self._find_manifest_in_zip(zf)
+                if manifest_path:
+                    return _json_loads(zf.read(manifest_path))
         else:
             manifest_path = plugin_path / self.MANIFEST_FILE
-            return json.loads(manifest_path.read_text(encoding='utf-8'))
+            return _json_loads(manifest_path.read_bytes())
         raise ValueError("无法读取插件清单")
     
     def _install_plugin_files(self, source: Path, dest: Path) -> None:
@@ -558,6 +778,14 @@ class PluginManager:
             with zipfile.ZipFile(source, 'r') as zf:
                 zf.extractall(dest)
         else:
+            if self._link_install and source.stat().st_dev == self._plugins_dir.stat().st_dev:
+                # 同一文件系统：硬链接，只写目录项
+                try:
+                    shutil.copytree(source, dest, copy_function=os.link)
+                    return
+                except OSError:
+                    # 文件系统不支持硬链接等情况，回退到复制
+                    shutil.rmtree(dest, ignore_errors=True)
             # 复制目录
             shutil.copytree(source, dest)
     
@@ -571,7 +799,7 @@ class PluginManager:
         Raises:
             ValueError: 插件不存在
         """
-        plugin = self._db.get_plugin(plugin_id)
+        plugin = self.get_plugin(plugin_id)
         if not plugin:
             raise ValueError(f"插件不存在: {plugin_id}")
         
@@ -586,6 +814,10 @@ class PluginManager:
         
         # 从数据库删除
         self._db.delete_plugin(plugin_id)
+        self._invalidate_plugin(plugin_id)
+        
+        # 未启用（如加载失败）的插件也可能留有已导入的模块
+        self._discard_plugin_module(plugin_id)
         
         # 清理沙箱
         if plugin_id in self._sandboxes:
@@ -601,7 +833,7 @@ class PluginManager:
         Raises:
             ValueError: 插件不存在或加载失败
         """
-        plugin = self._db.get_plugin(plugin_id)
+        plugin = self.get_plugin(plugin_id)
         if not plugin:
             raise ValueError(f"插件不存在: {plugin_id}")
         
@@ -612,7 +844,7 @@ class PluginManager:
         self._load_plugin(plugin)
         
         # 更新数据库状态
-        self._db.update_plugin_status(plugin_id, True)
+        self._set_plugin_status(plugin_id, True)
     
     def disable_plugin(self, plugin_id: str) -> None:
         """
@@ -624,7 +856,7 @@ class PluginManager:
         Raises:
             ValueError: 插件不存在
         """
-        plugin = self._db.get_plugin(plugin_id)
+        plugin = self.get_plugin(plugin_id)
         if not plugin:
             raise ValueError(f"插件不存在: {plugin_id}")
         
@@ -635,7 +867,7 @@ class PluginManager:
         self._unload_plugin(plugin_id)
         
         # 更新数据库状态
-        self._db.update_plugin_status(plugin_id, False)
+        self._set_plugin_status(plugin_id, False)
     
     def _load_plugin(self, plugin: PluginInfo) -> None:
         """加载插件"""
@@ -649,27 +881,14 @@ class PluginManager:
         sandbox = PluginSandbox(plugin_id=plugin.id)
         
         try:
-            # 动态加载模块
-            spec = importlib.util.spec_from_file_location(
-                f"plugin_{plugin.id}",
-                entry_point
-            )
-            if spec is None or spec.loader is None:
-                raise ValueError("无法加载插件模块")
-            
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[f"plugin_{plugin.id}"] = module
-            spec.loader.exec_module(module)
+            # 模块已导入时直接复用，跳过spec构建和模块执行
+            module_name = f"plugin_{plugin.id}"
+            module = sys.modules.get(module_name)
+            if module is None:
+                module = self._import_plugin_module(module_name, entry_point)
             
             # 查找插件类
-            plugin_class = None
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (isinstance(attr, type) and 
-                    issubclass(attr, IPlugin) and 
-                    attr is not IPlugin):
-                    plugin_class = attr
-                    break
+            plugin_class = self._find_plugin_class(module_name, module)
             
             if plugin_class is None:
                 raise ValueError("插件模块中未找到IPlugin实现类")
@@ -694,13 +913,77 @@ class PluginManager:
             sandbox.is_loaded = True
             
             self._sandboxes[plugin.id] = sandbox
-            self._loaded_modules[plugin.id] = module
             
         except Exception as e:
+            # 加载失败的模块不保留，重新安装或再次启用时重新导入
+            self._discard_plugin_module(plugin.id)
             sandbox.last_error = str(e)
             self._sandboxes[plugin.id] = sandbox
             raise ValueError(f"加载插件失败: {str(e)}")
     
+    def _discard_plugin_module(self, plugin_id: str) -> None:
+        """从sys.modules和插件类缓存中移除插件模块"""
+        module_name = f"plugin_{plugin_id}"
+        sys.modules.pop(module_name, None)
+        self._plugin_class_cache.pop(module_name, None)
+    
+    def _find_plugin_class(self, module_name: str, module: Any) -> Optional[type]:
+        """
+        查找模块中的IPlugin实现类
+        
+        模块通过PLUGIN_CLASS声明插件类时直接使用，否则按定义顺序遍历模块命名空间
+        （跳过下划线开头的名称），返回第一个IPlugin子类；
+        结果按模块缓存，同一模块对象再次加载时不重复扫描。
+        
+        Args:
+            module_name: 模块名
+            module: 插件模块
+            
+        Returns:
+            插件类，未找到则返回None
+        """
+        cached = self._plugin_class_cache.get(module_name)
+        if cached is not None and cached[0] is module:
+            return cached[1]
+        
+        declared = getattr(module, self.PLUGIN_CLASS_ATTR, None)
+        if isinstance(declared, type) and issubclass(declared, IPlugin) and declared is not IPlugin:
+            self._plugin_class_cache[module_name] = (module, declared)
+            return declared
+        
+        for name, attr in vars(module).items():
+            if name.startswith("_"):
+                continue
+            if isinstance(attr, type) and attr is not IPlugin and issubclass(attr, IPlugin):
+                self._plugin_class_cache[module_name] = (module, attr)
+                return attr
+        return None
+    
+    def _import_plugin_module(self, module_name: str, entry_point: Path) -> Any:
+        """
+        从入口文件导入插件模块并注册到sys.modules
+        
+        Args:
+            module_name: 模块名
+            entry_point: 入口文件路径
+            
+        Returns:
+            导入的模块
+        """
+        spec = importlib.util.spec_from_file_location(module_name, entry_point)
+        if spec is None or spec.loader is None:
+            raise ValueError("无法加载插件模块")
+        
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            # 执行失败的模块不能留在sys.modules中被复用
+            sys.modules.pop(module_name, None)
+            raise
+        return module
+    
     def _unload_plugin(self, plugin_id: str) -> None:
         """卸载插件"""
         sandbox = self._sandboxes.get(plugin_id)
@@ -708,17 +991,16 @@ class PluginManager:
         if sandbox and sandbox.plugin_instance:
             # 安全调用on_unload
             sandbox.execute_safely(sandbox.plugin_instance.on_unload)
+            if sandbox.api:
+                # 插件可能仍持有API引用，卸载后的日志调用直接丢弃
+                sandbox.api.set_log_enabled(False)
             sandbox.is_loaded = False
             sandbox.plugin_instance = None
             sandbox.api = None
         
-        # 从sys.modules移除
-        module_name = f"plugin_{plugin_id}"
-        if module_name in sys.modules:
-            del sys.modules[module_name]
-        
-        if plugin_id in self._loaded_modules:
-            del self._loaded_modules[plugin_id]
+        # 从sys.modules移除；模块命名空间交给垃圾回收，
+        # 卸载后仍被引用的回调、线程等可继续访问模块全局变量
+        self._discard_plugin_module(plugin_id)
     
     def get_installed_plugins(self) -> List[PluginInfo]:
         """
@@ -736,7 +1018,9 @@ class PluginManager:
         Returns:
             已启用的插件信息列表
         """
-        return self._db.get_enabled_plugins()
+        if self._enabled_cache is None:
+            self._enabled_cache = self._db.get_enabled_plugins()
+        return list(self._enabled_cache)
     
     def get_plugin(self, plugin_id: str) -> Optional[PluginInfo]:
         """
@@ -748,7 +1032,27 @@ class PluginManager:
         Returns:
             插件信息，不存在则返回None
         """
-        return self._db.get_plugin(plugin_id)
+        plugin = self._plugin_cache.get(plugin_id)
+        if plugin is None:
+            plugin = self._db.get_plugin(plugin_id)
+            if plugin is not None:
+                self._plugin_cache[plugin_id] = plugin
+        return plugin
+    
+    def _set_plugin_status(self, plugin_id: str, enabled: bool) -> None:
+        """更新插件启用状态并使缓存失效"""
+        self._db.update_plugin_status(plugin_id, enabled)
+        self._invalidate_plugin(plugin_id)
+    
+    def invalidate_cache(self) -> None:
+        """清空插件信息缓存（插件表被其他组件修改后调用，如从备份恢复）"""
+        self._plugin_cache.clear()
+        self._enabled_cache = None
+    
+    def _invalidate_plugin(self, plugin_id: str) -> None:
+        """使插件信息缓存失效"""
+        self._plugin_cache.pop(plugin_id, None)
+        self._enabled_cache = None
     
     def is_plugin_loaded(self, plugin_id: str) -> bool:
         """
@@ -763,18 +1067,23 @@ class PluginManager:
         sandbox = self._sandboxes.get(plugin_id)
         return sandbox is not None and sandbox.is_loaded
     
-    def get_plugin_error(self, plugin_id: str) -> Optional[str]:
+    def get_plugin_error(self, plugin_id: str, include_traceback: bool = False) -> Optional[str]:
         """
         获取插件最后的错误信息
         
         Args:
             plugin_id: 插件ID
+            include_traceback: 是否附加完整堆栈
             
         Returns:
             错误信息，无错误则返回None
         """
         sandbox = self._sandboxes.get(plugin_id)
-        return sandbox.last_error if sandbox else None
+        if not sandbox or sandbox.last_error is None:
+            return None
+        if include_traceback and sandbox.formatted_traceback and not sandbox.debug:
+            return f"{sandbox.last_error}\n{sandbox.formatted_traceback}"
+        return sandbox.last_error
     
     def execute_plugin_safely(
         self, 
@@ -816,7 +1125,8 @@ class PluginManager:
             字典，键为插件ID，值为错误信息（成功则为None）
         """
         results = {}
-        enabled_plugins = self._db.get_enabled_plugins()
+        enabled_plugins = self.get_enabled_plugins()
+        self._preload_plugin_modules(enabled_plugins)
         
         for plugin in enabled_plugins:
             try:
@@ -825,10 +1135,42 @@ class PluginManager:
             except Exception as e:
                 results[plugin.id] = str(e)
                 # 加载失败时禁用插件
-                self._db.update_plugin_status(plugin.id, False)
+                self._set_plugin_status(plugin.id, False)
         
         return results
     
+    def _preload_plugin_modules(self, plugins: List[PluginInfo]) -> None:
+        """
+        并行导入插件模块
+        
+        读取和编译插件文件互不依赖，在线程池中并行执行；导入的模块注册到sys.modules，
+        随后_load_plugin直接复用。插件实例的创建和on_load仍在调用线程中依次执行。
+        导入失败的模块不会留在sys.modules中，由_load_plugin重新导入并报告错误。
+        
+        Args:
+            plugins: 待加载的插件列表
+        """
+        pending = []
+        for plugin in plugins:
+            module_name = f"plugin_{plugin.id}"
+            entry_point = self._plugins_dir / plugin.id / plugin.entry_point
+            if module_name not in sys.modules and entry_point.exists():
+                pending.append((module_name, entry_point))
+        
+        if len(pending) < 2:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(self.PRELOAD_WORKERS, len(pending))) as executor:
+            futures = [
+                executor.submit(self._import_plugin_module, module_name, entry_point)
+                for module_name, entry_point in pending
+            ]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception:
+                    pass
+    
     def get_sandbox(self, plugin_id: str) -> Optional[PluginSandbox]:
         """
         获取插件沙箱
@@ -858,4 +1200,4 @@ class PluginManager:
         
         # 清理所有沙箱
         self._sandboxes.clear()
-        self._loaded_modules.clear()
+        self._plugin_class_cache.clear()
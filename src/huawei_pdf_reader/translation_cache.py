@@ -0,0 +1,119 @@
+"""
+华为平板PDF阅读器 - 持久化翻译缓存
+
+基于 SQLite 的翻译结果缓存，应用重启后仍然有效。
+反复查阅同一份技术文档时，相同术语无需再次请求翻译服务。
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+# 缓存条目有效期（秒）：30 天
+TTL = 30 * 24 * 3600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    action TEXT NOT NULL,
+    text_hash BLOB NOT NULL,
+    result_text TEXT NOT NULL,
+    ts REAL NOT NULL,
+    PRIMARY KEY (action, text_hash)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_translations_ts ON translations(ts);
+"""
+
+_SQL_GET = "SELECT result_text FROM translations WHERE action = ? AND text_hash = ?"
+_SQL_PUT = """
+INSERT OR REPLACE INTO translations (action, text_hash, result_text, ts)
+VALUES (?, ?, ?, ?)
+"""
+_SQL_PRUNE = "DELETE FROM translations WHERE ts < ?"
+_SQL_COUNT = "SELECT COUNT(*) FROM translations"
+
+
+def _text_digest(text: str) -> bytes:
+    """文本摘要（16 字节 BLAKE2b），作为缓存键"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class PersistentTranslationCache:
+    """
+    持久化翻译缓存
+
+    以 (操作, 文本摘要) 为键保存翻译结果。使用单一连接并开启 WAL，
+    读写均由锁串行化，可在后台线程中执行清理。
+    """
+
+    def __init__(self, db_path: Path, ttl: float = TTL):
+        """
+        初始化缓存
+
+        Args:
+            db_path: 缓存数据库文件路径
+            ttl: 条目有效期（秒），超过该时间的条目在 prune 时删除
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def get(self, action: str, text: str) -> Optional[str]:
+        """
+        查询缓存的翻译结果
+
+        Args:
+            action: 操作标识（如 MagnifierAction 的值）
+            text: 原文
+
+        Returns:
+            翻译结果，未命中时返回 None
+        """
+        with self._lock:
+            row = self._conn.execute(_SQL_GET, (action, _text_digest(text))).fetchone()
+        return row[0] if row else None
+
+    def put(self, action: str, text: str, result: str) -> None:
+        """
+        保存翻译结果
+
+        Args:
+            action: 操作标识
+            text: 原文
+            result: 翻译结果
+        """
+        with self._lock:
+            self._conn.execute(_SQL_PUT, (action, _text_digest(text), result, time.time()))
+            self._conn.commit()
+
+    def prune(self) -> int:
+        """
+        删除过期条目
+
+        Returns:
+            删除的条目数
+        """
+        with self._lock:
+            cursor = self._conn.execute(_SQL_PRUNE, (time.time() - self.ttl,))
+            self._conn.commit()
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(_SQL_COUNT).fetchone()[0]
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
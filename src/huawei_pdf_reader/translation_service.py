@@ -4,15 +4,23 @@
 提供英汉互译功能，支持百度翻译 API。
 """
 
+import asyncio
 import hashlib
+import itertools
 import random
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None
 
@@ -27,6 +35,53 @@ class ITranslationService(ABC):
         """翻译文本"""
         pass
     
+    def translate_batch(
+        self,
+        texts: List[str],
+        direction: TranslationDirection
+    ) -> List[TranslationResult]:
+        """
+        批量翻译文本
+        
+        默认逐条调用 translate，支持多段请求的服务可覆盖此方法合并请求。
+        
+        Args:
+            texts: 要翻译的文本列表
+            direction: 翻译方向
+        
+        Returns:
+            与输入顺序一致的翻译结果列表
+        """
+        return [self.translate(text, direction) for text in texts]
+    
+    async def translate_async(
+        self,
+        text: str,
+        direction: TranslationDirection
+    ) -> TranslationResult:
+        """
+        异步翻译文本
+        
+        默认在线程池中执行 translate，网络请求期间不阻塞事件循环。
+        """
+        return await asyncio.to_thread(self.translate, text, direction)
+    
+    async def translate_batch_async(
+        self,
+        texts: List[str],
+        direction: TranslationDirection
+    ) -> List[TranslationResult]:
+        """异步批量翻译文本，默认在线程池中执行 translate_batch"""
+        return await asyncio.to_thread(self.translate_batch, texts, direction)
+    
+    def prewarm(self) -> None:
+        """
+        预热服务（如建立网络连接），使首次翻译无需等待连接建立
+        
+        默认不做任何事。
+        """
+        pass
+    
     @abstractmethod
     def is_available(self) -> bool:
         """检查服务是否可用"""
@@ -47,6 +102,54 @@ class TranslationService(ITranslationService):
     # 百度翻译 API 配置
     BAIDU_API_URL = "https://fanyi-api.baidu.com/api/trans/vip/translate"
     
+    # 单次请求的最大字节数（API 限制 6000 字节，留出余量）
+    MAX_QUERY_BYTES = 5000
+    
+    # 翻译方向对应的 (源语言, 目标语言) 代码
+    LANGUAGE_PAIRS: Dict[TranslationDirection, Tuple[str, str]] = {
+        TranslationDirection.EN_TO_ZH: ("en", "zh"),
+        TranslationDirection.ZH_TO_EN: ("zh", "en"),
+    }
+    
+    # 预热后连接视为有效的时间（秒），超过后再次预热会重新建立连接
+    PREWARM_TTL = 540.0
+    
+    # 内存中缓存的翻译结果条数（LRU），阅读时反复查询的术语无需再次请求
+    TRANSLATION_CACHE_SIZE = 2048
+    
+    # 限流令牌桶：最多积累的请求数和每秒补充的令牌数。
+    # 标准版账户 QPS 为 1，突发请求被拒时（54003）可调低 RATE_LIMIT_CAPACITY
+    RATE_LIMIT_CAPACITY = 10
+    RATE_LIMIT_REFILL_RATE = 1.0
+    
+    # 批量翻译拆分为多个请求时，同时进行中的最大请求数
+    MAX_CONCURRENT_REQUESTS = 4
+    
+    # HTTP 连接池：缓存的主机池数量和每个主机保持的连接数。
+    # 连接数大于并发请求数，预热和可用性检查不会挤掉翻译请求的连接
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 8
+    
+    # is_available 检查结果的有效期（秒），期间重复检查不再发起请求
+    AVAILABILITY_TTL = 30.0
+    
+    # 百度翻译 API 错误码（响应 JSON 中为字符串）-> 错误信息
+    ERROR_MESSAGES: Dict[str, str] = {
+        "52000": "成功",
+        "52001": "请求超时，请重试",
+        "52002": "系统错误，请重试",
+        "52003": "未授权用户，请检查 APP ID",
+        "54000": "必填参数为空",
+        "54001": "签名错误，请检查密钥",
+        "54003": "访问频率受限，请降低调用频率",
+        "54004": "账户余额不足",
+        "54005": "长 query 请求频繁，请降低长文本频率",
+        "58000": "客户端 IP 非法",
+        "58001": "译文语言方向不支持",
+        "58002": "服务当前已关闭",
+        "90107": "认证未通过或未生效",
+    }
+    
     def __init__(self, app_id: Optional[str] = None, secret_key: Optional[str] = None):
         """
         初始化翻译服务
@@ -63,8 +166,37 @@ class TranslationService(ITranslationService):
         
         self._app_id = app_id
         self._secret_key = secret_key
-        self._last_request_time = 0
-        self._min_request_interval = 1.0  # 最小请求间隔（秒）
+        self._encode_credentials()
+        
+        # 签名用的 salt 只需每次请求不同：从随机起点递增，无需每次生成随机数
+        self._salts = itertools.count(random.randint(32768, 65536))
+        
+        # 令牌桶限流：空闲时积累令牌，允许短时突发请求
+        self._tokens = float(self.RATE_LIMIT_CAPACITY)
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+        
+        # 批量翻译的并发请求线程池，首次需要时创建
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        
+        # 复用 HTTP 连接（keep-alive），避免每次翻译重新进行 TCP/TLS 握手
+        # 网关错误（502/503/504）短暂退避后重试
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+        ))
+        self._prewarm_lock = threading.Lock()
+        self._prewarmed_at: Optional[float] = None
+        
+        # 最近一次可用性结论 (time.monotonic(), 是否可用)，翻译请求的结果也会更新它
+        self._avail_cache: Optional[Tuple[float, bool]] = None
+        
+        # (翻译方向, 去除首尾空白的原文) -> 译文
+        self._cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def configure(self, app_id: str, secret_key: str) -> None:
         """
@@ -76,6 +208,28 @@ class TranslationService(ITranslationService):
         """
         self._app_id = app_id
         self._secret_key = secret_key
+        self._encode_credentials()
+        self._avail_cache = None
+    
+    def prewarm(self) -> None:
+        """
+        预先建立到翻译 API 的连接
+        
+        在 PREWARM_TTL 内重复调用不会再次请求；并发调用只有一个线程
+        实际发起请求。网络错误被忽略，翻译时会照常重试连接。
+        """
+        if not self._app_id or not self._secret_key:
+            return
+        
+        with self._prewarm_lock:
+            now = time.monotonic()
+            if self._prewarmed_at is not None and now - self._prewarmed_at < self.PREWARM_TTL:
+                return
+            try:
+                self._session.head("https://fanyi-api.baidu.com", timeout=5)
+                self._prewarmed_at = now
+            except Exception:
+                self._prewarmed_at = None
     
     def is_available(self) -> bool:
         """
@@ -83,16 +237,24 @@ class TranslationService(ITranslationService):
         
         Returns:
             如果 API 凭证已配置且网络可用，返回 True
+        
+        网络检查的结果缓存 AVAILABILITY_TTL 秒。
         """
         if not self._app_id or not self._secret_key:
             return False
         
+        cached = self._avail_cache
+        if cached is not None and time.monotonic() - cached[0] < self.AVAILABILITY_TTL:
+            return cached[1]
+        
         # 简单的网络检查
         try:
-            response = requests.head("https://fanyi-api.baidu.com", timeout=5)
-            return response.status_code < 500
+            response = self._session.head("https://fanyi-api.baidu.com", timeout=5)
+            available = response.status_code < 500
         except Exception:
-            return False
+            available = False
+        self._avail_cache = (time.monotonic(), available)
+        return available
     
     def translate(self, text: str, direction: TranslationDirection) -> TranslationResult:
         """
@@ -107,101 +269,272 @@ class TranslationService(ITranslationService):
         
         Requirements: 5.4, 5.5
         """
-        if not text or not text.strip():
-            return TranslationResult(
-                original=text,
-                translated="",
-                direction=direction,
-                success=False,
-                error_message="输入文本为空"
-            )
+        return self.translate_batch([text], direction)[0]
+    
+    def translate_batch(
+        self,
+        texts: List[str],
+        direction: TranslationDirection
+    ) -> List[TranslationResult]:
+        """
+        批量翻译文本
         
-        # 检查 API 凭证
-        if not self._app_id or not self._secret_key:
-            return TranslationResult(
-                original=text,
-                translated="",
-                direction=direction,
-                success=False,
-                error_message="翻译服务未配置，请设置 API 凭证"
-            )
+        百度翻译 API 的 q 参数按换行符分行翻译，trans_result 中每个源行
+        对应一项。因此将多条单行文本用换行符合并为一次请求，只签名、
+        限流和往返一次，再按顺序把结果项对应回输入下标。命中内存缓存的
+        文本不参与请求，批次内重复的文本只请求一次，失败的结果不缓存。
         
-        # 确定源语言和目标语言
-        if direction == TranslationDirection.EN_TO_ZH:
-            from_lang = "en"
-            to_lang = "zh"
-        elif direction == TranslationDirection.ZH_TO_EN:
-            from_lang = "zh"
-            to_lang = "en"
-        else:
-            return TranslationResult(
-                original=text,
-                translated="",
-                direction=direction,
-                success=False,
-                error_message=f"不支持的翻译方向: {direction}"
-            )
+        API 限制 q 不超过 6000 字节，超出 MAX_QUERY_BYTES 的批次拆分为
+        多个子请求，最多 MAX_CONCURRENT_REQUESTS 个同时进行（仍受令牌桶
+        限流）。含换行符的文本无法按行对应，单独请求并合并各行结果。
         
-        # 限流：确保请求间隔
-        self._rate_limit()
+        Args:
+            texts: 要翻译的文本列表
+            direction: 翻译方向
         
-        try:
-            # 调用百度翻译 API
-            result = self._call_baidu_api(text, from_lang, to_lang)
-            
-            if result.get("error_code"):
-                error_msg = self._get_error_message(result.get("error_code"))
-                return TranslationResult(
-                    original=text,
-                    translated="",
-                    direction=direction,
-                    success=False,
-                    error_message=error_msg
-                )
-            
-            # 提取翻译结果
-            trans_result = result.get("trans_result", [])
-            if trans_result:
-                translated_text = "\n".join([item.get("dst", "") for item in trans_result])
-                return TranslationResult(
+        Returns:
+            与输入顺序一致的翻译结果列表
+        """
+        results: List[Optional[TranslationResult]] = [None] * len(texts)
+        
+        # 空文本、未配置凭证和不支持的方向无需请求
+        error_message = None
+        if not self._app_id or not self._secret_key:
+            error_message = "翻译服务未配置，请设置 API 凭证"
+        elif direction not in self.LANGUAGE_PAIRS:
+            error_message = f"不支持的翻译方向: {direction}"
+        
+        pending: List[int] = []
+        # 重复文本（按缓存键）的下标 -> 首次出现的下标
+        first_seen: Dict[str, int] = {}
+        duplicates: List[Tuple[int, int]] = []
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = self._failure(text, direction, "输入文本为空")
+                continue
+            cached = self._cache_get(direction, text)
+            if cached is not None:
+                results[i] = TranslationResult(
                     original=text,
-                    translated=translated_text,
+                    translated=cached,
                     direction=direction,
                     success=True
                 )
+            elif error_message is not None:
+                results[i] = self._failure(text, direction, error_message)
             else:
-                return TranslationResult(
+                first = first_seen.setdefault(text.strip(), i)
+                if first == i:
+                    pending.append(i)
+                else:
+                    duplicates.append((i, first))
+        
+        groups = self._group_by_bytes(texts, pending)
+        if len(groups) > 1:
+            # 多个请求并发进行，网络往返相互重叠
+            executor = self._get_executor()
+            futures = [
+                executor.submit(self._translate_group, texts, indexes, direction, results)
+                for indexes in groups
+            ]
+            for future in futures:
+                future.result()
+        elif groups:
+            self._translate_group(texts, groups[0], direction, results)
+        
+        for i, first in duplicates:
+            results[i] = replace(results[first], original=texts[i])
+        
+        return results
+    
+    def close(self) -> None:
+        """关闭并发请求线程池和 HTTP 会话"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        self._session.close()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """获取并发请求线程池"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.MAX_CONCURRENT_REQUESTS,
+                    thread_name_prefix="translation"
+                )
+            return self._executor
+    
+    def _translate_group(
+        self,
+        texts: List[str],
+        indexes: List[int],
+        direction: TranslationDirection,
+        results: List[Optional[TranslationResult]]
+    ) -> None:
+        """
+        以一次请求翻译一组文本，结果写入 results 的对应下标
+        
+        Args:
+            texts: 全部输入文本
+            indexes: 本组文本的下标
+            direction: 翻译方向
+            results: 结果列表
+        """
+        batch = [texts[i] for i in indexes]
+        lines, error = self._request_lines("\n".join(batch), direction)
+        
+        if error is not None:
+            for i, text in zip(indexes, batch):
+                results[i] = self._failure(text, direction, error)
+        elif len(batch) == 1:
+            translated = "\n".join(lines)
+            self._cache_put(direction, batch[0], translated)
+            results[indexes[0]] = TranslationResult(
+                original=batch[0],
+                translated=translated,
+                direction=direction,
+                success=True
+            )
+        elif len(lines) == len(batch):
+            for i, text, line in zip(indexes, batch, lines):
+                self._cache_put(direction, text, line)
+                results[i] = TranslationResult(
                     original=text,
-                    translated="",
+                    translated=line,
                     direction=direction,
-                    success=False,
-                    error_message="翻译结果为空"
+                    success=True
                 )
+        else:
+            # 返回行数与请求不一致，退回逐条翻译
+            for i, text in zip(indexes, batch):
+                results[i] = self.translate(text, direction)
+    
+    def clear_cache(self) -> None:
+        """清空内存中的翻译结果缓存"""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def _cache_get(self, direction: TranslationDirection, text: str) -> Optional[str]:
+        """
+        查询缓存的译文
+        
+        Args:
+            direction: 翻译方向
+            text: 原文
+        
+        Returns:
+            译文，未命中时返回 None
+        """
+        key = (direction.value, text.strip())
+        with self._cache_lock:
+            translated = self._cache.get(key)
+            if translated is not None:
+                self._cache.move_to_end(key)
+        return translated
+    
+    def _cache_put(self, direction: TranslationDirection, text: str, translated: str) -> None:
+        """
+        缓存译文，超出 TRANSLATION_CACHE_SIZE 时淘汰最久未使用的条目
+        
+        Args:
+            direction: 翻译方向
+            text: 原文
+            translated: 译文
+        """
+        key = (direction.value, text.strip())
+        with self._cache_lock:
+            self._cache[key] = translated
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.TRANSLATION_CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def _group_by_bytes(self, texts: List[str], indexes: List[int]) -> List[List[int]]:
+        """
+        将待翻译文本按 MAX_QUERY_BYTES 分组
+        
+        含换行符的文本单独成组。
+        
+        Args:
+            texts: 文本列表
+            indexes: 需要请求的文本下标
+        
+        Returns:
+            下标分组列表，每组对应一次 API 请求
+        """
+        groups: List[List[int]] = []
+        group: List[int] = []
+        group_bytes = 0
+        for i in indexes:
+            text = texts[i]
+            if "\n" in text:
+                groups.append([i])
+                continue
+            size = len(text.encode("utf-8")) + 1
+            if group and group_bytes + size > self.MAX_QUERY_BYTES:
+                groups.append(group)
+                group, group_bytes = [], 0
+            group.append(i)
+            group_bytes += size
+        if group:
+            groups.append(group)
+        return groups
+    
+    def _request_lines(
+        self,
+        query: str,
+        direction: TranslationDirection
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        请求翻译并返回逐行结果
+        
+        Args:
+            query: 要翻译的文本（可含换行符）
+            direction: 翻译方向，必须在 LANGUAGE_PAIRS 中
+        
+        Returns:
+            (trans_result 中各项的译文列表, 错误信息)，成功时错误信息为 None
+        """
+        from_lang, to_lang = self.LANGUAGE_PAIRS[direction]
         
+        # 限流：确保请求间隔
+        self._rate_limit()
+        
+        try:
+            result = self._call_baidu_api(query, from_lang, to_lang)
         except requests.exceptions.Timeout:
-            return TranslationResult(
-                original=text,
-                translated="",
-                direction=direction,
-                success=False,
-                error_message="请求超时，请检查网络连接"
-            )
+            self._avail_cache = (time.monotonic(), False)
+            return [], "请求超时，请检查网络连接"
         except requests.exceptions.ConnectionError:
-            return TranslationResult(
-                original=text,
-                translated="",
-                direction=direction,
-                success=False,
-                error_message="网络不可用，请检查连接"
-            )
+            self._avail_cache = (time.monotonic(), False)
+            return [], "网络不可用，请检查连接"
         except Exception as e:
-            return TranslationResult(
-                original=text,
-                translated="",
-                direction=direction,
-                success=False,
-                error_message=f"翻译失败: {str(e)}"
-            )
+            return [], f"翻译失败: {str(e)}"
+        
+        self._avail_cache = (time.monotonic(), True)
+        
+        if result.get("error_code"):
+            return [], self._get_error_message(result.get("error_code"))
+        
+        trans_result = result.get("trans_result", [])
+        if not trans_result:
+            return [], "翻译结果为空"
+        return [item.get("dst", "") for item in trans_result], None
+    
+    @staticmethod
+    def _failure(
+        text: str,
+        direction: TranslationDirection,
+        error_message: str
+    ) -> TranslationResult:
+        """构造失败的翻译结果"""
+        return TranslationResult(
+            original=text,
+            translated="",
+            direction=direction,
+            success=False,
+            error_message=error_message
+        )
     
     def _call_baidu_api(self, text: str, from_lang: str, to_lang: str) -> dict:
         """
@@ -216,7 +549,7 @@ class TranslationService(ITranslationService):
             API 响应的 JSON 数据
         """
         # 生成签名
-        salt = str(random.randint(32768, 65536))
+        salt = str(next(self._salts))
         sign = self._generate_sign(text, salt)
         
         # 构建请求参数
@@ -230,7 +563,7 @@ class TranslationService(ITranslationService):
         }
         
         # 发送请求
-        response = requests.get(
+        response = self._session.get(
             self.BAIDU_API_URL,
             params=params,
             timeout=10
@@ -252,18 +585,36 @@ class TranslationService(ITranslationService):
         Returns:
             签名字符串
         """
-        sign_str = f"{self._app_id}{text}{salt}{self._secret_key}"
-        return hashlib.md5(sign_str.encode("utf-8")).hexdigest()
+        digest = hashlib.md5(self._app_id_bytes, usedforsecurity=False)
+        digest.update(text.encode("utf-8"))
+        digest.update(salt.encode("ascii"))
+        digest.update(self._secret_key_bytes)
+        return digest.hexdigest()
+    
+    def _encode_credentials(self) -> None:
+        """预先编码 API 凭证，签名时无需每次重新编码"""
+        self._app_id_bytes = (self._app_id or "").encode("utf-8")
+        self._secret_key_bytes = (self._secret_key or "").encode("utf-8")
     
     def _rate_limit(self) -> None:
-        """限流：确保请求间隔不小于最小间隔"""
-        current_time = time.time()
-        elapsed = current_time - self._last_request_time
+        """
+        限流：每次请求消耗一个令牌，令牌不足时等待补充
         
-        if elapsed < self._min_request_interval:
-            time.sleep(self._min_request_interval - elapsed)
+        令牌在锁内预先扣除（可为负数，表示已被排队的请求占用），
+        等待在锁外进行，并发请求按到达顺序依次放行。
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.RATE_LIMIT_CAPACITY),
+                self._tokens + (now - self._last_refill) * self.RATE_LIMIT_REFILL_RATE
+            )
+            self._last_refill = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.RATE_LIMIT_REFILL_RATE if self._tokens < 0 else 0.0
         
-        self._last_request_time = time.time()
+        if wait > 0:
+            time.sleep(wait)
     
     def _get_error_message(self, error_code: str) -> str:
         """
@@ -275,22 +626,7 @@ class TranslationService(ITranslationService):
         Returns:
             错误信息描述
         """
-        error_messages = {
-            "52000": "成功",
-            "52001": "请求超时，请重试",
-            "52002": "系统错误，请重试",
-            "52003": "未授权用户，请检查 APP ID",
-            "54000": "必填参数为空",
-            "54001": "签名错误，请检查密钥",
-            "54003": "访问频率受限，请降低调用频率",
-            "54004": "账户余额不足",
-            "54005": "长 query 请求频繁，请降低长文本频率",
-            "58000": "客户端 IP 非法",
-            "58001": "译文语言方向不支持",
-            "58002": "服务当前已关闭",
-            "90107": "认证未通过或未生效",
-        }
-        return error_messages.get(str(error_code), f"未知错误: {error_code}")
+        return self.ERROR_MESSAGES.get(str(error_code), f"未知错误: {error_code}")
 
 
 class MockTranslationService(ITranslationService):
@@ -300,33 +636,36 @@ class MockTranslationService(ITranslationService):
     用于测试和离线模式，提供简单的模拟翻译功能。
     """
     
+    # 简单的词典映射（用于演示）
+    EN_TO_ZH: Dict[str, str] = {
+        "hello": "你好",
+        "world": "世界",
+        "book": "书",
+        "read": "阅读",
+        "write": "写",
+        "pen": "笔",
+        "paper": "纸",
+        "document": "文档",
+        "file": "文件",
+        "page": "页面",
+        "text": "文本",
+        "translate": "翻译",
+        "convert": "转换",
+        "chinese": "中文",
+        "english": "英文",
+        "traditional": "繁体",
+        "simplified": "简体",
+    }
+    
+    # 反向映射
+    ZH_TO_EN: Dict[str, str] = {v: k for k, v in EN_TO_ZH.items()}
+    
+    # 查词前从单词两端去除的标点
+    PUNCTUATION = ".,!?;:'\""
+    
     def __init__(self):
         """初始化模拟翻译服务"""
         self._available = True
-        
-        # 简单的词典映射（用于演示）
-        self._en_to_zh = {
-            "hello": "你好",
-            "world": "世界",
-            "book": "书",
-            "read": "阅读",
-            "write": "写",
-            "pen": "笔",
-            "paper": "纸",
-            "document": "文档",
-            "file": "文件",
-            "page": "页面",
-            "text": "文本",
-            "translate": "翻译",
-            "convert": "转换",
-            "chinese": "中文",
-            "english": "英文",
-            "traditional": "繁体",
-            "simplified": "简体",
-        }
-        
-        # 反向映射
-        self._zh_to_en = {v: k for k, v in self._en_to_zh.items()}
     
     def is_available(self) -> bool:
         """检查服务是否可用"""
@@ -367,24 +706,17 @@ class MockTranslationService(ITranslationService):
         
         # 选择词典
         if direction == TranslationDirection.EN_TO_ZH:
-            dictionary = self._en_to_zh
+            dictionary = self.EN_TO_ZH
         else:
-            dictionary = self._zh_to_en
+            dictionary = self.ZH_TO_EN
         
         # 简单的单词替换翻译
-        words = text.lower().split()
-        translated_words = []
-        
-        for word in words:
-            # 移除标点符号
-            clean_word = word.strip(".,!?;:'\"")
-            if clean_word in dictionary:
-                translated_words.append(dictionary[clean_word])
-            else:
-                # 未知单词保持原样
-                translated_words.append(word)
-        
-        translated_text = " ".join(translated_words)
+        # 去除两端标点后查词，未知单词保持原样
+        punctuation = self.PUNCTUATION
+        translated_text = " ".join([
+            dictionary.get(word.strip(punctuation), word)
+            for word in text.lower().split()
+        ])
         
         return TranslationResult(
             original=text,
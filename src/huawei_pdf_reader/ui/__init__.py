@@ -2,15 +2,28 @@
 华为平板PDF阅读器 - UI模块
 
 基于Kivy框架的用户界面实现。
+
+主题为纯 Python 模块，直接导入；各视图依赖 Kivy，首次访问时才导入
+对应子模块（PEP 562），只用到部分视图时无需加载其余界面代码。
 """
 
+import importlib
+from typing import Any, List
+
 from huawei_pdf_reader.ui.theme import Theme, DARK_GREEN_THEME
-from huawei_pdf_reader.ui.main_window import MainWindow
-from huawei_pdf_reader.ui.file_manager_view import FileManagerView
-from huawei_pdf_reader.ui.reader_view import ReaderView
-from huawei_pdf_reader.ui.settings_view import SettingsView
-from huawei_pdf_reader.ui.annotation_tools import AnnotationToolbar, PenSelector, ColorPicker, WidthSlider
-from huawei_pdf_reader.ui.magnifier_widget import MagnifierWidget
+
+# 延迟导入的名称 -> 所在子模块
+_LAZY_IMPORTS = {
+    "MainWindow": "huawei_pdf_reader.ui.main_window",
+    "FileManagerView": "huawei_pdf_reader.ui.file_manager_view",
+    "ReaderView": "huawei_pdf_reader.ui.reader_view",
+    "SettingsView": "huawei_pdf_reader.ui.settings_view",
+    "AnnotationToolbar": "huawei_pdf_reader.ui.annotation_tools",
+    "PenSelector": "huawei_pdf_reader.ui.annotation_tools",
+    "ColorPicker": "huawei_pdf_reader.ui.annotation_tools",
+    "WidthSlider": "huawei_pdf_reader.ui.annotation_tools",
+    "MagnifierWidget": "huawei_pdf_reader.ui.magnifier_widget",
+}
 
 __all__ = [
     "Theme",
@@ -25,3 +38,18 @@ __all__ = [
     "WidthSlider",
     "MagnifierWidget",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """首次访问时导入视图类，并缓存到模块命名空间"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """包含尚未导入的视图名称"""
+    return sorted(set(globals()) | set(__all__))
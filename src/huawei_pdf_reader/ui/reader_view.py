@@ -383,6 +383,14 @@ class DocumentCanvas(RelativeLayout):
         img = CoreImage(data, ext='png')
         self._page_widget.texture = img.texture
     
+    def set_page_pixels(self, samples: bytes, width: int, height: int):
+        """设置页面像素（render_page_raw的RGB输出），无需解码图像"""
+        texture = Texture.create(size=(width, height), colorfmt='rgb')
+        texture.blit_buffer(samples, colorfmt='rgb', bufferfmt='ubyte')
+        # 像素自上而下排列，纹理坐标原点在左下角
+        texture.flip_vertical()
+        self._page_widget.texture = texture
+    
     def draw_stroke(self, stroke: Stroke):
         """绘制笔画"""
         if not stroke.points:
@@ -391,9 +399,7 @@ class DocumentCanvas(RelativeLayout):
         from huawei_pdf_reader.ui.theme import hex_to_rgba
         color = hex_to_rgba(stroke.color)
         
-        points = []
-        for p in stroke.points:
-            points.extend([p.x, p.y])
+        points = stroke.points.xy_flat()
         
         with self.canvas:
             Color(*color)
@@ -540,6 +546,10 @@ class ReaderView(Screen):
         """设置当前页面图像"""
         self._canvas.set_page_image(image_data)
     
+    def set_page_pixels(self, samples: bytes, width: int, height: int):
+        """设置当前页面像素"""
+        self._canvas.set_page_pixels(samples, width, height)
+    
     def set_document_info(self, total_pages: int):
         """设置文档信息"""
         self.total_pages = total_pages
@@ -13,8 +13,13 @@ Properties:
 Validates: Requirements 3.2, 3.3, 3.4, 3.5, 3.6
 """
 
+import copy
+import pickle
 import sys
 import tempfile
+import time
+from dataclasses import asdict, fields, replace
+from datetime import datetime
 from pathlib import Path
 
 # 添加 src 目录到 Python 路径
@@ -28,9 +33,10 @@ from huawei_pdf_reader.models import (
     PenType,
     Stroke,
     StrokePoint,
+    StrokePoints,
 )
 from huawei_pdf_reader.annotation_engine import AnnotationEngine
-from huawei_pdf_reader.database import Database
+from huawei_pdf_reader.database import ANNOTATION_FORMAT_BINARY, Database
 
 
 # ============== 策略定义 ==============
@@ -264,6 +270,215 @@ class TestAnnotationRoundTrip:
                     assert abs(loaded_point.pressure - orig_point.pressure) < 1e-6
                     assert abs(loaded_point.timestamp - orig_point.timestamp) < 1e-6
 
+    @given(annotation=annotation_strategy())
+    @settings(max_examples=50)
+    def test_timestamps_round_trip(self, annotation: Annotation):
+        """
+        时间以 epoch 秒序列化后应精确往返，且仍能读取旧版的 ISO 字符串
+
+        Feature: huawei-pdf-reader, Property 7: 注释保存往返一致性
+        Validates: Requirements 3.5
+        """
+        data = annotation.to_dict()
+        assert isinstance(data["created_at"], float)
+
+        loaded = Annotation.from_dict(data)
+        assert loaded.created_at == annotation.created_at
+        assert loaded.modified_at == annotation.modified_at
+
+        legacy = dict(
+            data,
+            created_at=annotation.created_at.isoformat(),
+            modified_at=annotation.modified_at.isoformat(),
+        )
+        assert Annotation.from_dict(legacy).created_at == annotation.created_at
+
+    def test_timestamps_independent_of_timezone(self, monkeypatch):
+        """
+        时间序列化与设备时区无关：在一个时区写出、另一个时区读取应得到相同的时间，
+        夏令时跳过的时刻和最小时间也应精确往返
+
+        Feature: huawei-pdf-reader, Property 7: 注释保存往返一致性
+        Validates: Requirements 3.5
+        """
+        values = [
+            datetime(2024, 3, 1, 9, 0, 0, 123456),
+            datetime(2024, 3, 10, 2, 30),  # America/New_York 夏令时跳过的时刻
+            datetime(1, 1, 1),
+        ]
+
+        def set_tz(name: str) -> None:
+            monkeypatch.setenv("TZ", name)
+            time.tzset()
+
+        try:
+            set_tz("Asia/Shanghai")
+            written = [
+                Annotation(id=f"a{i}", page_num=0, created_at=value, modified_at=value).to_dict()
+                for i, value in enumerate(values)
+            ]
+
+            set_tz("America/New_York")
+            for value, data in zip(values, written):
+                loaded = Annotation.from_dict(data)
+                assert loaded.created_at == value
+                assert loaded.modified_at == value
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+    @given(annotation=annotation_strategy())
+    @settings(max_examples=50)
+    def test_strokes_deserialized_on_demand(self, annotation: Annotation):
+        """
+        from_dict 应推迟笔画反序列化，访问前后的序列化结果与笔画内容均一致
+
+        Feature: huawei-pdf-reader, Property 7: 注释保存往返一致性
+        Validates: Requirements 3.5
+        """
+        data = annotation.to_dict()
+        loaded = Annotation.from_dict(data)
+
+        assert not loaded.is_loaded
+        assert loaded.stroke_count == len(annotation.strokes)
+        assert loaded.to_dict() == data
+        assert not loaded.is_loaded
+
+        assert loaded.strokes == annotation.strokes
+        assert loaded.is_loaded
+        assert loaded.to_dict() == data
+
+    @given(annotation=annotation_strategy())
+    @settings(max_examples=30)
+    def test_lazy_annotation_is_plain_dataclass(self, annotation: Annotation):
+        """
+        延迟反序列化的注释仍是普通数据类：fields() 只包含公开字段，
+        dataclasses.replace、复制和 pickle 均可用
+
+        Feature: huawei-pdf-reader, Property 7: 注释保存往返一致性
+        Validates: Requirements 3.5
+        """
+        loaded = Annotation.from_dict(annotation.to_dict())
+
+        assert [f.name for f in fields(Annotation)] == [
+            "id", "page_num", "strokes", "created_at", "modified_at",
+        ]
+        assert set(asdict(loaded)) == {"id", "page_num", "strokes", "created_at", "modified_at"}
+
+        for copied in (copy.copy(loaded), copy.deepcopy(loaded), pickle.loads(pickle.dumps(loaded))):
+            assert copied == annotation
+
+        moved = replace(Annotation.from_dict(annotation.to_dict()), page_num=annotation.page_num + 1)
+        assert moved.page_num == annotation.page_num + 1
+        assert moved.strokes == annotation.strokes
+
+    @given(annotation=annotation_strategy())
+    @settings(max_examples=50)
+    def test_lazy_annotations_match_eager(self, annotation: Annotation):
+        """
+        延迟加载的注释应与立即加载的注释等价
+
+        Feature: huawei-pdf-reader, Property 7: 注释保存往返一致性
+        Validates: Requirements 3.5
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = Database(Path(tmpdir) / "test.db")
+            doc_id = "test_doc_123"
+            db.save_annotation(doc_id, annotation)
+
+            lazy = db.get_annotations(doc_id)[0]
+            eager = db.get_annotations_eager(doc_id)[0]
+
+            # 返回的是普通注释对象，id和页码不需要反序列化笔画
+            assert isinstance(lazy, Annotation)
+            assert lazy.id == annotation.id
+            assert lazy.page_num == annotation.page_num
+            assert not lazy.is_loaded
+            assert eager.is_loaded
+
+            assert lazy.to_dict() == eager.to_dict()
+            assert copy.deepcopy(lazy) == eager
+            assert lazy.strokes == eager.strokes
+            assert lazy.is_loaded
+
+    @given(annotation=annotation_strategy())
+    @settings(max_examples=50)
+    def test_binary_format_round_trip(self, annotation: Annotation):
+        """
+        二进制格式保存的注释应精确往返，且与 JSON 格式的注释可在同一数据库中共存
+
+        Feature: huawei-pdf-reader, Property 7: 注释保存往返一致性
+        Validates: Requirements 3.5
+        """
+        assert Annotation.from_binary(annotation.to_binary()) == annotation
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            Database(db_path).save_annotation("json_doc", annotation)
+            binary_db = Database(db_path, annotation_format=ANNOTATION_FORMAT_BINARY)
+            binary_db.save_annotation("binary_doc", Annotation(
+                id=annotation.id + "_bin",
+                page_num=annotation.page_num,
+                strokes=annotation.strokes,
+                created_at=annotation.created_at,
+                modified_at=annotation.modified_at,
+            ))
+
+            from_json = binary_db.get_annotations("json_doc")[0]
+            from_binary = binary_db.get_annotations_eager("binary_doc")[0]
+            assert from_json.strokes == annotation.strokes
+            assert from_binary.strokes == annotation.strokes
+            assert from_binary.created_at == annotation.created_at
+
+
+class TestStrokePointsColumns:
+    """
+    列式存储的笔画点应与逐点对象表示等价
+
+    Feature: huawei-pdf-reader, Property 7: 注释保存往返一致性
+    Validates: Requirements 3.5
+    """
+
+    @given(points=st.lists(stroke_point_strategy(), min_size=0, max_size=50))
+    @settings(max_examples=100)
+    def test_columns_match_point_objects(self, points):
+        """
+        StrokePoints 的下标、迭代、切片和序列化结果应与 StrokePoint 列表一致
+
+        Feature: huawei-pdf-reader, Property 7: 注释保存往返一致性
+        Validates: Requirements 3.5
+        """
+        columns = StrokePoints(points)
+
+        assert len(columns) == len(points)
+        assert list(columns) == points
+        assert columns[1:3] == points[1:3]
+        if points:
+            assert columns[-1] == points[-1]
+        assert columns == points
+        assert columns.to_list() == [p.to_dict() for p in points]
+        assert StrokePoints.from_list(columns.to_list()) == columns
+        assert columns.xy_flat() == [v for p in points for v in (p.x, p.y)]
+
+    @given(stroke=stroke_strategy())
+    @settings(max_examples=100)
+    def test_column_serialization_round_trip(self, stroke: Stroke):
+        """
+        列式序列化应精确往返，且仍能读取旧版的点字典列表格式
+
+        Feature: huawei-pdf-reader, Property 7: 注释保存往返一致性
+        Validates: Requirements 3.5
+        """
+        data = stroke.to_dict()
+        assert data["v"] == 2
+        assert data["points"]["n"] == len(stroke.points)
+        assert Stroke.from_dict(data) == stroke
+
+        # 旧版数据没有版本号，点为字典列表
+        legacy = {key: value for key, value in data.items() if key != "v"}
+        legacy["points"] = [p.to_dict() for p in stroke.points]
+        assert Stroke.from_dict(legacy) == stroke
+
 
 class TestPressureSensitivity:
     """
@@ -9,8 +9,10 @@ Validates: Requirements 1.1, 1.2, 1.3, 1.6
 测试文档处理器的核心功能属性。
 """
 
+import struct
 import sys
 import tempfile
+import zipfile
 from pathlib import Path
 
 # 添加 src 目录到 Python 路径
@@ -29,6 +31,7 @@ from huawei_pdf_reader.document_processor import (
     UnsupportedFormatError,
     CorruptedFileError,
     create_renderer,
+    _iter_docx_paragraphs,
 )
 from huawei_pdf_reader.models import DocumentInfo
 
@@ -69,6 +72,21 @@ def create_corrupted_file(path: Path) -> None:
         f.write(b"This is not a valid PDF or DOCX file content")
 
 
+def create_corrupted_body_docx(path: Path) -> None:
+    """创建压缩包目录完好、但正文部件的压缩数据已损坏的Word文档"""
+    create_valid_docx(path, ["hello world " * 200] * 20)
+    with zipfile.ZipFile(path) as z:
+        info = z.getinfo("word/document.xml")
+    
+    data = bytearray(path.read_bytes())
+    # 本地文件头固定30字节，之后是文件名和扩展字段，再之后是压缩数据
+    name_len, extra_len = struct.unpack_from("<HH", data, info.header_offset + 26)
+    start = info.header_offset + 30 + name_len + extra_len
+    for i in range(start + 10, start + info.compress_size - 10, 7):
+        data[i] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+
 # ============== 策略定义 ==============
 
 # 有效页数策略 (1-20页)
@@ -203,6 +221,25 @@ class TestDocumentOpenConsistency:
                 renderer.close()
 
 
+    @given(paragraphs=paragraphs_strategy)
+    @settings(max_examples=50, deadline=None)
+    def test_streamed_paragraphs_match_python_docx(self, paragraphs: list):
+        """
+        流式读取的段落文本应与python-docx解析结果一致
+        
+        Feature: huawei-pdf-reader, Property 1: 文档打开一致性
+        Validates: Requirements 1.2
+        """
+        from docx import Document
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            docx_path = Path(temp_dir) / "test.docx"
+            create_valid_docx(docx_path, paragraphs=paragraphs)
+            
+            expected = [p.text for p in Document(str(docx_path)).paragraphs]
+            assert list(_iter_docx_paragraphs(docx_path)) == expected
+
+
 # ============== Property 2: 无效文档错误处理 ==============
 
 class TestInvalidDocumentErrorHandling:
@@ -309,16 +346,19 @@ class TestInvalidDocumentErrorHandling:
         with tempfile.TemporaryDirectory() as temp_dir:
             corrupted_path = Path(temp_dir) / "corrupted.docx"
             create_corrupted_file(corrupted_path)
+            corrupted_body_path = Path(temp_dir) / "corrupted_body.docx"
+            create_corrupted_body_docx(corrupted_body_path)
             
-            renderer = WordRenderer()
-            try:
-                with pytest.raises(CorruptedFileError) as exc_info:
-                    renderer.open(corrupted_path)
-                
-                error_message = str(exc_info.value)
-                assert len(error_message) > 0, "Expected non-empty error message"
-            finally:
-                renderer.close()
+            for path in (corrupted_path, corrupted_body_path):
+                renderer = WordRenderer()
+                try:
+                    with pytest.raises(CorruptedFileError) as exc_info:
+                        renderer.open(path)
+                    
+                    error_message = str(exc_info.value)
+                    assert len(error_message) > 0, "Expected non-empty error message"
+                finally:
+                    renderer.close()
 
     @given(extension=st.sampled_from(['.txt', '.jpg', '.png', '.mp3', '.zip', '.exe']))
     @settings(max_examples=100)
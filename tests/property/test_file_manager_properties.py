@@ -372,6 +372,126 @@ class TestDocumentEntryCompleteness:
             assert thumbnail[:8] == b'\x89PNG\r\n\x1a\n', \
                 "Thumbnail should be valid PNG data"
 
+    @given(num_docs=st.integers(min_value=2, max_value=4))
+    @settings(max_examples=5, deadline=None)
+    def test_batch_imported_documents_have_thumbnails(self, num_docs: int):
+        """
+        Property 4: 批量导入的文档有缩略图
+
+        For any 通过import_documents批量导入的文档，应按输入顺序返回且都包含缩略图。
+
+        Feature: huawei-pdf-reader, Property 4: 文档条目完整性
+        Validates: Requirements 2.6
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            db = Database(temp_path / "test.db")
+            file_manager = FileManager(db)
+
+            pdf_paths = []
+            for i in range(num_docs):
+                pdf_path = temp_path / f"doc_{i}.pdf"
+                create_valid_pdf(pdf_path, num_pages=i + 1)
+                pdf_paths.append(pdf_path)
+
+            docs = file_manager.import_documents(pdf_paths)
+
+            assert [doc.path for doc in docs] == pdf_paths
+            for doc, pdf_path in zip(docs, pdf_paths):
+                assert doc.thumbnail == file_manager.generate_thumbnail(pdf_path)
+                assert db.get_document(doc.id) is not None
+
+    @given(num_pages=st.integers(min_value=1, max_value=5))
+    @settings(max_examples=10, deadline=None)
+    def test_deferred_thumbnail_written_back(self, num_pages: int):
+        """
+        Property 4: 延迟生成的缩略图最终写回文档条目
+
+        Feature: huawei-pdf-reader, Property 4: 文档条目完整性
+        Validates: Requirements 2.6
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            db = Database(temp_path / "test.db")
+            file_manager = FileManager(db)
+
+            pdf_path = temp_path / "deferred.pdf"
+            create_valid_pdf(pdf_path, num_pages=num_pages, title="Deferred")
+
+            metadata = file_manager.get_document_metadata(pdf_path)
+            assert metadata["page_count"] == num_pages
+            assert metadata["title"] == "Deferred"
+
+            doc = file_manager.import_document(pdf_path, defer_thumbnail=True)
+            file_manager.wait_for_thumbnails()
+
+            expected = file_manager.generate_thumbnail(pdf_path)
+            assert doc.thumbnail == expected
+            assert db.get_document(doc.id).thumbnail == expected
+
+    @given(num_pages=st.integers(min_value=1, max_value=3))
+    @settings(max_examples=10, deadline=None)
+    def test_thumbnail_cache_follows_file_changes(self, num_pages: int):
+        """
+        Property 4: 缓存的缩略图与重新生成的一致，文件变化后缓存失效
+
+        Feature: huawei-pdf-reader, Property 4: 文档条目完整性
+        Validates: Requirements 2.6
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            db = Database(temp_path / "test.db")
+            cache_dir = temp_path / "thumbnails"
+            cached_manager = FileManager(db, thumb_cache_dir=cache_dir)
+            plain_manager = FileManager(db)
+
+            pdf_path = temp_path / "cached.pdf"
+            create_valid_pdf(pdf_path, num_pages=num_pages)
+
+            first = cached_manager.generate_thumbnail(pdf_path)
+            assert len(list(cache_dir.glob("*.png"))) == 1
+            assert cached_manager.generate_thumbnail(pdf_path) == first
+
+            # 修改文件内容后应重新生成
+            doc = fitz.open()
+            page = doc.new_page(width=300, height=300)
+            page.draw_rect(fitz.Rect(10, 10, 290, 290), color=(1, 0, 0), fill=(1, 0, 0))
+            doc.save(str(pdf_path))
+            doc.close()
+
+            assert cached_manager.generate_thumbnail(pdf_path) == \
+                plain_manager.generate_thumbnail(pdf_path)
+
+    @given(num_pages=st.integers(min_value=1, max_value=3))
+    @settings(max_examples=10, deadline=None)
+    def test_imported_document_fingerprint(self, num_pages: int):
+        """
+        Property 4: 相同内容的文档指纹相同，并持久化到数据库
+
+        Feature: huawei-pdf-reader, Property 4: 文档条目完整性
+        Validates: Requirements 2.6
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            db = Database(temp_path / "test.db")
+            file_manager = FileManager(db)
+
+            pdf_path = temp_path / "original.pdf"
+            create_valid_pdf(pdf_path, num_pages=num_pages)
+            copy_path = temp_path / "copy.pdf"
+            copy_path.write_bytes(pdf_path.read_bytes())
+            other_path = temp_path / "other.pdf"
+            create_valid_pdf(other_path, num_pages=num_pages + 1)
+
+            original = file_manager.import_document(pdf_path)
+            copy = file_manager.import_document(copy_path)
+            other = file_manager.import_document(other_path)
+
+            assert original.fingerprint is not None
+            assert original.fingerprint == copy.fingerprint
+            assert original.fingerprint != other.fingerprint
+            assert db.get_document(original.id).fingerprint == original.fingerprint
+
 
 # ============== Property 22: 书签添加 ==============
 
@@ -0,0 +1,416 @@
+"""
+放大镜属性测试
+
+Feature: huawei-pdf-reader
+Property 25: 放大镜操作结果一致性
+Validates: Requirements 5.3, 5.4, 5.5, 5.6
+
+测试放大镜在缓存等优化路径下的结果与直接调用服务一致。
+"""
+
+import asyncio
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+# 添加 src 目录到 Python 路径
+src_path = Path(__file__).parent.parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from hypothesis import given, settings, strategies as st
+
+from huawei_pdf_reader.chinese_converter import ChineseConverter
+from huawei_pdf_reader.magnifier import Magnifier, MockOCREngine
+from huawei_pdf_reader.models import (
+    ConversionDirection,
+    MagnifierAction,
+    MagnifierConfig,
+    TranslationDirection,
+)
+from huawei_pdf_reader.translation_cache import PersistentTranslationCache
+from huawei_pdf_reader.translation_service import MockTranslationService
+
+
+# ============== 辅助类 ==============
+
+class CountingTranslationService(MockTranslationService):
+    """记录实际翻译调用次数的模拟翻译服务"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def translate(self, text, direction):
+        self.calls += 1
+        return super().translate(text, direction)
+
+
+class RegionOCREngine(MockOCREngine):
+    """按区域返回预设文本的模拟 OCR 引擎"""
+
+    def __init__(self, region_texts: dict):
+        super().__init__()
+        self.region_texts = region_texts
+
+    def extract_text(self, image_data, region=None):
+        return self.region_texts[region]
+
+
+def make_regions(count: int) -> List[Tuple[float, float, float, float]]:
+    """生成 count 个互不相同的区域"""
+    return [(float(i), 0.0, float(i) + 10.0, 10.0) for i in range(count)]
+
+
+def region_ocr(texts: list) -> Tuple[List[Tuple[float, float, float, float]], RegionOCREngine]:
+    """为每段文本生成一个区域，返回区域列表和按区域识别出对应文本的 OCR 引擎"""
+    regions = make_regions(len(texts))
+    return regions, RegionOCREngine(dict(zip(regions, texts)))
+
+
+# ============== 策略定义 ==============
+
+# 英文文本策略
+english_text_strategy = st.lists(
+    st.sampled_from(["hello", "world", "book", "read", "page", "text", "unknown"]),
+    min_size=1,
+    max_size=8,
+).map(" ".join)
+
+# 翻译操作策略
+translate_action_strategy = st.sampled_from([
+    MagnifierAction.TRANSLATE_EN_ZH,
+    MagnifierAction.TRANSLATE_ZH_EN,
+])
+
+
+# ============== Property 25: 放大镜操作结果一致性 ==============
+
+class TestMagnifierResultConsistency:
+    """
+    Property 25: 放大镜操作结果一致性
+
+    For any 文本和操作，放大镜返回的结果应与直接调用对应服务的结果一致，
+    重复请求不应改变结果。
+
+    Feature: huawei-pdf-reader, Property 25: 放大镜操作结果一致性
+    Validates: Requirements 5.4, 5.5, 5.6
+    """
+
+    @given(text=english_text_strategy, action=translate_action_strategy)
+    @settings(max_examples=100)
+    def test_cached_translation_matches_service(self, text: str, action: MagnifierAction):
+        """
+        重复翻译同一文本时结果不变，且只调用一次翻译服务
+
+        Feature: huawei-pdf-reader, Property 25: 放大镜操作结果一致性
+        Validates: Requirements 5.4, 5.5
+        """
+        service = CountingTranslationService()
+        magnifier = Magnifier(translation_service=service, ocr_engine=MockOCREngine())
+
+        direction = (
+            TranslationDirection.EN_TO_ZH
+            if action == MagnifierAction.TRANSLATE_EN_ZH
+            else TranslationDirection.ZH_TO_EN
+        )
+        expected = MockTranslationService().translate(text, direction)
+
+        first = magnifier.perform_action_on_text(action, text)
+        second = magnifier.perform_action_on_text(action, text)
+
+        assert first.result_text == expected.translated
+        assert second == first
+        assert service.calls == 1
+
+    @given(
+        text=english_text_strategy,
+        padding=st.sampled_from(["", " ", "  ", "\n", "\t "]),
+    )
+    @settings(max_examples=50)
+    def test_whitespace_variants_share_cache(self, text: str, padding: str):
+        """
+        仅空白不同的文本应命中同一缓存条目，且首次请求使用原文
+
+        Feature: huawei-pdf-reader, Property 25: 放大镜操作结果一致性
+        Validates: Requirements 5.4
+        """
+        seen = []
+
+        class RecordingTranslationService(CountingTranslationService):
+            def translate(self, text, direction):
+                seen.append(text)
+                return super().translate(text, direction)
+
+        service = RecordingTranslationService()
+        magnifier = Magnifier(translation_service=service, ocr_engine=MockOCREngine())
+
+        variant = padding + text.replace(" ", "  ") + padding
+        first = magnifier.perform_action_on_text(MagnifierAction.TRANSLATE_EN_ZH, variant)
+        second = magnifier.perform_action_on_text(MagnifierAction.TRANSLATE_EN_ZH, text)
+
+        assert seen == [variant]
+        assert second.result_text == first.result_text
+        assert second.original_text == text
+
+    @given(text=english_text_strategy, action=translate_action_strategy)
+    @settings(max_examples=30, deadline=None)
+    def test_persistent_cache_survives_new_magnifier(self, text: str, action: MagnifierAction):
+        """
+        持久化缓存中的翻译结果应被新的放大镜实例复用，不再调用翻译服务
+
+        Feature: huawei-pdf-reader, Property 25: 放大镜操作结果一致性
+        Validates: Requirements 5.4, 5.5
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PersistentTranslationCache(Path(tmpdir) / "translations.sqlite")
+            first_service = CountingTranslationService()
+            first = Magnifier(
+                translation_service=first_service, translation_cache=cache
+            ).perform_action_on_text(action, text)
+            cache.close()
+
+            cache = PersistentTranslationCache(Path(tmpdir) / "translations.sqlite")
+            second_service = CountingTranslationService()
+            second = Magnifier(
+                translation_service=second_service, translation_cache=cache
+            ).perform_action_on_text(action, text)
+            cache.close()
+
+        assert first_service.calls == 1
+        assert second_service.calls == 0
+        assert second == first
+
+    @given(text=english_text_strategy)
+    @settings(max_examples=50)
+    def test_failed_translation_not_cached(self, text: str):
+        """
+        翻译失败的结果不应被缓存，服务恢复后应得到正确结果
+
+        Feature: huawei-pdf-reader, Property 25: 放大镜操作结果一致性
+        Validates: Requirements 5.6
+        """
+        service = CountingTranslationService()
+        magnifier = Magnifier(translation_service=service, ocr_engine=MockOCREngine())
+
+        service.set_available(False)
+        failed = magnifier.perform_action_on_text(MagnifierAction.TRANSLATE_EN_ZH, text)
+        assert not failed.success
+
+        service.set_available(True)
+        recovered = magnifier.perform_action_on_text(MagnifierAction.TRANSLATE_EN_ZH, text)
+        assert recovered.success
+        assert service.calls == 2
+
+    @given(
+        texts=st.lists(english_text_strategy, min_size=1, max_size=10),
+        action=st.sampled_from(list(MagnifierAction)),
+    )
+    @settings(max_examples=50, deadline=None)
+    def test_batch_matches_single_actions(self, texts: list, action: MagnifierAction):
+        """
+        批量操作的结果应与逐个区域执行的结果一致，且顺序不变
+
+        Feature: huawei-pdf-reader, Property 25: 放大镜操作结果一致性
+        Validates: Requirements 5.3, 5.6
+        """
+        regions, ocr_engine = region_ocr(texts)
+        batch_magnifier = Magnifier(ocr_engine=ocr_engine)
+        single_magnifier = Magnifier(ocr_engine=RegionOCREngine(ocr_engine.region_texts))
+
+        batch = batch_magnifier.perform_actions_batch(action, regions)
+        single = [single_magnifier.perform_action(action, region) for region in regions]
+
+        assert batch == single
+
+    @given(texts=st.lists(english_text_strategy, min_size=1, max_size=10))
+    @settings(max_examples=50, deadline=None)
+    def test_async_batch_matches_sync_batch(self, texts: list):
+        """
+        异步并发识别的批量结果应与同步批量结果一致
+
+        Feature: huawei-pdf-reader, Property 25: 放大镜操作结果一致性
+        Validates: Requirements 5.3
+        """
+        regions, ocr_engine = region_ocr(texts)
+        magnifier = Magnifier(ocr_engine=ocr_engine)
+        action = MagnifierAction.TRANSLATE_EN_ZH
+
+        async_results = asyncio.run(magnifier.perform_actions_batch_async(action, regions))
+        sync_results = Magnifier(
+            ocr_engine=RegionOCREngine(ocr_engine.region_texts)
+        ).perform_actions_batch(action, regions)
+
+        assert async_results == sync_results
+        assert [r.original_text for r in async_results] == texts
+
+    @given(
+        limit=st.integers(min_value=1, max_value=4),
+        count=st.integers(min_value=1, max_value=12),
+    )
+    @settings(max_examples=20, deadline=None)
+    def test_batch_respects_concurrency_limit(self, limit: int, count: int):
+        """
+        批量 OCR 的同时执行数不应超过配置的 concurrency_limit
+
+        Feature: huawei-pdf-reader, Property 25: 放大镜操作结果一致性
+        Validates: Requirements 5.3
+        """
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        class SlowOCREngine(MockOCREngine):
+            def extract_text(self, image_data, region=None):
+                with lock:
+                    state["running"] += 1
+                    state["peak"] = max(state["peak"], state["running"])
+                time.sleep(0.002)
+                with lock:
+                    state["running"] -= 1
+                return f"text {region[0]}"
+
+        magnifier = Magnifier(ocr_engine=SlowOCREngine())
+        magnifier.activate(MagnifierConfig(concurrency_limit=limit))
+        regions = make_regions(count)
+
+        sync_results = magnifier.perform_actions_batch(MagnifierAction.MAGNIFY, regions)
+        async_results = asyncio.run(
+            magnifier.perform_actions_batch_async(MagnifierAction.MAGNIFY, regions)
+        )
+        magnifier.deactivate()
+
+        assert state["peak"] <= limit
+        assert sync_results == async_results
+        assert [r.original_text for r in sync_results] == [f"text {r[0]}" for r in regions]
+
+    @given(
+        texts=st.lists(
+            st.sampled_from(["hello world", "國語學習", "简体中文", "PDF 電腦", "x = 1"]),
+            min_size=1,
+            max_size=6,
+        ),
+        action=st.sampled_from([MagnifierAction.CONVERT_T2S, MagnifierAction.CONVERT_S2T]),
+    )
+    @settings(max_examples=30, deadline=None)
+    def test_ascii_text_skips_converter(self, texts: list, action: MagnifierAction):
+        """
+        纯 ASCII 文本的繁简转换结果为原文且不调用转换器，其余文本与转换器结果一致
+
+        Feature: huawei-pdf-reader, Property 25: 放大镜操作结果一致性
+        Validates: Requirements 5.6
+        """
+        converter = ChineseConverter()
+        converted = []
+
+        class RecordingConverter(ChineseConverter):
+            def convert(self, text, direction):
+                converted.append(text)
+                return super().convert(text, direction)
+
+        direction = (
+            ConversionDirection.TRADITIONAL_TO_SIMPLIFIED
+            if action == MagnifierAction.CONVERT_T2S
+            else ConversionDirection.SIMPLIFIED_TO_TRADITIONAL
+        )
+        regions, ocr_engine = region_ocr(texts)
+        single = Magnifier(chinese_converter=RecordingConverter())
+        batch = Magnifier(chinese_converter=RecordingConverter(), ocr_engine=ocr_engine)
+
+        single_results = [single.perform_action_on_text(action, text).result_text for text in texts]
+        batch_results = [r.result_text for r in batch.perform_actions_batch(action, regions)]
+
+        expected = [converter.convert(text, direction) for text in texts]
+        assert single_results == expected
+        assert batch_results == expected
+        assert all(not text.isascii() for text in converted)
+
+    @given(texts=st.lists(english_text_strategy, min_size=2, max_size=15, unique=True))
+    @settings(max_examples=10, deadline=None)
+    def test_translation_overlaps_ocr(self, texts: list):
+        """
+        批量翻译应在最后一个区域识别完成前开始，结果顺序与区域一致
+
+        Feature: huawei-pdf-reader, Property 25: 放大镜操作结果一致性
+        Validates: Requirements 5.3
+        """
+        regions, ocr_engine = region_ocr(texts)
+
+        for run in ("sync", "async"):
+            translated = threading.Event()
+            overlapped = []
+
+            class GatedOCREngine(RegionOCREngine):
+                def extract_text(self, image_data, region=None):
+                    # 最后一个区域等到有翻译请求发出后才完成识别
+                    if region == regions[-1]:
+                        overlapped.append(translated.wait(timeout=2.0))
+                    return super().extract_text(image_data, region)
+
+            class SignallingTranslationService(MockTranslationService):
+                def translate_batch(self, batch, direction):
+                    translated.set()
+                    return super().translate_batch(batch, direction)
+
+            magnifier = Magnifier(
+                translation_service=SignallingTranslationService(),
+                ocr_engine=GatedOCREngine(ocr_engine.region_texts),
+            )
+            magnifier.activate(MagnifierConfig(concurrency_limit=2))
+            action = MagnifierAction.TRANSLATE_EN_ZH
+            if run == "sync":
+                results = magnifier.perform_actions_batch(action, regions)
+            else:
+                results = asyncio.run(magnifier.perform_actions_batch_async(action, regions))
+            magnifier.deactivate()
+
+            expected = [
+                MockTranslationService().translate(text, TranslationDirection.EN_TO_ZH).translated
+                for text in texts
+            ]
+            assert [r.original_text for r in results] == texts
+            assert [r.result_text for r in results] == expected
+            assert [r.region for r in results] == regions
+            assert overlapped == [True]
+
+    @given(available=st.booleans())
+    @settings(max_examples=20, deadline=None)
+    def test_available_actions_follow_service(self, available: bool):
+        """
+        可用操作列表应反映翻译服务可用性，失效缓存后立即刷新
+
+        Feature: huawei-pdf-reader, Property 25: 放大镜操作结果一致性
+        Validates: Requirements 5.4, 5.5
+        """
+        service = MockTranslationService()
+        service.set_available(available)
+        magnifier = Magnifier(translation_service=service, ocr_engine=MockOCREngine())
+
+        actions = magnifier.get_available_actions()
+        assert (MagnifierAction.TRANSLATE_EN_ZH in actions) == available
+        assert MagnifierAction.CONVERT_T2S in actions
+
+        service.set_available(not available)
+        magnifier.invalidate_actions_cache()
+        actions = magnifier.get_available_actions()
+        assert (MagnifierAction.TRANSLATE_EN_ZH in actions) == (not available)
+
+    @given(text=english_text_strategy)
+    @settings(max_examples=20, deadline=None)
+    def test_magnify_returns_recognized_text(self, text: str):
+        """
+        MAGNIFY 操作应返回区域内识别出的文字
+
+        Feature: huawei-pdf-reader, Property 25: 放大镜操作结果一致性
+        Validates: Requirements 5.3
+        """
+        ocr = MockOCREngine()
+        ocr.set_mock_text(text)
+        magnifier = Magnifier(ocr_engine=ocr)
+
+        result = magnifier.perform_action(MagnifierAction.MAGNIFY, (0.0, 0.0, 10.0, 10.0))
+
+        assert result.success
+        assert result.original_text == text
+        assert result.result_text == text
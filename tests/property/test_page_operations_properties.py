@@ -25,6 +25,7 @@ import pytest
 from huawei_pdf_reader.document_processor import (
     PDFRenderer,
     DocumentError,
+    IDocumentRenderer,
 )
 from huawei_pdf_reader.models import PageInfo
 
@@ -417,3 +418,125 @@ class TestPageNavigation:
                 
             finally:
                 renderer.close()
+
+
+# ============== 页面图像缓存 ==============
+
+class TestPageRenderCache:
+    """
+    页面图像缓存在页面变化后应失效，缓存结果应与重新渲染一致
+
+    Feature: huawei-pdf-reader, Property 21: 页面跳转
+    Validates: Requirements 9.3, 9.4, 9.5
+    """
+
+    @given(
+        num_pages=page_count_strategy,
+        angle=st.sampled_from([90, 270]),
+    )
+    @settings(max_examples=20)
+    def test_rotation_invalidates_cache(self, num_pages: int, angle: int):
+        """旋转页面后重新渲染应得到旋转后的尺寸"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = Path(temp_dir) / "test.pdf"
+            create_valid_pdf(pdf_path, num_pages=num_pages)
+
+            renderer = PDFRenderer()
+            try:
+                renderer.open(pdf_path)
+                before = fitz.Pixmap(renderer.render_page(1))
+                renderer.rotate_page(1, angle)
+                after = fitz.Pixmap(renderer.render_page(1))
+
+                assert (after.width, after.height) == (before.height, before.width)
+            finally:
+                renderer.close()
+
+    @given(
+        num_pages=multi_page_count_strategy,
+        data=st.data(),
+    )
+    @settings(max_examples=20, deadline=None)
+    def test_deletion_shifts_cached_pages(self, num_pages: int, data):
+        """删除页面后，后续页面的渲染结果应与未缓存时一致"""
+        page_idx = data.draw(st.integers(min_value=1, max_value=num_pages))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = Path(temp_dir) / "test.pdf"
+            create_valid_pdf(pdf_path, num_pages=num_pages)
+
+            renderer = PDFRenderer()
+            try:
+                renderer.open(pdf_path)
+                for page_num in range(1, num_pages + 1):
+                    renderer.render_page(page_num)
+
+                renderer.delete_page(page_idx)
+                cached = [
+                    renderer.render_page(page_num)
+                    for page_num in range(1, renderer.total_pages + 1)
+                ]
+
+                renderer._page_cache.clear()
+                renderer._display_lists.clear()
+                fresh = [
+                    renderer.render_page(page_num)
+                    for page_num in range(1, renderer.total_pages + 1)
+                ]
+
+                assert cached == fresh
+            finally:
+                renderer.close()
+
+    @given(
+        num_pages=page_count_strategy,
+        image_format=st.sampled_from(["ppm", "pam"]),
+    )
+    @settings(max_examples=20)
+    def test_raw_formats_match_png(self, num_pages: int, image_format: str):
+        """无压缩格式的渲染结果应与PNG像素一致"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = Path(temp_dir) / "test.pdf"
+            create_valid_pdf(pdf_path, num_pages=num_pages)
+
+            renderer = PDFRenderer()
+            try:
+                renderer.open(pdf_path)
+                png = fitz.Pixmap(renderer.render_page(1))
+                raw = fitz.Pixmap(renderer.render_page(1, image_format=image_format))
+
+                assert (raw.width, raw.height) == (png.width, png.height)
+                assert raw.samples == png.samples
+
+                # 无压缩格式不进入页面图像缓存
+                assert all(key[2] == "png" for key in renderer._page_cache)
+
+                with pytest.raises(DocumentError):
+                    renderer.render_page(1, image_format="bmp")
+            finally:
+                renderer.close()
+
+    @given(num_pages=st.integers(min_value=1, max_value=3))
+    @settings(max_examples=10, deadline=None)
+    def test_raw_pixels_match_png(self, num_pages: int):
+        """未编码像素应与PNG解码后的像素一致"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = Path(temp_dir) / "test.pdf"
+            create_valid_pdf(pdf_path, num_pages=num_pages)
+
+            renderer = PDFRenderer()
+            try:
+                renderer.open(pdf_path)
+                png = fitz.Pixmap(renderer.render_page(num_pages))
+                samples, width, height, stride = renderer.render_page_raw(num_pages)
+
+                assert (width, height) == (png.width, png.height)
+                assert stride == png.stride
+                assert samples == png.samples
+
+                # 接口的默认实现（解码PNG）应与直接取像素的结果一致
+                assert IDocumentRenderer.render_page_raw(renderer, num_pages) == (
+                    samples, width, height, stride
+                )
+            finally:
+                renderer.close()
@@ -169,6 +169,66 @@ class TestTouchTypeClassification:
         assert system.should_reject(event) is True
 
 
+class TestBatchClassification:
+    """
+    批量分类应与逐个分类结果一致
+
+    Feature: huawei-pdf-reader, Property 9: 触摸类型分类
+    Validates: Requirements 4.1, 4.2
+    """
+
+    @given(
+        events=st.lists(
+            touch_event_strategy(touch_type=TouchType.UNKNOWN)
+            | touch_event_strategy(touch_type=TouchType.STYLUS),
+            max_size=50,
+        ),
+        sensitivity=sensitivity_strategy,
+    )
+    @settings(max_examples=100)
+    def test_batch_matches_single(self, events, sensitivity: int):
+        """
+        classify_events 的结果应与对每个事件调用 classify_touch 的结果一致
+
+        Feature: huawei-pdf-reader, Property 9: 触摸类型分类
+        Validates: Requirements 4.1, 4.2
+        """
+        system = PalmRejectionSystem(sensitivity=sensitivity)
+
+        assert system.classify_events(events) == [system.classify_touch(e) for e in events]
+
+
+    @given(
+        events=st.lists(
+            touch_event_strategy(touch_type=TouchType.UNKNOWN)
+            | touch_event_strategy(touch_type=TouchType.STYLUS),
+            max_size=50,
+        ),
+        sensitivity=sensitivity_strategy,
+        hovering=st.booleans(),
+        enabled=st.booleans(),
+    )
+    @settings(max_examples=100)
+    def test_reject_batch_matches_single(self, events, sensitivity: int, hovering: bool, enabled: bool):
+        """
+        reject_batch 的结果应与对每个事件调用 should_reject 的结果一致
+
+        Feature: huawei-pdf-reader, Property 9: 触摸类型分类
+        Validates: Requirements 4.2, 4.5
+        """
+        system = PalmRejectionSystem(sensitivity=sensitivity)
+        system.on_stylus_hover(hovering)
+        system.enable_palm_rejection(enabled)
+
+        rejected = system.reject_batch(
+            [e.size for e in events],
+            [e.pressure for e in events],
+            [e.touch_type == TouchType.STYLUS for e in events],
+        )
+
+        assert [bool(r) for r in rejected] == [system.should_reject(e) for e in events]
+
+
 class TestPalmRejectionSensitivity:
     """
     Property 10: 防误触灵敏度
@@ -14,6 +14,8 @@ Validates: Requirements 7.1, 7.2, 7.3, 7.4, 7.6, 7.7
 """
 
 import json
+import logging
+import shutil
 import sys
 import tempfile
 from datetime import datetime
@@ -425,6 +427,135 @@ class TestPluginLifecycle:
             assert len(installed) == 0
             assert manager.get_plugin(manifest["id"]) is None
 
+    @given(manifest=valid_manifest_strategy())
+    @settings(max_examples=50)
+    def test_zip_plugin_install(self, manifest: dict):
+        """
+        Property 16: 插件生命周期
+
+        zip格式的插件应与目录格式一样安装和启用，重复安装应被拒绝。
+
+        Feature: huawei-pdf-reader, Property 16: 插件生命周期
+        Validates: Requirements 7.2, 7.3
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            plugins_dir = tmpdir_path / "plugins"
+            plugins_dir.mkdir()
+
+            plugin_dir = create_test_plugin_dir(tmpdir_path / "source", manifest)
+            zip_path = Path(shutil.make_archive(str(tmpdir_path / "plugin"), "zip", plugin_dir))
+
+            manager = PluginManager(Database(tmpdir_path / "test.db"), plugins_dir)
+            plugin_info = manager.install_plugin(zip_path)
+            assert plugin_info.id == manifest["id"]
+            assert (plugins_dir / manifest["id"] / manifest["entry_point"]).exists()
+
+            manager.enable_plugin(manifest["id"])
+            assert manager.is_plugin_loaded(manifest["id"]) is True
+            manager.unload_all_plugins()
+
+            with pytest.raises(FileExistsError):
+                manager.install_plugin(zip_path)
+
+    def test_zip_install_syncs_existing_dir(self):
+        """
+        Property 16: 插件生命周期
+
+        安装目录已存在时，未变化的文件不重写，变化的文件更新，多余的文件删除。
+
+        Feature: huawei-pdf-reader, Property 16: 插件生命周期
+        Validates: Requirements 7.2
+        """
+        manifest = {
+            "id": "sync_plugin",
+            "name": "Sync",
+            "version": "1.0.0",
+            "entry_point": "main.py",
+            "permissions": [],
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            plugins_dir = tmpdir_path / "plugins"
+            plugin_dir = create_test_plugin_dir(tmpdir_path / "source", manifest)
+            zip_path = Path(shutil.make_archive(str(tmpdir_path / "plugin"), "zip", plugin_dir))
+
+            # 残留的旧安装目录
+            install_dir = plugins_dir / manifest["id"]
+            shutil.copytree(plugin_dir, install_dir)
+            (install_dir / "plugin.json").write_text("{}", encoding="utf-8")
+            (install_dir / "stale.py").write_text("", encoding="utf-8")
+            unchanged_mtime = (install_dir / "main.py").stat().st_mtime_ns
+
+            manager = PluginManager(Database(tmpdir_path / "test.db"), plugins_dir)
+            manager.install_plugin(zip_path)
+
+            assert (install_dir / "main.py").stat().st_mtime_ns == unchanged_mtime
+            assert json.loads((install_dir / "plugin.json").read_text(encoding="utf-8")) == manifest
+            assert not (install_dir / "stale.py").exists()
+
+    def test_link_install_shares_files(self):
+        """
+        Property 16: 插件生命周期
+
+        启用硬链接安装时，同一文件系统上的目录插件应以硬链接安装并可正常启用。
+
+        Feature: huawei-pdf-reader, Property 16: 插件生命周期
+        Validates: Requirements 7.2
+        """
+        manifest = {
+            "id": "link_plugin",
+            "name": "Link",
+            "version": "1.0.0",
+            "entry_point": "main.py",
+            "permissions": [],
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            plugins_dir = tmpdir_path / "plugins"
+            plugin_dir = create_test_plugin_dir(tmpdir_path / "source", manifest)
+
+            manager = PluginManager(Database(tmpdir_path / "test.db"), plugins_dir, link_install=True)
+            manager.install_plugin(plugin_dir)
+
+            installed = plugins_dir / manifest["id"] / "main.py"
+            assert installed.stat().st_ino == (plugin_dir / "main.py").stat().st_ino
+
+            manager.enable_plugin(manifest["id"])
+            assert manager.is_plugin_loaded(manifest["id"]) is True
+            manager.unload_all_plugins()
+
+    def test_unloaded_plugin_code_keeps_module_globals(self):
+        """
+        Property 16: 插件生命周期
+
+        卸载插件只从sys.modules移除模块，卸载后仍被引用的插件代码应能继续访问模块全局变量。
+
+        Feature: huawei-pdf-reader, Property 16: 插件生命周期
+        Validates: Requirements 7.4
+        """
+        manifest = {
+            "id": "unload_globals_plugin",
+            "name": "Unload Globals",
+            "version": "1.0.0",
+            "entry_point": "main.py",
+            "permissions": [],
+        }
+        module_name = f"plugin_{manifest['id']}"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            plugins_dir = tmpdir_path / "plugins"
+            manager = PluginManager(Database(tmpdir_path / "test.db"), plugins_dir)
+            manager.install_plugin(create_test_plugin_dir(tmpdir_path / "source", manifest))
+
+            manager.enable_plugin(manifest["id"])
+            plugin_class = sys.modules[module_name].TestPlugin
+            manager.disable_plugin(manifest["id"])
+
+            assert module_name not in sys.modules
+            # 构造函数引用模块全局的PluginInfo和datetime
+            assert plugin_class().info.id == manifest["id"]
+
 
 # ============== Property 17: 插件错误隔离 ==============
 
@@ -488,6 +619,48 @@ class TestPluginErrorIsolation:
             error = manager.get_plugin_error(manifest["id"])
             assert error is not None
 
+    def test_reinstall_after_failed_load_uses_new_code(self):
+        """
+        Property 17: 插件错误隔离
+        
+        加载失败的插件不应留下已导入的模块：卸载后以同一ID安装修复后的版本，
+        启用时应执行新版本的代码。
+        
+        Feature: huawei-pdf-reader, Property 17: 插件错误隔离
+        Validates: Requirements 7.6
+        """
+        manifest = {
+            "id": "reinstall_after_error",
+            "name": "Reinstall Plugin",
+            "version": "1.0.0",
+            "entry_point": "main.py",
+            "permissions": [],
+        }
+        module_name = f"plugin_{manifest['id']}"
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            plugins_dir = tmpdir_path / "plugins"
+            plugins_dir.mkdir()
+            manager = PluginManager(Database(tmpdir_path / "test.db"), plugins_dir)
+            
+            try:
+                manager.install_plugin(create_error_plugin_dir(tmpdir_path / "v1", manifest))
+                with pytest.raises(ValueError):
+                    manager.enable_plugin(manifest["id"])
+                assert module_name not in sys.modules
+                
+                manager.uninstall_plugin(manifest["id"])
+                fixed = dict(manifest, version="2.0.0")
+                manager.install_plugin(create_test_plugin_dir(tmpdir_path / "v2", fixed))
+                manager.enable_plugin(manifest["id"])
+                
+                assert manager.is_plugin_loaded(manifest["id"]) is True
+                assert manager.get_plugin_error(manifest["id"]) is None
+            finally:
+                manager.unload_all_plugins()
+                sys.modules.pop(module_name, None)
+
     def test_sandbox_execute_safely_catches_exceptions(self):
         """
         Property 17: 插件错误隔离
@@ -517,6 +690,11 @@ class TestPluginErrorIsolation:
         assert sandbox.error_count == 1
         assert sandbox.last_error is not None
 
+        # 完整堆栈按需格式化
+        assert "Traceback" not in sandbox.last_error
+        assert "error_func" in sandbox.formatted_traceback
+        assert sandbox.get_error_summary()["traceback"] == sandbox.formatted_traceback
+
     @given(error_count=st.integers(min_value=0, max_value=10))
     @settings(max_examples=100)
     def test_sandbox_should_disable_after_max_errors(self, error_count: int):
@@ -604,6 +782,57 @@ class TestPluginAutoLoad:
             # 验证插件已加载
             assert manager2.is_plugin_loaded(manifest["id"]) is True
 
+    def test_multiple_plugins_auto_load_with_failures(self):
+        """
+        Property 18: 插件自动加载
+
+        多个插件并行导入时，正常插件应加载成功，出错的插件应报告错误并被禁用。
+
+        Feature: huawei-pdf-reader, Property 18: 插件自动加载
+        Validates: Requirements 7.7
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            plugins_dir = tmpdir_path / "plugins"
+            plugins_dir.mkdir()
+            db = Database(tmpdir_path / "test.db")
+            manager1 = PluginManager(db, plugins_dir)
+
+            def manifest_for(plugin_id: str) -> dict:
+                return {
+                    "id": plugin_id,
+                    "name": plugin_id,
+                    "version": "1.0.0",
+                    "entry_point": "main.py",
+                    "permissions": [],
+                }
+
+            good_ids = [f"autoload_good_{i}" for i in range(3)]
+            for plugin_id in good_ids:
+                manager1.install_plugin(create_test_plugin_dir(tmpdir_path / "source", manifest_for(plugin_id)))
+            manager1.install_plugin(create_error_plugin_dir(tmpdir_path / "source", manifest_for("autoload_on_load_error")))
+            broken_dir = create_test_plugin_dir(tmpdir_path / "source", manifest_for("autoload_syntax_error"))
+            manager1.install_plugin(broken_dir)
+            (plugins_dir / "autoload_syntax_error" / "main.py").write_text("def broken(:\n", encoding="utf-8")
+
+            for plugin in manager1.get_installed_plugins():
+                db.update_plugin_status(plugin.id, True)
+
+            manager2 = PluginManager(db, plugins_dir)
+            try:
+                results = manager2.load_enabled_plugins()
+
+                for plugin_id in good_ids:
+                    assert results[plugin_id] is None
+                    assert manager2.is_plugin_loaded(plugin_id) is True
+                for plugin_id in ("autoload_on_load_error", "autoload_syntax_error"):
+                    assert results[plugin_id] is not None
+                    assert manager2.get_plugin(plugin_id).enabled is False
+                assert "plugin_autoload_syntax_error" not in sys.modules
+            finally:
+                manager2.unload_all_plugins()
+                sys.modules.pop("plugin_autoload_on_load_error", None)
+
 
 # ============== PluginAPI 测试 ==============
 
@@ -662,6 +891,71 @@ class TestPluginAPI:
         api.cleanup()
         
         # 验证已清理
-        assert api.get_callbacks("event1") == []
+        assert api.get_callbacks("event1") == ()
         assert api.get_data("key1") is None
         assert api.get_logs() == []
+
+    def test_api_logs(self, caplog):
+        """测试日志记录：记录全部级别并转发到logging，停用后不再记录"""
+        api = PluginAPI("test_plugin", [])
+        
+        with caplog.at_level(logging.DEBUG, logger="huawei_pdf_reader.plugin"):
+            api.log("quiet message")
+            api.log("loud message", level="error")
+        
+        logs = api.get_logs()
+        assert [entry["level"] for entry in logs] == ["INFO", "ERROR"]
+        assert logs[0]["plugin_id"] == "test_plugin"
+        assert logs[0]["message"] == "quiet message"
+        assert datetime.fromisoformat(logs[0]["timestamp"]) <= datetime.now()
+        assert [(r.levelno, r.getMessage()) for r in caplog.records] == [
+            (logging.INFO, "[Plugin:test_plugin] quiet message"),
+            (logging.ERROR, "[Plugin:test_plugin] loud message"),
+        ]
+        
+        api.set_log_enabled(False)
+        api.log("dropped message")
+        assert len(api.get_logs()) == 2
+
+    def test_api_logs_bounded(self):
+        """测试日志条数上限：超出后丢弃最旧的条目"""
+        api = PluginAPI("test_plugin", [], max_logs=3)
+        
+        for i in range(5):
+            api.log(f"message {i}", level="debug")
+        
+        assert [entry["message"] for entry in api.get_logs()] == [
+            "message 2", "message 3", "message 4",
+        ]
+
+
+class TestPluginClassLookup:
+    """插件类查找测试"""
+
+    def test_declared_plugin_class_is_used(self):
+        """入口模块声明PLUGIN_CLASS时应使用该类，而不是扫描到的第一个IPlugin子类"""
+        manifest = {
+            "id": "declared_class_plugin",
+            "name": "Declared",
+            "version": "1.0.0",
+            "entry_point": "main.py",
+            "permissions": [],
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            plugin_dir = create_test_plugin_dir(tmpdir_path / "source", manifest)
+            entry_point = plugin_dir / "main.py"
+            entry_point.write_text(
+                entry_point.read_text(encoding="utf-8")
+                + "\n\nclass DeclaredPlugin(TestPlugin):\n    pass\n\n\nPLUGIN_CLASS = DeclaredPlugin\n",
+                encoding="utf-8",
+            )
+
+            manager = PluginManager(Database(tmpdir_path / "test.db"), tmpdir_path / "plugins")
+            manager.install_plugin(plugin_dir)
+            manager.enable_plugin(manifest["id"])
+            try:
+                instance = manager.get_sandbox(manifest["id"]).plugin_instance
+                assert type(instance).__name__ == "DeclaredPlugin"
+            finally:
+                manager.unload_all_plugins()